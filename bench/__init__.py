@@ -0,0 +1,4 @@
+'''
+This package contains the benchmarks for the pydelivery package, each module can be
+run from the top of the repository with 'python -m bench.<module>'.
+'''
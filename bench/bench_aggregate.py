@@ -0,0 +1,53 @@
+'''
+This benchmark measures the depot totals of 16 round files, each of 5 rounds of 2,000
+houses, loaded and counted in this process and by pools of processes, along with the
+totals of 20 of the rounds once loaded, comparing counting them in this process with
+sending them to a pool of processes, which is why rounds are not sent to the workers.
+'''
+
+import os
+import tempfile
+from random import Random
+from timeit import timeit
+from pydelivery.parser.parseround import load_round
+from pydelivery.parser.aggregate import depot_totals, _round_partial
+from pydelivery.parser.parseround import _map_rounds
+
+_titles = ('Sun', 'Mail', 'Times', 'Telegraph', 'Express', 'Mirror', 'Star', 'I', 'Standard')
+_dayseqs = ('1234567', '123456', '7', '6', '5', '12345')
+
+def write_files(path, files=16, rounds=5, size=2000, seed=1):
+  '''Write FILES round files into PATH, returning their names'''
+  rand = Random(seed)
+  names = list()
+  for num in range(files):
+    lines = list()
+    for number in range(1, rounds + 1):
+      lines.append('Round{:02} = RoundInfo({}, "Round{}", houses = ['.format(number, number, number))
+      for house in range(1, size + 1):
+        papers = ', '.join('PaperInfo("{}", "{}")'.format(title, rand.choice(_dayseqs))
+                           for title in rand.sample(_titles, rand.randint(1, 3)))
+        lines.append('  HouseInfo({}, "Road{}", [{}]),'.format(house, rand.randrange(150), papers))
+      lines.append('])')
+    name = os.path.join(path, 'round{:02}.inp'.format(num))
+    with open(name, 'wt') as fd:
+      fd.write('\n'.join(lines))
+    names.append(name)
+  return names
+
+def main():
+  with tempfile.TemporaryDirectory() as path:
+    names = write_files(path)
+    serial = timeit(lambda: depot_totals(names, max_workers=1), number=1)
+    print('16 files:  {:8.2f} ms in this process'.format(serial * 1000))
+    for workers in (2, 4):
+      pool = timeit(lambda: depot_totals(names, max_workers=workers), number=1)
+      print('16 files:  {:8.2f} ms with {} workers'.format(pool * 1000, workers))
+    rounds = [roundinfo for name in names[:4] for roundinfo in load_round(name).values()]
+    serial = timeit(lambda: depot_totals(rounds, max_workers=1), number=1)
+    pool = timeit(lambda: _map_rounds(_round_partial, rounds, max_workers=4), number=1)
+    print('20 rounds: {:8.2f} ms in this process, {:8.2f} ms sent to 4 workers'.format(
+          serial * 1000, pool * 1000))
+
+if __name__ == '__main__':
+  main()
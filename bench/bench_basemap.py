@@ -0,0 +1,42 @@
+'''
+This benchmark measures resolving every key of a large mapping to its position, and
+every position back to its key, as done when generating the SQL for a large book, along
+with finding a position after each of a run of removals.
+'''
+
+from timeit import timeit
+from pydelivery.parser.parseround import _BaseMap
+
+def build(size, removed=0):
+  '''Build a mapping of SIZE keys, with every other key of the first REMOVED removed'''
+  bm = _BaseMap()
+  for num in range(size):
+    bm['Road{}'.format(num)] = num
+  for num in range(0, removed, 2):
+    bm._remove('Road{}'.format(num))
+  return bm
+
+def lookups(bm):
+  for num, key in bm.numeric_iter():
+    if bm._index(key) != num or bm[num] != key:
+      raise AssertionError('Mismatched position for {}'.format(key))
+
+def removals(bm, size, count):
+  '''Remove COUNT keys in turn from BM of SIZE keys, finding the position of the last
+     key after each'''
+  last = 'Road{}'.format(size - 1)
+  for num in range(1, 2 * count, 2):
+    bm._remove('Road{}'.format(num))
+    bm._index(last)
+
+def main():
+  for size in (1000, 10000, 40000):
+    bm = build(size, removed=size // 10)
+    secs = timeit(lambda: lookups(bm), number=1)
+    print('{:>6} keys: {:8.2f} ms for index and positional lookup of every key'.format(size, secs * 1000))
+  bm = build(100000)
+  secs = timeit(lambda: removals(bm, 100000, 1000), number=1)
+  print('100000 keys: {:8.2f} ms for 1000 removals each followed by a lookup'.format(secs * 1000))
+
+if __name__ == '__main__':
+  main()
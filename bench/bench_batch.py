@@ -0,0 +1,24 @@
+'''
+This benchmark measures checking for and removing 500 cancelled entries at once from
+lists of 100,000 elements, for an OrderList, which uses hashing of the elements, and a
+HouseList, which also has its index.
+'''
+
+from random import Random
+from timeit import timeit
+from pydelivery.parser.parseround import HouseList, HouseInfo, OrderList, OrderInfo, HasStandard
+
+def main(size=100000, cancelled=500):
+  rand = Random(1)
+  houses = [HouseInfo(num, 'Road{}'.format(num % 97), HasStandard) for num in range(1, size + 1)]
+  orders = [OrderInfo(num, 'Road{}'.format(num % 97)) for num in range(1, size + 1)]
+  for label, cls, elems in (('OrderList', OrderList, orders), ('HouseList', HouseList, houses)):
+    drop = rand.sample(elems, cancelled)
+    full = cls(elems)
+    contains = timeit(lambda: drop in full, number=3) / 3
+    remove = timeit(lambda: cls(elems).remove(drop), number=3) / 3 - timeit(lambda: cls(elems), number=3) / 3
+    print('{}: {:8.2f} ms to check, {:8.2f} ms to remove {} of {} elements'.format(
+          label, contains * 1000, remove * 1000, cancelled, size))
+
+if __name__ == '__main__':
+  main()
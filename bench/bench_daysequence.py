@@ -0,0 +1,23 @@
+'''
+This benchmark measures creating the day sequences of a large book, where a handful
+of day strings are repeated many times, with and without the parse cache.
+'''
+
+from random import Random
+from timeit import timeit
+from pydelivery.parser.parseround import DaySequence, _parse_dayseq
+
+_dayseqs = ('1234567', '123456', '7', '6', '5', '12345')
+
+def main():
+  rand = Random(1)
+  book = [rand.choice(_dayseqs) for _ in range(100000)]
+  DaySequence.parse_cache_clear()
+  cached = timeit(lambda: [DaySequence._parse_mask(days) for days in book], number=1)
+  uncached = timeit(lambda: [_parse_dayseq(days) for days in book], number=1)
+  print('{} day sequences: {:7.2f} ms cached, {:7.2f} ms parsing every time'.format(
+        len(book), cached * 1000, uncached * 1000))
+  print(DaySequence.parse_cache_info())
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,37 @@
+'''
+This benchmark measures calculating the title demand matrix over a synthetic depot of
+50 rounds, each of 5,000 houses.
+'''
+
+from random import Random
+from timeit import timeit
+from pydelivery.parser.parseround import RoundInfo, HouseInfo, PaperInfo, MagazineInfo
+from pydelivery.parser.demand import title_demand
+
+_titles = ('Sun', 'Mail', 'Times', 'Telegraph', 'Express', 'Mirror', 'Star', 'I', 'Standard')
+_dayseqs = ('1234567', '123456', '7', '6', '5', '12345')
+
+def synthetic_rounds(rounds=50, houses=5000, seed=1):
+  '''Return a list of rounds holding randomly chosen titles for each house'''
+  rand = Random(seed)
+  result = list()
+  for num in range(rounds):
+    hl = list()
+    for house in range(1, houses + 1):
+      titles = [PaperInfo(title, rand.choice(_dayseqs), num_copies=rand.choice((1, 1, 1, 2)))
+                for title in rand.sample(_titles, rand.randint(1, 3))]
+      if rand.random() < 0.1:
+        titles.append(MagazineInfo('Radio Times', '2'))
+      hl.append(HouseInfo(house, 'Road{}'.format(house % 97), titles))
+    result.append(RoundInfo(num % 6, 'Round{}'.format(num), hl))
+  return result
+
+def main():
+  rounds = synthetic_rounds()
+  secs = timeit(lambda: title_demand(rounds), number=5) / 5
+  demand = title_demand(rounds)
+  print('{} rounds, {} houses: {:7.2f} ms per demand matrix of {} titles'.format(
+        len(rounds), sum(len(ri._houses) for ri in rounds), secs * 1000, len(demand.titles)))
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,40 @@
+'''
+This benchmark measures comparing 200 reloaded rounds of 2,000 houses against those of
+the previous run, one round in ten having changed, both with __eq__ and by comparing the
+fingerprints, which are kept for the previous rounds.
+'''
+
+from timeit import timeit
+from pydelivery.parser.parseround import RoundInfo, HouseInfo, OrderInfo, PaperInfo
+
+def load(rounds=200, houses=2000, changed=()):
+  '''Return the synthetic rounds, with an extra house in each of the CHANGED rounds'''
+  result = list()
+  for num in range(rounds):
+    hl = [HouseInfo(house, 'Road{}'.format(house % 53), PaperInfo('Sun', '123456'))
+          for house in range(1, houses + 1)]
+    if num in changed:
+      hl[houses // 2] = HouseInfo(houses + 1, 'Road0', PaperInfo('Sun'))
+    order = [OrderInfo(house._house, house._road) for house in reversed(hl)]
+    result.append(RoundInfo(num % 6, 'Round{}'.format(num), hl, order))
+  return result
+
+def main():
+  previous = load()
+  if hasattr(RoundInfo, 'fingerprint'):
+    for ri in previous:
+      ri.fingerprint()
+  current = load(changed=range(0, 200, 10))
+  secs = timeit(lambda: [old == new for old, new in zip(previous, current)], number=1)
+  again = timeit(lambda: [old == new for old, new in zip(previous, current)], number=1)
+  print('200 rounds: {:8.2f} ms with __eq__, {:8.2f} ms repeated'.format(secs * 1000, again * 1000))
+  if hasattr(RoundInfo, 'fingerprint'):
+    current = load(changed=range(0, 200, 10))
+    secs = timeit(lambda: [old.fingerprint() == new.fingerprint()
+                           for old, new in zip(previous, current)], number=1)
+    again = timeit(lambda: [old == new for old, new in zip(previous, current)], number=1)
+    print('200 rounds: {:8.2f} ms comparing fingerprints, {:8.2f} ms with __eq__ after'.format(
+          secs * 1000, again * 1000))
+
+if __name__ == '__main__':
+  main()
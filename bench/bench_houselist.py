@@ -0,0 +1,27 @@
+'''
+This benchmark measures building a round one house at a time with RoundInfo.add_house,
+which checks each house is not already present, and finding each house in the round,
+for rounds of increasing size.
+'''
+
+from timeit import timeit
+from pydelivery.parser.parseround import RoundInfo, HouseInfo, HasStandard
+
+def build(houses):
+  '''Return a round built by adding each of the HOUSES in turn'''
+  ri = RoundInfo(1, 'Round1')
+  for house in houses:
+    ri.add_house(house)
+  return ri
+
+def main():
+  for size in (1000, 10000, 50000):
+    houses = [HouseInfo(num, 'Road{}'.format(num % 97), HasStandard) for num in range(1, size + 1)]
+    secs = timeit(lambda: build(houses), number=3) / 3
+    ri = build(houses)
+    find = timeit(lambda: [ri._houses[house] for house in houses], number=3) / 3
+    print('{:6} houses: {:8.2f} ms to build, {:8.2f} ms to find every house'.format(
+          size, secs * 1000, find * 1000))
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,38 @@
+'''
+This benchmark measures the time taken to import the pydelivery.parser package in a
+fresh interpreter, checking that the headless path does not import PySide2.
+'''
+
+import os
+import subprocess
+import sys
+
+_code = '''
+import sys, time
+start = time.perf_counter()
+import pydelivery.parser
+print(time.perf_counter() - start, 'PySide2' in sys.modules)
+'''
+
+def measure(backend, runs=10):
+  '''Return the fastest import time and whether PySide2 was imported'''
+  env = dict(os.environ, PYDELIVERY_DAYOFWEEK=backend)
+  times, qt = list(), False
+  for _ in range(runs):
+    out = subprocess.run([sys.executable, '-c', _code], env=env, check=True,
+                         capture_output=True, text=True).stdout.split()
+    times.append(float(out[0]))
+    qt = out[1] == 'True'
+  return min(times), qt
+
+def main():
+  for backend in ('enum', 'qt'):
+    try:
+      secs, qt = measure(backend)
+    except subprocess.CalledProcessError:
+      print('{:>5} backend: unavailable'.format(backend))
+      continue
+    print('{:>5} backend: {:7.2f} ms to import, PySide2 imported: {}'.format(backend, secs * 1000, qt))
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,50 @@
+'''
+This benchmark measures applying a batch of new starts to a round of 3,000 stops, each
+placed after a randomly chosen stop of the order, comparing inserting into the order
+list after a search for the chosen stop against the blocks used by add_house, along
+with placing each new start next to the nearest house in the same road.
+'''
+
+from random import Random
+from timeit import timeit
+from pydelivery.parser.parseround import RoundInfo, HouseInfo, OrderInfo, OrderList, HasStandard
+
+def synthetic_round(size, seed=1):
+  '''Return a round of SIZE houses with an order visiting them in a random order'''
+  houses = [HouseInfo(num, 'Road{}'.format(num % 97), HasStandard) for num in range(1, size + 1)]
+  order = [OrderInfo(house._house, house._road) for house in houses]
+  Random(seed).shuffle(order)
+  return RoundInfo(1, 'Round1', houses, order)
+
+def new_starts(ri, count, seed=2):
+  '''Return COUNT new houses, each with a randomly chosen stop of the round to follow'''
+  rand = Random(seed)
+  order = list(ri._order)
+  return [(HouseInfo(num, 'Road{}'.format(num % 97), HasStandard), rand.choice(order))
+          for num in range(100001, 100001 + count)]
+
+def list_insert(ri, starts):
+  '''Insert each new start into a copy of the order list after a search for its stop'''
+  order = OrderList(ri._order)
+  for house, anchor in starts:
+    order.insert(order.index(anchor) + 1, OrderInfo(house._house, house._road))
+  return order
+
+def main():
+  for count in (300, 3000):
+    starts = new_starts(synthetic_round(3000), count)
+    search = timeit(lambda: list_insert(synthetic_round(3000), starts), number=3) / 3
+    def apply(nearest=False):
+      ri = synthetic_round(3000)
+      for house, anchor in starts:
+        ri.add_house(house, None if nearest else anchor)
+      return len(ri._order)
+    blocks = timeit(apply, number=3) / 3
+    nearest = timeit(lambda: apply(nearest=True), number=3) / 3
+    build = timeit(lambda: synthetic_round(3000), number=3) / 3
+    print('{:5} new starts on 3000 stops: {:8.2f} ms list search and insert, {:8.2f} ms '
+          'add_house after stop, {:8.2f} ms add_house nearest road'.format(
+          count, (search - build) * 1000, (blocks - build) * 1000, (nearest - build) * 1000))
+
+if __name__ == '__main__':
+  main()
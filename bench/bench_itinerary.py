@@ -0,0 +1,48 @@
+'''
+This benchmark measures writing the weekly itinerary of a book of 10 rounds of 5,000
+houses to a file through each of the sinks, reporting the time taken and the peak
+memory traced, against building the text itinerary as a single string before writing
+it.
+'''
+
+import os
+import tempfile
+import tracemalloc
+from time import perf_counter
+from pydelivery.parser.itinerary import TextSink, CSVSink, HTMLSink, itinerary, write_itinerary
+from bench.bench_manifest import synthetic_book
+
+def single_string(book, name):
+  '''Write the itinerary after building it as a single string'''
+  lines = list()
+  for day, entry in itinerary(book):
+    lines.append('{:5}  {:<30} {}\n'.format(entry.position, '{}, {}'.format(entry.house, entry.road),
+                                            ', '.join(title for title, _ in entry.titles)))
+  text = ''.join(lines)
+  with open(name, 'wt') as fd:
+    fd.write(text)
+
+def measure(func):
+  '''Return the seconds taken by FUNC, and the peak MiB traced while calling it again'''
+  start = perf_counter()
+  func()
+  taken = perf_counter() - start
+  tracemalloc.start()
+  func()
+  peak = tracemalloc.get_traced_memory()[1]
+  tracemalloc.stop()
+  return taken, peak / (1 << 20)
+
+def main():
+  book = synthetic_book()
+  with tempfile.TemporaryDirectory() as path:
+    name = os.path.join(path, 'itinerary')
+    taken, peak = measure(lambda: single_string(book, name))
+    print('single string: {:8.2f} s, {:8.2f} MiB peak'.format(taken, peak))
+    for sink in (TextSink, CSVSink, HTMLSink):
+      taken, peak = measure(lambda: write_itinerary(book, sink(name)))
+      print('{:13}: {:8.2f} s, {:8.2f} MiB peak, {:6.1f} MiB written'.format(
+            sink.__name__, taken, peak, os.path.getsize(name) / (1 << 20)))
+
+if __name__ == '__main__':
+  main()
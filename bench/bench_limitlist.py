@@ -0,0 +1,25 @@
+'''
+This benchmark measures constructing a HouseList of 10,000 and 100,000 houses from a
+flat list, from a nested list which takes the flattening path, and with the trusted
+bulk append used by the builders within the package. An OrderList of the same size,
+which keeps no index, shows the cost of the validation alone.
+'''
+
+from timeit import timeit
+from pydelivery.parser.parseround import HouseList, HouseInfo, OrderList, OrderInfo, HasStandard
+
+def main():
+  for size in (10000, 100000):
+    houses = [HouseInfo(num, 'Road{}'.format(num % 97), HasStandard) for num in range(1, size + 1)]
+    nested = [houses[num:num + 100] for num in range(0, size, 100)]
+    orders = [OrderInfo(num, 'Road{}'.format(num % 97)) for num in range(1, size + 1)]
+    for label, func in (('flat', lambda: HouseList(houses)),
+                        ('nested', lambda: HouseList(nested)),
+                        ('trusted', lambda: HouseList._trusted(houses)),
+                        ('OrderList flat', lambda: OrderList(orders)),
+                        ('OrderList trusted', lambda: OrderList._trusted(orders))):
+      secs = timeit(func, number=5) / 5
+      print('{:6} elements: {:8.2f} ms {}'.format(size, secs * 1000, label))
+
+if __name__ == '__main__':
+  main()
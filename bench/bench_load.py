@@ -0,0 +1,64 @@
+'''
+This benchmark measures loading round files of 5 rounds of 2,000 and 10,000 houses, each
+with an order, comparing running the file with exec, as load_round did previously, with
+parsing the file into an ast and making its calls through the trusted constructors, as
+load_round does now. Compiling and parsing the file alone are also timed.
+'''
+
+import ast
+import os
+import tempfile
+from random import Random
+from timeit import timeit
+from pydelivery.parser.parseround import load_round, _Round_locals, _round_dict
+
+_titles = ('Sun', 'Mail', 'Times', 'Telegraph', 'Express', 'Mirror', 'Star', 'I', 'Standard')
+_dayseqs = ('1234567', '123456', '7', '6', '5', '12345')
+
+def _exec_round(name):
+  '''Load the round file NAME by running it with the objects of _Round_locals, without
+     checking it, as load_round did previously'''
+  with open(name, 'rt') as fd:
+    code = fd.read()
+  round_dict = _Round_locals.copy()
+  exec(code, {}, round_dict)
+  return _round_dict(round_dict)
+
+def write_book(name, rounds=5, size=2000, seed=1):
+  '''Write a round file NAME of ROUNDS rounds of SIZE houses, each with a shuffled order'''
+  rand = Random(seed)
+  lines = list()
+  for number in range(1, rounds + 1):
+    lines.append('Round{:02} = RoundInfo({}, "Round{}", houses = ['.format(number, number, number))
+    stops = list()
+    for house in range(1, size + 1):
+      road = 'Road{}'.format(rand.randrange(150))
+      papers = ', '.join('PaperInfo("{}", "{}")'.format(title, rand.choice(_dayseqs))
+                         for title in rand.sample(_titles, rand.randint(1, 3)))
+      lines.append('  HouseInfo({}, "{}", [{}]),'.format(house, road, papers))
+      stops.append('  OrderInfo({}, "{}"),'.format(house, road))
+    rand.shuffle(stops)
+    lines.append('], order = [')
+    lines.extend(stops)
+    lines.append('])')
+  with open(name, 'wt') as fd:
+    fd.write('\n'.join(lines))
+
+def main():
+  with tempfile.TemporaryDirectory() as path:
+    for size in (2000, 10000):
+      name = os.path.join(path, 'round{}.inp'.format(size))
+      write_book(name, size=size)
+      with open(name, 'rt') as fd:
+        text = fd.read()
+      assert load_round(name) == _exec_round(name)
+      exec_time = timeit(lambda: _exec_round(name), number=3) / 3
+      load_time = timeit(lambda: load_round(name), number=3) / 3
+      compile_time = timeit(lambda: compile(text, name, 'exec'), number=3) / 3
+      parse_time = timeit(lambda: ast.parse(text, name), number=3) / 3
+      print('{:6} houses: exec {:8.2f} ms, ast walk {:8.2f} ms, compile {:8.2f} ms, '
+            'ast.parse {:8.2f} ms'.format(size * 5, exec_time * 1000, load_time * 1000,
+                                          compile_time * 1000, parse_time * 1000))
+
+if __name__ == '__main__':
+  main()
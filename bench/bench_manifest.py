@@ -0,0 +1,69 @@
+'''
+This benchmark measures building the delivery manifest of a single day for a book of
+10 rounds of 5,000 houses, comparing nested loops over the order, titles and the days of
+each title against the manifest generator, along with the peak memory of streaming the
+manifest in chunks against building it as a single list.
+'''
+
+import tracemalloc
+from random import Random
+from timeit import timeit
+from pydelivery.parser.parseround import RoundInfo, HouseInfo, PaperInfo, OrderInfo
+from pydelivery.parser.manifest import manifest, manifest_chunks
+
+_titles = ('Sun', 'Mail', 'Times', 'Telegraph', 'Express', 'Mirror', 'Star', 'I', 'Standard')
+_dayseqs = ('1234567', '123456', '7', '6', '5', '12345')
+
+def synthetic_book(rounds=10, size=5000, seed=1):
+  '''Return a dictionary of ROUNDS rounds, each of SIZE houses in a shuffled order'''
+  rand = Random(seed)
+  book = dict()
+  for number in range(1, rounds + 1):
+    houses = [HouseInfo(num, 'Road{}'.format(num % 97),
+                        [PaperInfo(title, rand.choice(_dayseqs))
+                         for title in rand.sample(_titles, rand.randint(1, 3))],
+                        use_box='67' if rand.random() < 0.05 else None)
+              for num in range(1, size + 1)]
+    order = [OrderInfo(house._house, house._road) for house in houses]
+    rand.shuffle(order)
+    book[number] = RoundInfo(number % 5 + 1, 'Round{}'.format(number), houses, order)
+  return book
+
+def nested_loops(book, day):
+  '''Return the manifest rows by looping over the order, titles and days of each title'''
+  rows = list()
+  for roundinfo in book.values():
+    houses = {(house._house, house._road): house for house in roundinfo.house_iter()}
+    for position, stop in enumerate(roundinfo, 1):
+      house = houses[(stop._house, stop._road)]
+      titles = list()
+      for paper in house.title_iter():
+        for curday in paper.days:
+          if str(curday) == day:
+            titles.append((paper._title, paper.num_copies))
+      if titles:
+        rows.append((roundinfo._number, position, house._house, house._road, tuple(titles),
+                     house.flags(day)))
+  return rows
+
+def peak(func):
+  '''Return the peak memory, in MiB, traced while calling FUNC'''
+  tracemalloc.start()
+  func()
+  result = tracemalloc.get_traced_memory()[1]
+  tracemalloc.stop()
+  return result / (1 << 20)
+
+def main():
+  book = synthetic_book()
+  list(manifest(book, '6'))
+  loops = timeit(lambda: nested_loops(book, '6'), number=3) / 3
+  stream = timeit(lambda: list(manifest(book, '6')), number=3) / 3
+  print('50000 houses: {:8.2f} ms nested loops, {:8.2f} ms manifest'.format(loops * 1000, stream * 1000))
+  whole = peak(lambda: list(manifest(book, '6')))
+  chunks = peak(lambda: [len(chunk) for chunk in manifest_chunks(book, '6', size=1000)])
+  print('50000 houses: {:8.2f} MiB peak as a list, {:8.2f} MiB peak in chunks of 1000'.format(
+        whole, chunks))
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,73 @@
+'''
+This benchmark measures the memory held by a synthetic book of 100,000 houses, reporting
+the bytes per house for the working tree and for an earlier revision, which is checked
+out into a temporary worktree so that both are measured in a fresh interpreter.
+
+  python -m bench.bench_memory --before REV [--houses N]
+
+The revision is required, as the change being measured is rarely the last commit.
+'''
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+_code = '''
+import sys, tracemalloc
+sys.path.insert(0, sys.argv[1])
+from random import Random
+from pydelivery.parser.parseround import RoundInfo, HouseInfo, PaperInfo, MagazineInfo
+
+titles = ('Sun', 'Mail', 'Times', 'Telegraph', 'Express', 'Mirror', 'Star', 'I', 'Standard')
+dayseqs = ('1234567', '123456', '7', '6', '5', '12345')
+houses = int(sys.argv[2])
+rand = Random(1)
+
+tracemalloc.start()
+book = list()
+for house in range(1, houses + 1):
+  papers = [PaperInfo(title, rand.choice(dayseqs)) for title in rand.sample(titles, rand.randint(1, 3))]
+  if rand.random() < 0.1:
+    papers.append(MagazineInfo('Radio Times', '2'))
+  book.append(HouseInfo(house, 'Road{}'.format(house % 997), papers,
+                        use_box='67' if rand.random() < 0.05 else None))
+current = tracemalloc.get_traced_memory()[0]
+print(current / houses)
+'''
+
+def measure(path, houses):
+  '''Return the bytes per house held by the book built with the tree at PATH'''
+  out = subprocess.run([sys.executable, '-c', _code, path, str(houses)], check=True,
+                       capture_output=True, text=True).stdout
+  return float(out)
+
+def measure_rev(rev, houses):
+  '''Return the bytes per house held by the book built with the given git revision'''
+  root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+  with tempfile.TemporaryDirectory() as tmp:
+    path = os.path.join(tmp, 'tree')
+    subprocess.run(['git', '-C', root, 'worktree', 'add', '--detach', path, rev],
+                   check=True, capture_output=True)
+    try:
+      return measure(path, houses)
+    finally:
+      subprocess.run(['git', '-C', root, 'worktree', 'remove', '--force', path],
+                     check=True, capture_output=True)
+
+def main():
+  parser = argparse.ArgumentParser(description='Measure the memory held per house')
+  parser.add_argument('--before', required=True, help='revision to compare against')
+  parser.add_argument('--houses', type=int, default=100000, help='number of houses in the book')
+  args = parser.parse_args()
+
+  root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+  before = measure_rev(args.before, args.houses)
+  after = measure(root, args.houses)
+  print('{} houses: {:8.1f} bytes per house at {}'.format(args.houses, before, args.before))
+  print('{} houses: {:8.1f} bytes per house in working tree ({:+.1f}%)'.format(
+        args.houses, after, (after - before) * 100 / before))
+
+if __name__ == '__main__':
+  main()
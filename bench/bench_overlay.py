@@ -0,0 +1,84 @@
+'''
+This benchmark measures previewing a week of holidays for 50 houses of a round of 5,000
+houses, reading the totals and delivery order of the result and then discarding it,
+comparing a deep copy of the round against a RoundOverlay, along with committing the
+overlay against applying the same changes to the round one at a time.
+'''
+
+from copy import deepcopy
+from random import Random
+from timeit import timeit
+from pydelivery.parser.parseround import RoundInfo, HouseInfo, PaperInfo, OrderInfo
+from pydelivery.parser.overlay import RoundOverlay
+
+_titles = ('Sun', 'Mail', 'Times', 'Telegraph', 'Express', 'Mirror', 'Star', 'I', 'Standard')
+_dayseqs = ('1234567', '123456', '7', '6', '5', '12345')
+
+def synthetic_round(size=5000, seed=1):
+  '''Return a round of SIZE houses with an order visiting them in a random order'''
+  rand = Random(seed)
+  houses = [HouseInfo(num, 'Road{}'.format(num % 97),
+                      [PaperInfo(title, rand.choice(_dayseqs))
+                       for title in rand.sample(_titles, rand.randint(1, 3))])
+            for num in range(1, size + 1)]
+  order = [OrderInfo(house._house, house._road) for house in houses]
+  rand.shuffle(order)
+  ri = RoundInfo(1, 'Round1', houses, order)
+  ri.totals()
+  list(ri.route_iter())
+  return ri
+
+def holidays(ri, count=50, seed=2):
+  '''Return COUNT houses of the round chosen at random'''
+  return Random(seed).sample(list(ri.house_iter()), count)
+
+def with_copy(ri, away):
+  '''Preview the holidays on a deep copy of the round'''
+  preview = deepcopy(ri)
+  for house in away:
+    house = preview._houses[house]
+    for paper in list(house._titles):
+      house.remove_days(paper._title, '1234567')
+  return preview.totals()['Sun'], len(list(preview.route_iter()))
+
+def with_overlay(ri, away):
+  '''Preview the holidays with an overlay of the round'''
+  preview = RoundOverlay(ri)
+  for house in away:
+    preview.suspend(house, '1234567')
+  return preview.totals()['Sun'], len(list(preview.route_iter()))
+
+def main():
+  ri = synthetic_round()
+  away = holidays(ri)
+  assert with_copy(ri, away) == with_overlay(ri, away)
+  copy = timeit(lambda: with_copy(ri, away), number=3) / 3
+  overlay = timeit(lambda: with_overlay(ri, away), number=10) / 10
+  print('50 holidays on 5000 houses: {:8.2f} ms deep copy, {:8.2f} ms overlay'.format(
+        copy * 1000, overlay * 1000))
+
+  extra = [HouseInfo(num, 'Road{}'.format(num % 97), PaperInfo('Sun')) for num in range(5001, 5101)]
+  def single(ri):
+    for house in away:
+      ri.rem_house(house)
+    for house in extra:
+      ri.add_house(house)
+    ri.totals()['Sun']
+    return len(list(ri.route_iter()))
+  def commit(ri):
+    overlay = RoundOverlay(ri)
+    for house in away:
+      overlay.rem_house(house)
+    for house in extra:
+      overlay.add_house(house)
+    overlay.commit()
+    ri.totals()['Sun']
+    return len(list(ri.route_iter()))
+  base = timeit(synthetic_round, number=3) / 3
+  one = timeit(lambda: single(synthetic_round()), number=3) / 3 - base
+  step = timeit(lambda: commit(synthetic_round()), number=3) / 3 - base
+  print('50 removals and 100 additions: {:8.2f} ms one at a time, {:8.2f} ms overlay commit'.format(
+        one * 1000, step * 1000))
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,47 @@
+'''
+This benchmark measures iterating a round in delivery order, comparing joining each
+entry of the order back to its house by a search of the houses against resolving the
+route once with a join against the index of the houses, and the cost of keeping the
+resolved route up to date as houses are added.
+'''
+
+from random import Random
+from timeit import timeit
+from pydelivery.parser.parseround import RoundInfo, HouseInfo, OrderInfo, HasStandard
+
+def synthetic_round(size, seed=1):
+  '''Return a round of SIZE houses with an order visiting them in a random order'''
+  houses = [HouseInfo(num, 'Road{}'.format(num % 97), HasStandard) for num in range(1, size + 1)]
+  order = [OrderInfo(house._house, house._road) for house in houses]
+  Random(seed).shuffle(order)
+  return RoundInfo(1, 'Round1', houses, order)
+
+def search_join(ri):
+  '''Return the houses in delivery order by searching the houses for each entry'''
+  result = list()
+  for stop in ri:
+    for house in ri.house_iter():
+      if house._house == stop._house and house._road == stop._road:
+        result.append(house)
+        break
+  return result
+
+def main():
+  ri = synthetic_round(2000)
+  search = timeit(lambda: search_join(ri), number=1)
+  print('  2000 houses: {:8.2f} ms search join'.format(search * 1000))
+  for size in (2000, 50000):
+    ri = synthetic_round(size)
+    build = timeit(lambda: (setattr(ri, '_resolved', None), list(ri.route_iter())), number=3) / 3
+    walk = timeit(lambda: list(ri.route_iter()), number=3) / 3
+    print('{:6} houses: {:8.2f} ms to resolve and iterate, {:8.2f} ms to iterate'.format(
+          size, build * 1000, walk * 1000))
+  extra = [HouseInfo(num, 'Extra', HasStandard) for num in range(1, 1001)]
+  add = timeit(lambda: [ri.add_house(house) for house in extra], number=1)
+  resolved = ri._route()
+  route = timeit(lambda: [resolved.add(house, ri._houses) for house in extra], number=1)
+  print('{:6} houses: {:8.2f} ms to add 1000 houses, {:8.2f} ms of which updates the route'.format(
+        50000, add * 1000, route * 1000))
+
+if __name__ == '__main__':
+  main()
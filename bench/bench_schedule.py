@@ -0,0 +1,55 @@
+'''
+This benchmark measures expanding 500 magazine subscriptions over a 13 week planning
+horizon into their delivery dates, with the cache of expanded rules cleared before each
+run and kept between runs, against a simple loop over each date of the horizon.
+'''
+
+from datetime import date, timedelta
+from random import Random
+from timeit import timeit
+from pydelivery.parser.parseround import MagazineInfo
+from pydelivery.parser.schedule import delivery_dates, _expand_cached
+
+_frequencies = ('W', '2W', '4W', 'M', 'M1', 'M3', 'ML')
+
+def subscriptions(count=500, seed=1):
+  '''Return a list of (magazine, anchor date) pairs with randomly chosen rules'''
+  rand = Random(seed)
+  return [(MagazineInfo('Mag{}'.format(rand.randrange(60)), str(rand.randint(1, 7)),
+                        rand.choice(_frequencies)),
+           date(2024, 1, 1) + timedelta(days=rand.randrange(56)))
+          for _ in range(count)]
+
+def loop_dates(info, start, end, anchor):
+  '''Return the delivery dates by checking each date in turn'''
+  frequency, result = info._frequency, list()
+  day = start
+  while day < end:
+    if day.isoweekday() in info._days:
+      week = (day - anchor).days // 7
+      nth = (day.day - 1) // 7 + 1
+      if frequency[-1] == 'W':
+        take = week % int(frequency[:-1] or 1) == 0
+      elif frequency == 'M':
+        take = nth == (anchor.day - 1) // 7 + 1
+      elif frequency == 'ML':
+        take = (day + timedelta(days=7)).month != day.month
+      else:
+        take = nth == int(frequency[1:])
+      if take:
+        result.append(day)
+    day += timedelta(days=1)
+  return result
+
+def main():
+  subs = subscriptions()
+  start, end = date(2024, 4, 1), date(2024, 4, 1) + timedelta(weeks=13)
+  expand = lambda: [delivery_dates(info, start, end, anchor) for info, anchor in subs]
+  cold = timeit(lambda: (_expand_cached.cache_clear(), expand()), number=20) / 20
+  warm = timeit(expand, number=20) / 20
+  loop = timeit(lambda: [loop_dates(info, start, end, anchor) for info, anchor in subs], number=5) / 5
+  print('{} subscriptions over 13 weeks: {:7.2f} ms cold cache, {:7.2f} ms warm cache, '
+        '{:7.2f} ms date loop'.format(len(subs), cold * 1000, warm * 1000, loop * 1000))
+
+if __name__ == '__main__':
+  main()
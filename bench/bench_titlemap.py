@@ -0,0 +1,59 @@
+'''
+This benchmark measures TitleMap lookups made from a pool of threads, the reads using
+the published snapshot without taking a lock so that adding threads does not reduce
+the rate at which each thread completes its lookups, along with building catalogues
+of titles by single adds, each copying the mapping, and within a batch.
+'''
+
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from pydelivery.parser.parseround import TitleMap
+
+_titles = ['Title{}'.format(num) for num in range(500)]
+_lookups = 200
+
+def reader(namespace):
+  tm = TitleMap(namespace=namespace)
+  for _ in range(_lookups):
+    for title in _titles:
+      tm.index(title)
+
+def build(namespace, size, batch):
+  '''Add SIZE titles to the mapping of NAMESPACE, within a batch when BATCH is set'''
+  tm = TitleMap(namespace=namespace)
+  names = ['Title{}'.format(num) for num in range(size)]
+  if batch:
+    with tm.batch():
+      for name in names:
+        tm.add(name)
+  else:
+    for name in names:
+      tm.add(name)
+  TitleMap.drop_namespace(namespace)
+
+def main():
+  tm = TitleMap(namespace='bench')
+  for title in _titles:
+    tm.add(title)
+  per_thread = len(_titles) * _lookups
+  for threads in (1, 2, 4, 8, 16):
+    start = perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+      list(pool.map(reader, ['bench'] * threads))
+    secs = perf_counter() - start
+    print('{:>2} threads: {:10.0f} lookups/s in total, {:6.2f} us per lookup'.format(
+          threads, threads * per_thread / secs, secs * 1e6 / (threads * per_thread)))
+  TitleMap.drop_namespace('bench')
+
+  for size in (2000, 8000):
+    single = perf_counter()
+    build('build', size, False)
+    single = perf_counter() - single
+    batch = perf_counter()
+    build('build', size, True)
+    batch = perf_counter() - batch
+    print('{:>5} titles: {:8.2f} ms by single adds, {:8.2f} ms within a batch'.format(
+          size, single * 1000, batch * 1000))
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,50 @@
+'''
+This benchmark measures checking the copies of each title needed per day while a round
+of 3,000 houses is edited, comparing counting over every house after each edit, with
+title_demand and with a loop, against reading the totals kept up to date by the round.
+'''
+
+from random import Random
+from timeit import timeit
+from pydelivery.parser.parseround import RoundInfo, HouseInfo, PaperInfo, TitleTotals
+from pydelivery.parser.demand import title_demand
+
+_titles = ('Sun', 'Mail', 'Times', 'Telegraph', 'Express', 'Mirror', 'Star', 'I', 'Standard')
+_dayseqs = ('1234567', '123456', '7', '6', '5', '12345')
+
+def synthetic_round(size=3000, seed=1):
+  '''Return a round of SIZE houses, each taking one to three titles'''
+  rand = Random(seed)
+  return RoundInfo(1, 'Round1', [HouseInfo(num, 'Road{}'.format(num % 97),
+                                           [PaperInfo(title, rand.choice(_dayseqs))
+                                            for title in rand.sample(_titles, rand.randint(1, 3))])
+                                 for num in range(1, size + 1)])
+
+def edits(ri, count=200, seed=2):
+  '''Return COUNT functions, each changing the days of a title of a random house'''
+  rand = Random(seed)
+  houses = list(ri.house_iter())
+  result = list()
+  for _ in range(count):
+    house = rand.choice(houses)
+    title, day = house._titles[0]._title, rand.choice('1234567')
+    result.append(lambda house=house, title=title, day=day: house.add_days(title, day))
+  return result
+
+def run(check):
+  '''Apply each edit to a fresh round, calling CHECK with the round after each one'''
+  ri = synthetic_round()
+  for edit in edits(ri):
+    edit()
+    check(ri)
+
+def main():
+  base = timeit(lambda: run(lambda ri: None), number=1)
+  demand = timeit(lambda: run(title_demand), number=1) - base
+  loop = timeit(lambda: run(lambda ri: TitleTotals._count(ri._houses)), number=1) - base
+  kept = timeit(lambda: run(lambda ri: ri.totals()['Sun']), number=1) - base
+  print('200 edits of 3000 houses: {:8.2f} ms title_demand, {:8.2f} ms full count, '
+        '{:8.2f} ms kept totals'.format(demand * 1000, loop * 1000, kept * 1000))
+
+if __name__ == '__main__':
+  main()
@@ -4,3 +4,11 @@ a delivery of titles for a number of rounds and is meant to provide it in a netu
 '''
 
 from .parseround import *
+from .registry import *
+from .picklist import *
+from .demand import *
+from .schedule import *
+from .manifest import *
+from .aggregate import *
+from .overlay import *
+from .itinerary import *
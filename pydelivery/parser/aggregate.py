@@ -0,0 +1,82 @@
+'''
+This module provides the totals of a whole depot, being the copies of each title needed
+on each day of the week and the number of houses on each road, summed over all of the
+rounds held in memory or loaded from round files. The files are loaded and counted by
+a pool of processes, and the partial totals of each round are merged in the order the
+rounds are given, so that the result is the same for any number of workers.
+'''
+
+import os
+from .parseround import RoadMap, RoundInfo, load_round, _map_rounds
+
+# Detail the list of objects that will be exported by default
+__all__ = ('DepotTotals', 'depot_totals')
+
+class DepotTotals:
+  '''Class providing the totals of a depot, being the copies of each title needed on
+     each day of the week, starting with Monday, as a dictionary of title to a tuple
+     of 7 counts, the number of houses on each road as a RoadMap and the number of
+     rounds counted. The titles and roads are in the order they are first found.
+  '''
+  def __init__(self, titles, roads, rounds):
+    self.titles = titles
+    self.roads = roads
+    self.rounds = rounds
+
+  def __getitem__(self, title):
+    '''Return the copies of the given TITLE needed on each day of the week'''
+    return self.titles[title]
+
+  def __contains__(self, title):
+    return title in self.titles
+
+  def daily_totals(self):
+    '''Return the total copies of all titles needed on each day of the week'''
+    return tuple(sum(column) for column in zip(*self.titles.values())) or (0,) * 7
+
+
+def _round_partial(roundinfo):
+  '''Return the copies of each title needed on each day, and the RoadMap, of a single
+     round'''
+  roads = RoadMap()
+  roads.update(roundinfo)
+  return {title: tuple(row) for title, row in roundinfo.totals()._current().items()}, roads
+
+def _file_partials(name):
+  '''Return the partial totals of each round of the round file NAME, used by the
+     workers of depot_totals'''
+  return [_round_partial(roundinfo) for roundinfo in load_round(name).values()]
+
+def depot_totals(sources, max_workers=None, chunksize=1, min_parallel=2):
+  '''Return the DepotTotals of the given SOURCES, being a round, the dictionary
+     returned by load_round, or an iterable of rounds and names of round files. The
+     files are loaded and counted by a pool of MAX_WORKERS processes, defaulting to
+     the number of processors, passing CHUNKSIZE files to a worker at a time, unless
+     there is a single worker or fewer than MIN_PARALLEL files, when they are counted
+     in this process. The rounds are always counted in this process, using the totals
+     kept by each round, as sending a round to a worker costs more than counting it.
+  '''
+  if isinstance(sources, (RoundInfo, str, os.PathLike)):
+    sources = [sources]
+  elif isinstance(sources, dict):
+    sources = sources.values()
+  sources = list(sources)
+  for source in sources:
+    if not isinstance(source, (RoundInfo, str, os.PathLike)):
+      raise ValueError('Must pass instances of RoundInfo or names of round files')
+  if max_workers is None:
+    max_workers = os.cpu_count() or 1
+  files = [source for source in sources if not isinstance(source, RoundInfo)]
+  loaded = iter(_map_rounds(_file_partials, files, max_workers, chunksize, min_parallel))
+
+  # Merge the partial totals in the order of the sources
+  titles, roads, rounds = dict(), RoadMap(), 0
+  for source in sources:
+    partials = [_round_partial(source)] if isinstance(source, RoundInfo) else next(loaded)
+    for counts, round_roads in partials:
+      for title, row in counts.items():
+        total = titles.get(title)
+        titles[title] = row if total is None else tuple(map(sum, zip(total, row)))
+      roads.merge(round_roads)
+      rounds += 1
+  return DepotTotals(titles, roads, rounds)
@@ -0,0 +1,88 @@
+'''
+This module provides the number of copies of each title that are needed on each day
+of the week, for one or more rounds, as a dense NumPy matrix with a row per title and
+a column per day of the week. NumPy is only imported when the demand is first
+calculated, so that importing the package does not pay for it.
+'''
+
+from collections import Counter
+from .parseround import RoundInfo
+
+# Detail the list of objects that will be exported by default
+__all__ = ('TitleDemand', 'title_demand')
+
+class TitleDemand:
+  '''Class providing the copies of each title needed on each day of the week, the
+     counts being a matrix with a row for each title, in the order given by titles,
+     and a column for each day of the week, starting with Monday.
+  '''
+  def __init__(self, titles, counts):
+    self.titles = tuple(titles)
+    self.counts = counts
+    self._rows = {title: num for num, title in enumerate(self.titles)}
+
+  def __getitem__(self, title):
+    '''Return the copies of the given TITLE needed on each day of the week'''
+    return self.counts[self._rows[title]]
+
+  def __contains__(self, title):
+    return title in self._rows
+
+  def daily_totals(self):
+    '''Return the total copies of all titles needed on each day of the week'''
+    return self.counts.sum(axis=0)
+
+
+def _numpy(purpose):
+  '''Return the numpy module, importing it when first needed, or raise ImportError
+     naming the PURPOSE it is required for'''
+  try:
+    import numpy
+  except ImportError:
+    raise ImportError('The numpy package is required to {}'.format(purpose))
+  return numpy
+
+def _round_list(rounds):
+  '''Return the list of RoundInfo instances from a single round, a sequence of rounds,
+     or the dictionary returned by load_round'''
+  if isinstance(rounds, RoundInfo):
+    return [rounds]
+  if isinstance(rounds, dict):
+    rounds = rounds.values()
+  return list(rounds)
+
+def _title_rows(titlemap, titles):
+  '''Return the row of each title, starting with the titles from TITLEMAP, when given,
+     followed by the given TITLES that are not present in it'''
+  rows = dict()
+  if titlemap is not None:
+    for title, _ in titlemap:
+      rows.setdefault(title, len(rows))
+  for title in titles:
+    rows.setdefault(title, len(rows))
+  return rows
+
+def title_demand(rounds, titlemap=None):
+  '''Return the TitleDemand of the given ROUNDS. The rows follow the order of the
+     titles in TITLEMAP when given, followed by any titles that are not present in
+     it, in the order they are first found in the rounds.
+  '''
+  np = _numpy('calculate the title demand')
+
+  # Count each distinct combination of title, days and copies over all the houses
+  combos = Counter((paper._title, paper._days._mask, paper._copies)
+                   for roundinfo in _round_list(rounds)
+                   for house in roundinfo.house_iter()
+                   for paper in house._titles)
+
+  rows = _title_rows(titlemap, (title for title, _, _ in combos))
+  counts = np.zeros((len(rows), 7), dtype=np.int64)
+  if combos:
+    size = len(combos)
+    index = np.fromiter((rows[title] for title, _, _ in combos), dtype=np.intp, count=size)
+    masks = np.fromiter((mask for _, mask, _ in combos), dtype=np.int64, count=size)
+    copies = np.fromiter((copies * num for (_, _, copies), num in combos.items()),
+                         dtype=np.int64, count=size)
+    days = (masks[:, None] >> np.arange(7)) & 1
+    np.add.at(counts, index, days * copies[:, None])
+  return TitleDemand(rows, counts)
@@ -0,0 +1,181 @@
+'''
+This module provides the weekly itinerary of one or more rounds, giving for each round
+and each day of the week the houses taking a delivery, in delivery order, with the
+titles and copies due. The entries are generated from the manifest of each day and are
+written through a sink, which formats them as plain text, CSV or HTML, in chunks of a
+limited number of entries, so that the itinerary of a whole depot is written without
+being held in memory.
+'''
+
+import csv
+import os
+from abc import ABC, abstractmethod
+from html import escape
+from itertools import islice
+from .manifest import manifest
+from .parseround import DaySequence, RoundInfo, Weekday
+
+# Detail the list of objects that will be exported by default
+__all__ = ('ItinerarySink', 'TextSink', 'CSVSink', 'HTMLSink', 'itinerary', 'write_itinerary')
+
+_week = tuple(Weekday)
+
+def itinerary(rounds, days=None, picklist=None):
+  '''Generator returning a (day, ManifestEntry) pair for each house taking a delivery
+     on each of the DAYS, a day sequence defaulting to every day of the week, for each
+     of the given ROUNDS in turn, a single round, an iterable of rounds or the
+     dictionary returned by load_round. Each round is taken from ROUNDS when first
+     needed and its days are given in turn, the day being a Weekday. See manifest for
+     the entries.
+  '''
+  if days is not None:
+    mask = DaySequence._parse_mask(days)
+    days = tuple(day for day in _week if mask & (1 << (day - 1)))
+  else:
+    days = _week
+  if isinstance(rounds, RoundInfo):
+    rounds = (rounds,)
+  elif isinstance(rounds, dict):
+    rounds = rounds.values()
+  for roundinfo in rounds:
+    for day in days:
+      for entry in manifest(roundinfo, int(day), picklist):
+        yield day, entry
+
+
+class ItinerarySink(ABC):
+  '''Base class of the sinks that write the itinerary to a file, given either by name,
+     when it is opened with a buffer of BUFFERING bytes and closed once written, or as
+     an open file object. The sinks are used as context managers, writing the entries
+     with write, subclasses providing _format, giving the text of a chunk of entries.
+  '''
+  newline = None
+
+  def __init__(self, target, buffering=1 << 16):
+    self._target = target
+    self._buffering = buffering
+    self._fd = None
+    self._owned = False
+    self._group = None
+
+  def __enter__(self):
+    if isinstance(self._target, (str, os.PathLike)):
+      self._fd = open(self._target, 'wt', buffering=self._buffering, encoding='utf-8',
+                      newline=self.newline)
+      self._owned = True
+    else:
+      self._fd = self._target
+    self._group = None
+    self._begin()
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    try:
+      if exc_type is None:
+        self._end()
+    finally:
+      if self._owned:
+        self._fd.close()
+      self._fd, self._owned = None, False
+
+  def _begin(self):
+    '''Write the text that starts the itinerary'''
+
+  def _end(self):
+    '''Write the text that ends the itinerary'''
+
+  def write(self, rows):
+    '''Write the given chunk of (day, ManifestEntry) pairs'''
+    self._fd.write(''.join(self._format(rows)))
+
+  @abstractmethod
+  def _format(self, rows):
+    '''Generator returning the text of the given ROWS'''
+
+
+def _titles_text(entry):
+  '''Return the titles of ENTRY as text, giving the copies when more than one'''
+  return ', '.join(title if copies == 1 else '{} x{}'.format(title, copies)
+                   for title, copies in entry.titles)
+
+
+class TextSink(ItinerarySink):
+  '''Class writing the itinerary as plain text, with a heading for each round and day'''
+  def _format(self, rows):
+    for day, entry in rows:
+      group = (entry.round, day)
+      if group != self._group:
+        yield '{}Round {} - {}\n'.format('' if self._group is None else '\n',
+                                          entry.round, day.name)
+        self._group = group
+      house = '{}, {}'.format(entry.house, entry.road)
+      flags = '  [{}]'.format(entry.flags) if entry.flags else ''
+      yield '{:5}  {:<30} {}{}\n'.format(entry.position, house, _titles_text(entry), flags)
+
+
+class _Line:
+  '''Class standing in for a file for a csv writer, so that writerow returns the line'''
+  @staticmethod
+  def write(line):
+    return line
+
+
+class CSVSink(ItinerarySink):
+  '''Class writing the itinerary as CSV, with a row for each title delivered to a house
+     on a day'''
+  newline = ''
+  _header = ('day', 'round', 'position', 'house', 'road', 'title', 'copies', 'flags')
+
+  def _begin(self):
+    self._writer = csv.writer(_Line)
+    self._fd.write(self._writer.writerow(self._header))
+
+  def _format(self, rows):
+    writerow = self._writer.writerow
+    for day, entry in rows:
+      for title, copies in entry.titles:
+        yield writerow((day.name, entry.round, entry.position, entry.house, entry.road,
+                        title, copies, entry.flags or ''))
+
+
+class HTMLSink(ItinerarySink):
+  '''Class writing the itinerary as an HTML document, with a table for each round and
+     day'''
+  def _begin(self):
+    self._fd.write('<!DOCTYPE html>\n<html>\n<head><meta charset="utf-8">'
+                   '<title>Itinerary</title></head>\n<body>\n')
+
+  def _end(self):
+    self._fd.write('</table>\n</body>\n</html>\n' if self._group is not None else
+                   '</body>\n</html>\n')
+
+  def _format(self, rows):
+    for day, entry in rows:
+      group = (entry.round, day)
+      if group != self._group:
+        if self._group is not None:
+          yield '</table>\n'
+        yield ('<h2>Round {} - {}</h2>\n<table>\n<tr><th>Stop</th><th>House</th><th>Road</th>'
+               '<th>Titles</th><th>Flags</th></tr>\n'.format(entry.round, day.name))
+        self._group = group
+      yield '<tr><td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td></tr>\n'.format(
+            entry.position, escape(str(entry.house)), escape(entry.road),
+            escape(_titles_text(entry)), escape(entry.flags or ''))
+
+
+def write_itinerary(rounds, sink, days=None, picklist=None, chunksize=1000):
+  '''Write the itinerary of the given ROUNDS, see itinerary, through SINK, an instance
+     of ItinerarySink, taking CHUNKSIZE entries at a time, and return the number of
+     entries written'''
+  if not isinstance(sink, ItinerarySink):
+    raise ValueError('Must pass an instance of ItinerarySink')
+  if not isinstance(chunksize, int) or chunksize < 1:
+    raise ValueError('Must provide a positive chunk size')
+  rows, count = itinerary(rounds, days, picklist), 0
+  with sink:
+    chunk = list(islice(rows, chunksize))
+    while chunk:
+      sink.write(chunk)
+      count += len(chunk)
+      chunk = list(islice(rows, chunksize))
+  return count
@@ -0,0 +1,85 @@
+'''
+This module provides the delivery manifest of a single day of the week, giving each
+house of one or more rounds that takes a delivery on the day, in delivery order, with
+the titles and copies due. The entries are generated as the route of each round is
+followed, so that a round is never held as a whole, and can be taken in chunks of a
+limited number of entries for large books.
+'''
+
+from itertools import islice
+from .parseround import DaySequence, RoundInfo
+
+# Detail the list of objects that will be exported by default
+__all__ = ('ManifestEntry', 'manifest', 'manifest_chunks')
+
+class ManifestEntry:
+  '''Class providing an entry of the manifest, being the number of the round, the
+     position of the house in the delivery order of the round, starting at 1, the house
+     and road, the titles due as a tuple of (title, copies) pairs and the flags of the
+     house on the day.
+  '''
+  __slots__ = ('round', 'position', 'house', 'road', 'titles', 'flags')
+
+  def __init__(self, round, position, house, road, titles, flags):
+    self.round = round
+    self.position = position
+    self.house = house
+    self.road = road
+    self.titles = titles
+    self.flags = flags
+
+  def _values(self):
+    return (self.round, self.position, self.house, self.road, self.titles, self.flags)
+
+  def __eq__(self, other):
+    if not isinstance(other, ManifestEntry):
+      return NotImplemented
+    return self._values() == other._values()
+
+  def __repr__(self):
+    return '{}{!r}'.format(self.__class__.__name__, self._values())
+
+
+def _day_mask(day):
+  '''Return the mask of the given DAY, which must be a single day of the week'''
+  mask = DaySequence._parse_mask(day)
+  if mask & (mask - 1):
+    raise ValueError('Must provide a single day for the manifest')
+  return mask
+
+def manifest(rounds, day, picklist=None):
+  '''Generator returning a ManifestEntry for each house of the given ROUNDS, a single
+     round, an iterable of rounds or the dictionary returned by load_round, that takes
+     a delivery on DAY, following the delivery order of each round in turn, with each
+     round only taken from ROUNDS when its first entry is needed. The titles follow the
+     order of the house, or that of PICKLIST when given. The position of a house is
+     that within the route of the round, so that it is the same for every day.
+  '''
+  bit = _day_mask(day)
+  if isinstance(rounds, RoundInfo):
+    rounds = (rounds,)
+  elif isinstance(rounds, dict):
+    rounds = rounds.values()
+  for roundinfo in rounds:
+    key = picklist._key_func() if picklist is not None else None
+    number = roundinfo._number
+    for position, house in enumerate(roundinfo.route_iter(), 1):
+      papers = [paper for paper in house._titles if paper._days._mask & bit]
+      if not papers:
+        continue
+      if key is not None:
+        papers.sort(key=key)
+      yield ManifestEntry(number, position, house._house, house._road,
+                          tuple((paper._title, paper._copies) for paper in papers),
+                          'use_box' if house._use_box & bit else None)
+
+def manifest_chunks(rounds, day, size=1000, picklist=None):
+  '''Generator returning the entries of the manifest, see manifest, as lists of at
+     most SIZE entries'''
+  if not isinstance(size, int) or size < 1:
+    raise ValueError('Must provide a positive chunk size')
+  entries = manifest(rounds, day, picklist)
+  chunk = list(islice(entries, size))
+  while chunk:
+    yield chunk
+    chunk = list(islice(entries, size))
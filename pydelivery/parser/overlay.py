@@ -0,0 +1,333 @@
+'''
+This module provides an overlay over a round, which offers short term alterations to
+the delivery information, such as the holidays of a week or a temporary merge of
+rounds, to be previewed without copying the round. The overlay only records the
+houses that are added, removed or changed, a changed house being copied when it is
+first changed, and can either be discarded or committed to the round in one step.
+'''
+
+from copy import copy
+from .parseround import HouseInfo, OrderInfo, PaperList, RoundInfo, TitleTotals, _nearest_stop
+
+# Detail the list of objects that will be exported by default
+__all__ = ('RoundOverlay',)
+
+class _OverlayTotals(TitleTotals):
+  '''Class providing the totals of a RoundOverlay, being the totals kept by the round
+     with the change in copies recorded by the overlay'''
+  def __init__(self, overlay):
+    self._overlay = overlay
+    self._round = overlay._base
+
+  def _current(self):
+    counts = {title: list(row) for title, row in self._round.totals()._current().items()}
+    for title, row in self._overlay._delta.items():
+      total = counts.setdefault(title, [0] * 7)
+      for num, copies in enumerate(row):
+        total[num] += copies
+      if not any(total):
+        del counts[title]
+    if self.debug:
+      self._verify(counts)
+    return counts
+
+  def _verify(self, counts):
+    if self._count(self._overlay.house_iter()) != counts:
+      raise RuntimeError("Title totals of round '{}' differ from a full count".format(
+                         self._round._name))
+
+  def verify(self):
+    '''Check the totals against a full count over the houses of the overlay'''
+    self._verify(self._current())
+
+
+class RoundOverlay:
+  '''Class providing a round as altered by a number of changes, which are recorded
+     against the base round without changing it. The overlay provides the iteration,
+     flags and totals of a round, as RoundInfo. Added houses are placed in the order
+     as add_house would place them in turn, against the stops of the base round and
+     of the houses added before them, each being held in a list of the added stops
+     before or after a stop of the base round, or at the end of the order. The changes
+     are applied to the base round by commit, which fails if the houses of the base
+     round have otherwise been changed.
+  '''
+  def __init__(self, base):
+    if not isinstance(base, RoundInfo):
+      raise TypeError('Must provide an instance of RoundInfo')
+    self._base = base
+    self._reset()
+
+  def _reset(self):
+    '''Discard the recorded changes'''
+    self._added = dict()
+    self._before = dict()
+    self._after = dict()
+    self._ends = list()
+    self._placed = dict()
+    self._roads = dict()
+    self._removed = dict()
+    self._changed = dict()
+    self._delta = dict()
+    self._version = self._base._houses._version
+
+  @property
+  def _number(self):
+    return self._base._number
+
+  @property
+  def _name(self):
+    return self._base._name
+
+  def _current(self, house):
+    '''Return the current entry of the given HOUSE, or None if not in the overlay'''
+    key = (house._house, house._road)
+    added = self._added.get(key)
+    if added is not None:
+      return added
+    if key in self._removed:
+      return None
+    return self._changed.get(key) or self._base._houses[house]
+
+  def _count(self, house, sign):
+    '''Record the change in copies of adding, or with a negative SIGN removing, HOUSE'''
+    for paper in house._titles:
+      TitleTotals._add_paper(self._delta, paper, sign)
+
+  def add_house(self, house, order=None, before=False):
+    '''Add a house to the overlay, unless it is already present, placing it in the
+       order as RoundInfo.add_house'''
+    # Validate the house
+    if not isinstance(house, HouseInfo):
+      raise ValueError('Can only add instances of HouseInfo')
+    if self._current(house) is not None:
+      raise ValueError('House is already present in round')
+
+    # Find the stop of the order to place the house against, unless it has a stop left
+    # by the base round or by a house added and removed before
+    base, key = self._base, (house._house, house._road)
+    blocks = base._order_blocks() if base._has_order() else None
+    stopped = blocks is not None and (key in blocks or key in self._placed)
+    if order is not None:
+      if not isinstance(order, OrderInfo):
+        raise ValueError('Must pass an instance of OrderInfo as the order')
+      anchor = (order._house, order._road)
+      if blocks is None or (anchor not in blocks and anchor not in self._placed):
+        raise ValueError("House '{}' in road '{}' not present in order".format(*anchor))
+      if stopped:
+        raise ValueError('House is already present in order')
+    elif blocks is not None and not stopped:
+      anchor, before = self._nearest(blocks, OrderInfo(house._house, house._road))
+
+    # A house that was removed is recorded as a change of the house
+    self._count(house, 1)
+    removed = self._removed.pop(key, None)
+    if removed is not None:
+      self._changed[key] = house
+    else:
+      self._added[key] = house
+      if blocks is not None and not stopped:
+        self._place(key, anchor, before)
+
+  def _nearest(self, blocks, stop):
+    '''Return the key of the stop that STOP is to be placed next to, and whether it is
+       placed before that stop, as RoundInfo.add_house, from the stops of the base
+       round and those of the added houses'''
+    added = self._roads.get(stop._road)
+    if not added:
+      return blocks.nearest(stop)
+    keys = list(blocks.roads.get(stop._road, ())) + list(added)
+    numbers = sorted(blocks.houses.get(stop._road, []) +
+                     [key[0] for key in added if isinstance(key[0], int)])
+    return _nearest_stop(stop, keys, numbers, lambda key: self._position(blocks, key))
+
+  def _position(self, blocks, key):
+    '''Return a value giving the position of the stop with the given KEY in the order
+       of the overlay, for comparison with the positions of other stops'''
+    placed = self._placed.get(key)
+    if placed is None:
+      return blocks.position(key), 1, 0
+    stops, anchor, side = placed
+    return (len(blocks) if anchor is None else blocks.position(anchor), side,
+            stops.index(key))
+
+  def _place(self, key, anchor, before):
+    '''Place the added stop with the given KEY next to the stop with the key ANCHOR,
+       BEFORE or after it, or at the end of the order when ANCHOR is None'''
+    if anchor is None:
+      stops, side = self._ends, 3
+      stops.append(key)
+    elif anchor in self._placed:
+      stops, base, side = self._placed[anchor]
+      stops.insert(stops.index(anchor) + (0 if before else 1), key)
+      anchor = base
+    elif before:
+      stops, side = self._before.setdefault(anchor, []), 0
+      stops.append(key)
+    else:
+      stops, side = self._after.setdefault(anchor, []), 2
+      stops.insert(0, key)
+    self._placed[key] = (stops, anchor, side)
+    self._roads.setdefault(key[1], dict())[key] = None
+
+  def rem_house(self, house):
+    '''Remove a house from the overlay, unless it is not present, leaving its stop in
+       the order as RoundInfo.rem_house does by default, including the stop placed for
+       a house added to the overlay'''
+    if not isinstance(house, HouseInfo):
+      raise ValueError('Can only remove instances of HouseInfo')
+    current = self._current(house)
+    if current is None:
+      raise ValueError('House not present in round')
+    self._count(current, -1)
+    key = (house._house, house._road)
+    if self._added.pop(key, None) is None:
+      self._changed.pop(key, None)
+      self._removed[key] = self._base._houses[house]
+
+  def _writable(self, house):
+    '''Return the entry of the given HOUSE that can be changed, copying the entry of the
+       base round when first changed'''
+    if not isinstance(house, HouseInfo):
+      raise ValueError('Must pass an instance of HouseInfo')
+    current = self._current(house)
+    if current is None:
+      raise ValueError('House not present in round')
+    key = (house._house, house._road)
+    if key in self._added or key in self._changed:
+      return current
+    current = copy(current)
+    current._titles = PaperList._trusted(current._titles)
+    self._changed[key] = current
+    return current
+
+  def _change_days(self, house, title, func):
+    '''Change the days of TITLE for HOUSE with FUNC, recording the change in copies'''
+    house = self._writable(house)
+    paper = house._titles[title]
+    func(house)
+    TitleTotals._add_paper(self._delta, paper, -1)
+    TitleTotals._add_paper(self._delta, house._titles[title])
+
+  def add_days(self, house, title, dayseq):
+    '''Add the given day sequence to the delivery of TITLE to HOUSE'''
+    self._change_days(house, title, lambda house: house.add_days(title, dayseq))
+
+  def remove_days(self, house, title, dayseq):
+    '''Remove the given day sequence from the delivery of TITLE to HOUSE'''
+    self._change_days(house, title, lambda house: house.remove_days(title, dayseq))
+
+  def suspend(self, house, dayseq):
+    '''Remove the given day sequence from the delivery of every title to HOUSE, such as
+       for the days of a holiday'''
+    for paper in list(self._writable(house)._titles):
+      self.remove_days(house, paper._title, dayseq)
+
+  def _walk(self):
+    '''Generator providing each stop of the order with its house, as route_iter, the
+       stop being None for unordered houses and the house None for orphaned stops,
+       including the stops of added houses that have since been removed'''
+    base, removed, changed, added = self._base, self._removed, self._changed, self._added
+    if base._has_order():
+      route = base._route()
+      for stop, house in zip(base._order, route.stops):
+        key = (stop._house, stop._road)
+        for placed in self._before.get(key, ()):
+          yield OrderInfo(*placed), added.get(placed)
+        if key in removed:
+          house = None
+        elif key in changed:
+          house = changed[key]
+        elif house is None and key in added:
+          house = added[key]
+        yield stop, house
+        for placed in self._after.get(key, ()):
+          yield OrderInfo(*placed), added.get(placed)
+      for placed in self._ends:
+        yield OrderInfo(*placed), added.get(placed)
+      houses = route.unordered.values()
+    else:
+      houses = base._houses
+    for house in houses:
+      key = (house._house, house._road)
+      if key not in removed:
+        yield None, changed.get(key, house)
+    if not base._has_order():
+      for house in added.values():
+        yield None, house
+
+  def house_iter(self):
+    '''Generator providing the houses within this overlay'''
+    removed, changed = self._removed, self._changed
+    for house in self._base._houses:
+      key = (house._house, house._road)
+      if key not in removed:
+        yield changed.get(key, house)
+    yield from self._added.values()
+
+  def route_iter(self):
+    '''Generator providing the houses of this overlay in delivery order, see
+       RoundInfo.route_iter'''
+    for _, house in self._walk():
+      if house is not None:
+        yield house
+
+  def order_iter(self):
+    '''Generator providing the order of houses in this overlay'''
+    if self._base._has_order():
+      for stop, _ in self._walk():
+        if stop is not None:
+          yield stop
+
+  def __iter__(self):
+    '''Provide an iterator over the houses on this overlay'''
+    return self.order_iter() if self._base._has_order() else self.house_iter()
+
+  def orphans(self):
+    '''Return the entries of the order for which the house is not in the overlay'''
+    return [stop for stop, house in self._walk() if house is None]
+
+  def unordered(self):
+    '''Return the houses of the overlay that are not in the order, when there is one'''
+    if not self._base._has_order():
+      return []
+    return [house for stop, house in self._walk() if stop is None]
+
+  def flags(self, dayseq=None):
+    '''Return the flags of every house in the overlay for the given day sequence, in
+       the order given by house_iter'''
+    return [house.flags(dayseq) for house in self.house_iter()]
+
+  def totals(self):
+    '''Return the TitleTotals of the overlay, being those of the base round with the
+       recorded changes'''
+    return _OverlayTotals(self)
+
+  def changes(self):
+    '''Return the number of houses added, removed and changed'''
+    return len(self._added), len(self._removed), len(self._changed)
+
+  def commit(self):
+    '''Apply the recorded changes to the base round in a single step, then discard them'''
+    if self._base._houses._version != self._version:
+      raise ValueError('Round has been changed since the overlay was created')
+    self._base._apply_changes(self._removed, self._changed, list(self._added.values()),
+                              self._stops(), self._delta)
+    self._reset()
+
+  def _stops(self):
+    '''Return the stops of the added houses, with the key of the stop each is placed
+       next to and whether it is placed before it, in an order in which inserting them
+       in turn gives the order of the overlay'''
+    stops = list()
+    for anchor, keys in self._before.items():
+      stops.extend((OrderInfo(*key), anchor, True) for key in keys)
+    for anchor, keys in self._after.items():
+      for key in keys:
+        stops.append((OrderInfo(*key), anchor, False))
+        anchor = key
+    stops.extend((OrderInfo(*key), None, False) for key in self._ends)
+    return stops
+
+  def discard(self):
+    '''Discard the recorded changes, leaving the base round as it is'''
+    self._reset()
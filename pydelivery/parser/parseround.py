@@ -6,46 +6,344 @@ maintain a set of known roads which are used to produce the integer values that
 are stored in the application database.
 '''
 
-from collections import OrderedDict
-from itertools import filterfalse
+from bisect import bisect, bisect_left, insort
+from collections import Counter
+from collections.abc import MutableMapping
+from contextlib import contextmanager, nullcontext
+from copy import copy
+from enum import IntEnum
+from functools import lru_cache
+from hashlib import blake2b
+from itertools import filterfalse, islice
+from threading import Lock, get_ident
+from weakref import WeakValueDictionary, ref
+import ast
+import os
+import sys
+from .registry import IdRegistry
 
 # Detail the list of objects that will be exported by default
-__all__ = ('TitleMap', 'RoadMap', 'DayOfWeek', 'DaySequence', 'PaperInfo',
+__all__ = ('TitleMap', 'RoadMap', 'Weekday', 'DayOfWeek', 'DaySequence', 'PaperInfo',
            'MagazineInfo', 'HouseInfo', 'OrderInfo', 'HouseList',
-           'OrderList', 'PaperList', 'RoundInfo')
+           'OrderList', 'PaperList', 'RoundInfo', 'TitleTotals')
+
+class _Fenwick:
+  '''Class providing the running totals of a list of sizes, so that a size is changed
+     and the total of the sizes before an index is found in O(log n) time'''
+  __slots__ = ('tree',)
+
+  def __init__(self, sizes):
+    tree = [0]
+    tree.extend(sizes)
+    for num in range(1, len(tree)):
+      parent = num + (num & -num)
+      if parent < len(tree):
+        tree[parent] += tree[num]
+    self.tree = tree
+
+  def add(self, index, delta):
+    '''Add DELTA to the size at INDEX'''
+    index += 1
+    while index < len(self.tree):
+      self.tree[index] += delta
+      index += index & -index
+
+  def append(self, size):
+    '''Add SIZE as the size at the end of the list'''
+    tree = self.tree
+    index = len(tree)
+    tree.append(size + self.before(index - 1) - self.before(index - (index & -index)))
+
+  def pop(self):
+    '''Remove the size at the end of the list'''
+    self.tree.pop()
+
+  def find(self, total):
+    '''Return the first index at which the total of the sizes up to and including it
+       exceeds TOTAL, the sizes being positive or zero'''
+    tree, index = self.tree, 0
+    step = 1 << (len(tree) - 1).bit_length()
+    while step:
+      upper = index + step
+      if upper < len(tree) and tree[upper] <= total:
+        index = upper
+        total -= tree[upper]
+      step >>= 1
+    return index
+
+  def before(self, index):
+    '''Return the total of the sizes before INDEX'''
+    total = 0
+    while index > 0:
+      total += self.tree[index]
+      index -= index & -index
+    return total
+
+
+# Marker left in the slot of a key that has been removed from an _IndexedDict
+_Tombstone = object()
+
+class _IndexedDict(MutableMapping):
+  '''Class providing an ordered mapping that keeps a key to slot dictionary and a
+     slot to key array, so that the position of a key, and the key at a position,
+     are both found in constant time. Removing a key leaves a tombstone in its slot,
+     the tombstones being compacted away once they outnumber the live keys. While
+     there are tombstones, positions are found in O(log n) time from the running
+     count of the live slots, which is built when first needed, until enough of them
+     have been found to pay for compacting the tombstones away.
+  '''
+  __slots__ = ('_slots', '_keys', '_values', '_holes', '_ranks', '_reads', '_version')
+
+  def __init__(self, items=None):
+    self._slots = dict()
+    self._keys = list()
+    self._values = list()
+    self._holes = 0
+    self._ranks = None
+    self._reads = 0
+    self._version = 0
+    if items is not None:
+      self.update(items)
+
+  def _compact(self):
+    '''Remove the tombstones, renumbering the slots of the remaining keys'''
+    live = [slot for slot, key in enumerate(self._keys) if key is not _Tombstone]
+    self._keys = [self._keys[slot] for slot in live]
+    self._values = [self._values[slot] for slot in live]
+    self._slots = {key: slot for slot, key in enumerate(self._keys)}
+    self._holes = 0
+    self._ranks = None
+    self._reads = 0
+
+  def _rank_tree(self):
+    '''Return the running count of the live slots, building it when not present, or
+       None once the tombstones have been compacted away after enough positions were
+       found from it'''
+    self._reads += 1
+    if self._reads > len(self._keys) >> 3:
+      self._compact()
+      return None
+    if self._ranks is None:
+      self._ranks = _Fenwick(int(key is not _Tombstone) for key in self._keys)
+    return self._ranks
+
+  def __len__(self):
+    return len(self._slots)
+
+  def __contains__(self, key):
+    return key in self._slots
+
+  def __getitem__(self, key):
+    return self._values[self._slots[key]]
+
+  def __setitem__(self, key, value):
+    slot = self._slots.get(key)
+    if slot is None:
+      self._slots[key] = len(self._keys)
+      self._keys.append(key)
+      self._values.append(value)
+      if self._ranks is not None:
+        self._ranks.append(1)
+    else:
+      self._values[slot] = value
+    self._version += 1
+
+  def __delitem__(self, key):
+    slot = self._slots.pop(key)
+    self._version += 1
+    if slot == len(self._keys) - 1:
+      self._keys.pop()
+      self._values.pop()
+      if self._ranks is not None:
+        self._ranks.pop()
+    else:
+      self._keys[slot] = _Tombstone
+      self._values[slot] = None
+      self._holes += 1
+      if self._ranks is not None:
+        self._ranks.add(slot, -1)
+      if self._holes > len(self._slots):
+        self._compact()
+
+  def __iter__(self):
+    for key in self._keys:
+      if key is not _Tombstone:
+        yield key
+
+  def __repr__(self):
+    return '{}({!r})'.format(self.__class__.__name__, list(self.items()))
+
+  def clear(self):
+    '''Remove all the keys from the mapping'''
+    self._slots = dict()
+    self._keys = list()
+    self._values = list()
+    self._holes = 0
+    self._ranks = None
+    self._reads = 0
+    self._version += 1
+
+  def copy(self):
+    '''Return a shallow copy of the mapping, without any tombstones'''
+    if self._holes:
+      self._compact()
+    other = self.__class__()
+    other._slots = self._slots.copy()
+    other._keys = self._keys.copy()
+    other._values = self._values.copy()
+    return other
+
+  def index(self, key):
+    '''Return the position of the given KEY in insertion order'''
+    slot = self._slots[key]
+    ranks = self._rank_tree() if self._holes else None
+    return ranks.before(slot) if ranks is not None else self._slots[key]
+
+  def key_at(self, pos):
+    '''Return the key at the given position in insertion order'''
+    if pos < 0:
+      raise IndexError('Position must not be negative')
+    if pos >= len(self._slots):
+      raise IndexError('Position is beyond the end of the mapping')
+    ranks = self._rank_tree() if self._holes else None
+    return self._keys[ranks.find(pos) if ranks is not None else pos]
+
+
+class _MapSpace:
+  '''Class providing a mapping shared between instances, where reads use the current
+     snapshot without taking a lock and writes are serialised, each write updating a
+     copy of the snapshot which is then published in its place. A batch applies all
+     the writes made by one thread to a single copy, which is published when the batch
+     completes, and which that thread reads in place of the snapshot until then.
+  '''
+  __slots__ = ('snapshot', '_lock', '_batch')
+
+  def __init__(self):
+    self.snapshot = _IndexedDict()
+    self._lock = Lock()
+    self._batch = None
+
+  def current(self):
+    '''Return the mapping read by the calling thread'''
+    batch = self._batch
+    if batch is not None and batch[0] == get_ident():
+      return batch[1]
+    return self.snapshot
+
+  @contextmanager
+  def write(self):
+    '''Provide a copy of the snapshot to modify, publishing it once complete, or the
+       copy of the batch the calling thread has in progress'''
+    batch = self._batch
+    if batch is not None and batch[0] == get_ident():
+      yield batch[1]
+      return
+    with self._lock:
+      work = self.snapshot.copy()
+      yield work
+      self._publish(work)
+
+  @contextmanager
+  def batch(self):
+    '''Provide a copy of the snapshot to which the writes of the calling thread are
+       made, publishing it once complete, or discarding it should the batch fail'''
+    batch = self._batch
+    if batch is not None and batch[0] == get_ident():
+      yield batch[1]
+      return
+    with self._lock:
+      work = self.snapshot.copy()
+      self._batch = (get_ident(), work)
+      try:
+        yield work
+      finally:
+        self._batch = None
+      self._publish(work)
+
+  def _publish(self, work):
+    '''Publish the given modified copy of the snapshot in its place'''
+    if work._holes:
+      work._compact()
+    self.snapshot = work
+
+
+class _MapRegistry:
+  '''Class providing the named spaces holding the mappings shared by instances'''
+  def __init__(self):
+    self._spaces = dict()
+    self._lock = Lock()
+
+  def space(self, name):
+    '''Return the space of the given NAME, creating it when not already present'''
+    space = self._spaces.get(name)
+    if space is None:
+      with self._lock:
+        space = self._spaces.setdefault(name, _MapSpace())
+    return space
+
+  def names(self):
+    '''Return the names of the spaces currently present'''
+    with self._lock:
+      return list(self._spaces)
+
+  def drop(self, name):
+    '''Remove the space of the given NAME, if present'''
+    with self._lock:
+      self._spaces.pop(name, None)
+
 
 # Provide the mapping classes that maintain a central set of information
 class _BaseMap:
   '''Class providing the shared functionality'''
   # _map should be declared in inheriting class to avoid incorrect mapping
-  def __init__(self):
+  _registry = None
+  def __init__(self, registry=None):
     if not hasattr(self, '_map'):
       # Provide a local mapping that is not shared
-      self._map = OrderedDict()
+      self._map = _IndexedDict()
+    self._registry = self._open_registry(registry)
+
+  @staticmethod
+  def _open_registry(registry):
+    '''Return the IdRegistry for the given REGISTRY, which may also be a filename'''
+    if registry is None or isinstance(registry, IdRegistry):
+      return registry
+    return IdRegistry(registry)
+
+  def _write(self):
+    '''Return the context providing the mapping that is to be modified'''
+    return nullcontext(self._map)
     
   def _add(self, key, value, update=False, ignoredup=True):
-    if key in self._map:
-      if not ignoredup:
-        val = self._map[key]
-        if not update:
-          raise ValueError("Key '{}' already present".format(key))
-        elif not issubclass(type(val), type(value)):
-          raise ValueError("Updating with different type: '{}' instead of '{}'".format(value.__class__.__name__, val.__class__.__name__))
-        self._map[key] = value
-    else:
-      self._map[key] = value
+    with self._write() as map_:
+      if key in map_:
+        if not ignoredup:
+          val = map_[key]
+          if not update:
+            raise ValueError("Key '{}' already present".format(key))
+          elif not issubclass(type(val), type(value)):
+            raise ValueError("Updating with different type: '{}' instead of '{}'".format(value.__class__.__name__, val.__class__.__name__))
+          map_[key] = value
+      else:
+        map_[key] = value
       
   def _remove(self, key, error=False):
-    try:
-      del self._map[key]
-    except KeyError:
-      if error:
-        raise KeyError("Key '{}' not present in mapping".format(key))
+    with self._write() as map_:
+      try:
+        del map_[key]
+      except KeyError:
+        if error:
+          raise KeyError("Key '{}' not present in mapping".format(key))
     
   def _index(self, check):
-    for num, key in enumerate(self._map):
-      if key == check:
-        return num
+    map_ = self._map
+    if isinstance(map_, _IndexedDict):
+      if check in map_:
+        return map_.index(check)
+    else:
+      for num, key in enumerate(map_):
+        if key == check:
+          return num
     raise KeyError("Key '{}' not present in mapping".format(check))
 
   def __contains__(self, item):
@@ -53,14 +351,15 @@ class _BaseMap:
   
   def __getitem__(self, item):
     if isinstance(item, int):
-      num, keys = item, iter(self._map)
-      try:
-        while num >= 0:
-          key = next(keys)
-          num -= 1
-      except StopIteration:
-        raise KeyError("Element '{}' does not exist".format(item))
-      return key
+      map_ = self._map
+      if item >= 0:
+        if isinstance(map_, _IndexedDict):
+          if item < len(map_):
+            return map_.key_at(item)
+        else:
+          for key in islice(map_, item, None):
+            return key
+      raise KeyError("Element '{}' does not exist".format(item))
     elif isinstance(item, str):
       return self._map[item]
     else:
@@ -74,36 +373,45 @@ class _BaseMap:
       yield key, value
 
   def numeric_iter(self):
-    '''Return the list of keys in order togeather with a unique ID'''
-    for num, key in enumerate(self._map):
-      yield num, key
+    '''Return the list of keys in order togeather with a unique ID, which is taken
+       from the registry when one is in use so that it does not change between runs
+    '''
+    if self._registry is None:
+      for num, key in enumerate(self._map):
+        yield num, key
+    else:
+      keys = list(self._map)
+      for num, key in zip(self._registry.assign(keys), keys):
+        yield num, key
 
 
 class _IncrMap(_BaseMap):
   '''Class adding increment and decrement to a _BaseMap object'''
   def _incr(self, key):
     '''Increment the value that is associated with the given KEY'''
-    val = 0 if key not in self._map else self._map[key]
-    if not isinstance(val, int):
-      raise ValueError("Key '{}' value must be an integer".format(key))
-    self._map[key] = val + 1 
+    with self._write() as map_:
+      val = 0 if key not in map_ else map_[key]
+      if not isinstance(val, int):
+        raise ValueError("Key '{}' value must be an integer".format(key))
+      map_[key] = val + 1 
 
   def _decr(self, key, autoremove=False, error=False):
     '''Decrement the value that is associated with the given KEY'''
-    if key in self._map:
-      val = self._map[key]
-      if not isinstance(val, int):
-        raise ValueError("Key '{}' value must be an integer".format(key))
-      elif val < 1:
-        if error:
-          raise ValueError("Key '{}' cannot be negative".format(key))
-        return val
-      if autoremove and val < 2:
-        del self._map[key]
-      else:
-        self._map[key] = val - 1
-    elif error:
-      raise ValueError("Key '{}' not present in mapping".format(key))
+    with self._write() as map_:
+      if key in map_:
+        val = map_[key]
+        if not isinstance(val, int):
+          raise ValueError("Key '{}' value must be an integer".format(key))
+        elif val < 1:
+          if error:
+            raise ValueError("Key '{}' cannot be negative".format(key))
+          return val
+        if autoremove and val < 2:
+          del map_[key]
+        else:
+          map_[key] = val - 1
+      elif error:
+        raise ValueError("Key '{}' not present in mapping".format(key))
 
   def __setitem__(self, key, value):
     '''Set the given key incrementing the current value'''
@@ -116,20 +424,87 @@ class _IncrMap(_BaseMap):
   def decrement(self, key, error=False):
     '''Remove a key from the map updating the count'''
     self._decr(key, autoremove=True, error=error)
+
+  def _incr_counts(self, counts):
+    '''Increment the value of each key by its count, from a sequence of pairs'''
+    with self._write() as map_:
+      get = map_.get
+      for key, count in counts:
+        val = get(key, 0)
+        if not isinstance(val, int) or not isinstance(count, int):
+          raise ValueError("Key '{}' value must be an integer".format(key))
+        map_[key] = val + count
+
+  def _update(self, keys):
+    '''Increment the value of each of the given KEYS, counting them in a single pass'''
+    self._incr_counts(Counter(keys).items())
+
+  def merge(self, other):
+    '''Add the counts of the OTHER mapping into this mapping, with keys that are not
+       already present being added in the order they were first seen by OTHER'''
+    if not isinstance(other, _IncrMap):
+      raise ValueError('Can only merge instances of _IncrMap')
+    self._incr_counts(other._map.items())
+    return self
+
+  def __add__(self, other):
+    '''Return a new mapping holding the combined counts of both mappings'''
+    if not isinstance(other, _IncrMap):
+      return NotImplemented
+    result = copy(self)
+    result._map = self._map.copy()
+    return result.merge(other)
     
 
 class TitleMap(_BaseMap):
   '''Class providing the title mapping, with the added function that will prioritise
-     papers above/below/with magazines
+     papers above/below/with magazines. The mapping is shared by all the instances
+     using the same namespace, reads use a snapshot of the mapping without locking
+     whilst changes are serialised so that instances may be used from many threads.
+     Each change copies the mapping, so many changes are best made within batch.
   '''
-  _map = OrderedDict()
+  _spaces = _MapRegistry()
   _valid_mag_order = ('after_paper', 'before_paper', 'inwith_paper')
+  _category_order = dict(after_paper=('Newspaper', 'Magazine'),
+                         before_paper=('Magazine', 'Newspaper'),
+                         inwith_paper=None)
   
-  def __init__(self, mag_order='after_paper'):
+  def __init__(self, mag_order='after_paper', registry=None, namespace='default'):
     if mag_order not in self._valid_mag_order:
       raise TypeError("Invalid magazine order given")
-    self._order = list() if mag_order != 'inwith_paper' else None
+    self._registry = self._open_registry(registry)
+    # Provide the order in which the categories of title are to be picked
+    order = self._category_order[mag_order]
+    self._order = list(order) if order is not None else None
     self._magorder = mag_order
+    self._space = self._spaces.space(namespace)
+
+  @property
+  def _map(self):
+    '''Return the current snapshot of the mapping for the namespace, or the mapping
+       of the batch in progress in the calling thread'''
+    return self._space.current()
+
+  def _write(self):
+    return self._space.write()
+
+  @contextmanager
+  def batch(self):
+    '''Context in which the changes made by the calling thread, through any instance
+       using the same namespace, are made to a single copy of the mapping, which is
+       seen by other threads once the batch completes, and is discarded if it fails'''
+    with self._space.batch():
+      yield self
+
+  @classmethod
+  def namespaces(cls):
+    '''Return the names of the namespaces currently in use'''
+    return cls._spaces.names()
+
+  @classmethod
+  def drop_namespace(cls, namespace):
+    '''Discard the mapping of the given NAMESPACE'''
+    cls._spaces.drop(namespace)
     
   def add(self, name, dayseq=None, update=False):
     self._add(name, dayseq, update=update, ignoredup=False)
@@ -157,42 +532,103 @@ class RoadMap(_IncrMap):
     else:
       raise ValueError('Must pass an instance of HouseInfo')
 
+  def update(self, houses):
+    '''Add all the houses of the given HouseList or RoundInfo'''
+    if isinstance(houses, RoundInfo):
+      houses = houses._houses
+    elif not isinstance(houses, HouseList):
+      raise ValueError('Must pass an instance of HouseList or RoundInfo')
+    self._update(house._road for house in houses)
+
+  @classmethod
+  def from_rounds(cls, rounds, max_workers=None, chunksize=1):
+    '''Return a new mapping counting the houses of all the given ROUNDS, with each
+       round counted in a pool of processes and the counts merged in round order
+    '''
+    result = cls()
+    for roads in _map_rounds(_round_roads, rounds, max_workers, chunksize):
+      result.merge(roads)
+    return result
+
+
+def _round_roads(roundinfo):
+  '''Return the RoadMap of a single round, used by the workers of RoadMap.from_rounds'''
+  roads = RoadMap()
+  roads.update(roundinfo)
+  return roads
+
+def _map_rounds(func, rounds, max_workers=None, chunksize=1, min_parallel=2):
+  '''Apply FUNC to each of the ROUNDS, which may also be the dictionary returned by
+     load_round, using a pool of processes unless only a single worker is requested
+     or there are fewer than MIN_PARALLEL rounds, returning the results in the order
+     of the rounds
+  '''
+  if isinstance(rounds, dict):
+    rounds = rounds.values()
+  rounds = list(rounds)
+  if max_workers == 1 or len(rounds) < max(min_parallel, 2):
+    return [func(roundinfo) for roundinfo in rounds]
+  from concurrent.futures import ProcessPoolExecutor
+  with ProcessPoolExecutor(max_workers=max_workers) as pool:
+    return list(pool.map(func, rounds, chunksize=chunksize))
 
-# TODO Add alternative implementation not dependant on PySide2
-from PySide2.QtCore import Qt
+
+class Weekday(IntEnum):
+  '''Class providing the days of the week as ISO day numbers, (Monday=1), which
+     are the same values as used by the PySide2.QtCore.Qt.DayOfWeek object
+  '''
+  Monday = 1
+  Tuesday = 2
+  Wednesday = 3
+  Thursday = 4
+  Friday = 5
+  Saturday = 6
+  Sunday = 7
+
+
+def _qt_dayofweek():
+  '''Return the PySide2.QtCore.Qt.DayOfWeek object, only importing PySide2 when used'''
+  from PySide2.QtCore import Qt
+  return Qt.DayOfWeek
+
+# Provide the backends supplying the objects used for the days of the week, the
+# default being selected by the PYDELIVERY_DAYOFWEEK environment variable
+_dow_backends = dict(enum=lambda: Weekday, qt=_qt_dayofweek)
+_dow_default = os.environ.get('PYDELIVERY_DAYOFWEEK', 'enum')
 
 class DayOfWeek:
-  '''Class providing the days of the week that is based on the
-     PySide2.QtCore.Qt.DayOfWeek object, adding the ability to
-     refer to the days as a number in the range 0..7, with Sunday 
-     being refered by both numbers 0 and 7.
+  '''Class providing the days of the week that is based on either the Weekday
+     object or, when the 'qt' backend is selected, the PySide2.QtCore.Qt.DayOfWeek
+     object, adding the ability to refer to the days as a number in the range 0..7,
+     with Sunday being refered by both numbers 0 and 7. As the values of both are
+     the ISO day numbers, an instance using the 'qt' backend will also convert a
+     Weekday into the matching Qt.DayOfWeek.
   '''
-  _dow_dict = None
-  _dow_names = None
+  _day_names = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+  _backend_cache = dict()
   
-  def __init__(self):
-    if not hasattr(self, '_dow_dict') or self._dow_dict is None:
-      self._dow_dict = dict()
-      self._dow_dict.update(Qt.DayOfWeek.values)
-      self._dow_dict[0] = self._dow_dict['0'] = self._dow_dict['Sun'] = self._dow_dict['Sunday']
-      self._dow_dict[1] = self._dow_dict['1'] = self._dow_dict['Mon'] = self._dow_dict['Monday']
-      self._dow_dict[2] = self._dow_dict['2'] = self._dow_dict['Tue'] = self._dow_dict['Tuesday']
-      self._dow_dict[3] = self._dow_dict['3'] = self._dow_dict['Wed'] = self._dow_dict['Wednesday']
-      self._dow_dict[4] = self._dow_dict['4'] = self._dow_dict['Thu'] = self._dow_dict['Thursday']
-      self._dow_dict[5] = self._dow_dict['5'] = self._dow_dict['Fri'] = self._dow_dict['Friday']
-      self._dow_dict[6] = self._dow_dict['6'] = self._dow_dict['Sat'] = self._dow_dict['Saturday']
-      self._dow_dict[7] = self._dow_dict['7'] = self._dow_dict['Sunday']
-      self._dow_names = set(['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'])
+  def __init__(self, backend=None):
+    backend = backend or _dow_default
+    if backend not in self._backend_cache:
+      if isinstance(backend, str):
+        if backend not in _dow_backends:
+          raise ValueError("Unknown day of week backend '{}'".format(backend))
+        days = _dow_backends[backend]()
+      else:
+        days = backend
+      dow_dict = dict()
+      for num, name in enumerate(self._day_names, 1):
+        day = getattr(days, name)
+        dow_dict[num] = dow_dict[str(num)] = dow_dict[name[:3]] = dow_dict[name] = day
+      dow_dict[0] = dow_dict['0'] = dow_dict['Sunday']
+      self._backend_cache[backend] = (days, dow_dict)
+    self._days, self._dow_dict = self._backend_cache[backend]
+    self._dow_names = set(self._day_names)
 
   def days(self):
     'Return the days of the week'
-    yield Qt.DayOfWeek.Monday
-    yield Qt.DayOfWeek.Tuesday
-    yield Qt.DayOfWeek.Wednesday
-    yield Qt.DayOfWeek.Thursday
-    yield Qt.DayOfWeek.Friday
-    yield Qt.DayOfWeek.Saturday
-    yield Qt.DayOfWeek.Sunday
+    for name in self._day_names:
+      yield getattr(self._days, name)
 
   def __getitem__(self, dow):
     return self._dow_dict[dow]
@@ -202,36 +638,91 @@ class DayOfWeek:
 
   @property
   def Monday(self):
-    return Qt.DayOfWeek.Monday
+    return self._days.Monday
   
   @property
   def Tuesday(self):
-    return Qt.DayOfWeek.Tuesday
+    return self._days.Tuesday
   
   @property
   def Wednesday(self):
-    return Qt.DayOfWeek.Wednesday
+    return self._days.Wednesday
   
   @property
   def Thursday(self):
-    return Qt.DayOfWeek.Thursday
+    return self._days.Thursday
   
   @property
   def Friday(self):
-    return Qt.DayOfWeek.Friday
+    return self._days.Friday
   
   @property
   def Saturday(self):
-    return Qt.DayOfWeek.Saturday
+    return self._days.Saturday
   
   @property
   def Sunday(self):
-    return Qt.DayOfWeek.Sunday
+    return self._days.Sunday
   
 
+# Provide the day mask that has a bit set for every day of the week, with the lowest
+# bit being Monday and the highest bit being Sunday
+_all_days_mask = 0x7f
+
+def _mask_day_sets(dow):
+  '''Return the set of days from DOW for each of the possible day masks'''
+  days = list(dow.days())
+  return tuple(frozenset(day for day in days if mask & (1 << (int(day) - 1)))
+               for mask in range(_all_days_mask + 1))
+
+def _parse_dayseq(dayseq):
+  '''Return the day mask of the given day sequence'''
+  # Convert the day sequence in a list
+  if isinstance(dayseq, str):
+    # Convert a string of days into a list of days
+    if dayseq.find(',') > 0:
+      _dayseq = list()
+      for curday in dayseq.split(','):
+        if len(curday) > 1:
+          for chkday in curday:
+            if '0' <= chkday <= '7':
+              _dayseq.append(chkday)
+        elif '0' <= curday <= '7':
+          _dayseq.append(curday)
+    elif dayseq[0].isdigit():
+      _dayseq = [num for num in dayseq if '0' <= num <= '7']
+    elif len(dayseq) % 3 == 0:
+      _dayseq = [dayseq[num:num+3] for num in range(0, len(dayseq), 3)]
+    else:
+      raise ValueError('Unable to handle day sequence')
+  elif isinstance(dayseq, int):
+    _dayseq = [dayseq]
+  elif isinstance(dayseq, (tuple, list, set, frozenset)):
+    _dayseq = dayseq
+  else:
+    raise ValueError('Unable to handle non-iterable day sequence')
+
+  # Process each element of the list in turn.
+  mask, bits = 0, DaySequence._dow_bits
+  for curday in _dayseq:
+    if isinstance(curday, (int, str)):
+      mask |= bits[curday]
+  
+  # Check that there is at least one day in the resultant mask
+  if not mask:
+    raise ValueError('Day sequence contains no valid days')
+  return mask
+
+# Provide a bounded cache of parsed day sequences, as input files repeat a small
+# number of day sequences many times
+_parse_dayseq_cached = lru_cache(maxsize=1024, typed=True)(_parse_dayseq)
+
+
 class DaySequence:
   '''Class providing the day sequence handling which ensures that days of the
-     week are kept in ISO order, (Monday=1).
+     week are kept in ISO order, (Monday=1). The days are stored as a 7 bit mask,
+     with the lowest bit being Monday, and the set of days of each of the possible
+     masks is shared between all instances.
 
      The class will accept day sequences in the following formats:
 
@@ -240,99 +731,243 @@ class DaySequence:
        - a sequence or string comprising the days in full seperated by commas;
        - a sequence or string comprising the short days seperated by commas. 
   '''
-  # Provide a default of all days
+  __slots__ = ('_mask',)
+
+  # Provide the bit of each day, and the set of days for each mask, for the default
+  # of all days
   _dow = DayOfWeek()
-  _def_days = set(_dow.days())
+  _dow_bits = {key: 1 << (int(day) - 1) for key, day in _dow._dow_dict.items()}
+  _mask_days = _mask_day_sets(_dow)
+  _def_days = _mask_days[_all_days_mask]
+  _interned = None
   
   def __init__(self, days=None):
-    self.days = self.parse(days) if days else self._def_days  
+    self._mask = self._parse_mask(days) if days else _all_days_mask
+
+  @classmethod
+  def interned(cls, days=None):
+    '''Return the shared, unmodifiable, instance holding the given DAYS'''
+    if isinstance(days, _FrozenDaySequence):
+      return days
+    return cls._interned[cls._parse_mask(days) if days else _all_days_mask]
   
+  @classmethod
+  def _parse_mask(cls, dayseq):
+    '''Return the day mask of the given day sequence, using the parse cache for
+       strings, integers and sequences of hashable days
+    '''
+    if isinstance(dayseq, DaySequence):
+      # Copy the day sequence from another instance
+      return dayseq._mask
+    elif isinstance(dayseq, (str, int)):
+      return _parse_dayseq_cached(dayseq)
+    elif isinstance(dayseq, (tuple, list)):
+      key = tuple(dayseq)
+    elif isinstance(dayseq, (set, frozenset)):
+      key = frozenset(dayseq)
+    else:
+      return _parse_dayseq(dayseq)
+    try:
+      return _parse_dayseq_cached(key)
+    except TypeError:
+      # The sequence contains unhashable elements so cannot be cached
+      return _parse_dayseq(dayseq)
+
+  @staticmethod
+  def parse_cache_info():
+    '''Return the hits, misses, maximum size and current size of the parse cache'''
+    return _parse_dayseq_cached.cache_info()
+
+  @staticmethod
+  def parse_cache_clear():
+    '''Remove all the entries from the parse cache'''
+    _parse_dayseq_cached.cache_clear()
+
   def parse(self, dayseq):
     '''Handle the days string which can either be a sequence of digits from 1 to 7,
        (Monday is 1), or alternatively a sequence of the first three characters of
        the day in the local locale.
     '''
-    # Convert the day sequence in a list
-    if isinstance(dayseq, DaySequence):
-      # Copy the day sequence from another instance
-      return dayseq.days.copy()
-    elif isinstance(dayseq, str):
-      # Convert a string of days into a list of days
-      if dayseq.find(',') > 0:
-        _dayseq = list()
-        for curday in dayseq.split(','):
-          if len(curday) > 1:
-            for chkday in curday:
-              if '0' <= chkday <= '7':
-                _dayseq.append(chkday)
-          elif '0' <= curday <= '7':
-            _dayseq.append(curday)
-      elif dayseq[0].isdigit():
-        _dayseq = [num for num in dayseq if '0' <= num <= '7']
-      elif len(dayseq) % 3 == 0:
-        _dayseq = [dayseq[num:num+3] for num in range(0, len(dayseq), 3)]
-      else:
-        raise ValueError('Unable to handle day sequence')
-    elif isinstance(dayseq, int):
-      _dayseq = [dayseq]
-    elif isinstance(dayseq, (tuple, list, set)):
-      _dayseq = dayseq
-    else:
-      raise ValueError('Unable to handle non-iterable day sequence')
+    return self._mask_days[self._parse_mask(dayseq)]
 
-    # Process each element of the list in turn.
-    days = set()
-    for curday in _dayseq:
-      if isinstance(curday, (int, str)):
-        days.add(self._dow[curday])
-    
-    # Check that there is at least one day in the resultant set
-    if not days:
-      raise ValueError('Day sequence contains no valid days')
-    
-    # Return the default dow set if all days were parsed
-    return days if len(days) != 7 else self._def_days
+  @property
+  def days(self):
+    '''Return the set of days in the sequence'''
+    return self._mask_days[self._mask]
+
+  @property
+  def mask(self):
+    '''Return the day mask, with the lowest bit being Monday'''
+    return self._mask
 
   def add_days(self, dayseq):
     'Add the given day sequence to the current day sequence'
-    self.days.update(self.parse(dayseq))
+    self._mask |= self._parse_mask(dayseq)
     
   def remove_days(self, dayseq):
     'Remove the given day sequence from the current day sequence'
-    self.days.difference_update(self.parse(dayseq))
+    self._mask &= ~self._parse_mask(dayseq)
+
+  def __contains__(self, day):
+    'Check whether the given day is within the day sequence'
+    return bool(self._mask & self._dow_bits.get(day, 0))
     
   def __eq__(self, other):
     'Check whether two DaySequence objects have the same days'
     if isinstance(other, DaySequence):
-      return self.days == other.days
+      return self._mask == other._mask
     else:
-      ods = DaySequence(other)
-      return self.days == ods.days
+      return self._mask == (self._parse_mask(other) if other else _all_days_mask)
+
+  # The days of an instance may be changed, so only the shared instances are hashable
+  __hash__ = None
+
+  def __repr__(self):
+    return "{}('{}')".format(self.__class__.__name__,
+                             ''.join(str(num) for num in range(1, 8) if self._mask & (1 << (num - 1))))
+
+
+class _FrozenDaySequence(DaySequence):
+  '''Class providing the shared instances of DaySequence, one for each possible mask,
+     which cannot be modified and so can be used as dictionary keys'''
+  __slots__ = ()
+
+  def __hash__(self):
+    return hash(self._mask)
+
+  def add_days(self, dayseq):
+    raise TypeError('Unable to modify a shared day sequence')
+
+  def remove_days(self, dayseq):
+    raise TypeError('Unable to modify a shared day sequence')
+
+  def __reduce__(self):
+    return (_shared_dayseq, (self._mask,))
+
+
+def _shared_dayseq(mask):
+  '''Return the shared DaySequence instance for the given MASK'''
+  return DaySequence._interned[mask]
+
+def _make_shared_dayseq(mask):
+  dayseq = object.__new__(_FrozenDaySequence)
+  dayseq._mask = mask
+  return dayseq
+
+DaySequence._interned = tuple(_make_shared_dayseq(mask) for mask in range(_all_days_mask + 1))
 
 
 class _BaseDayInfo:
-  '''Class providing shared functionality'''
+  '''Class providing shared functionality. Instances are interned, so that creating
+     an instance with the same values as an existing instance returns the existing
+     instance, and are never modified, with with_days and without_days returning the
+     instance that holds the changed days, leaving any other holders unaffected.
+  '''
+  __slots__ = ('_title', '_days', '_copies', '_category', '_key', '_text', '__weakref__')
+  _fields = ('_title', '_days', '_copies', '_category', '_key')
+
+  # Provide the interned instances, keyed on the class and values of each instance
+  _interned = WeakValueDictionary()
+
+  def __new__(cls, *args, **kwds):
+    try:
+      key = cls._intern_key(*args, **kwds)
+    except TypeError:
+      # Leave the initialiser to report the invalid arguments
+      key = None
+    inst = _BaseDayInfo._interned.get(key) if key is not None else None
+    if inst is None:
+      inst = super().__new__(cls)
+      inst._key = key
+    return inst
+
+  @classmethod
+  def _intern_key(cls, name, dayseq=None, num_copies=1, category=None):
+    return cls._make_key(name, dayseq, num_copies, category or 'Newspaper')
+
+  @classmethod
+  def _make_key(cls, name, dayseq, num_copies, category, *extra):
+    '''Return the key of an instance with the given values, or None if invalid'''
+    if not isinstance(name, str) or name == '' or not isinstance(num_copies, int) or num_copies < 1:
+      return None
+    mask = DaySequence._parse_mask(dayseq) if dayseq else _all_days_mask
+    return (cls, name, mask, num_copies, category) + extra
+
   def __init__(self, name, dayseq=None, num_copies=1, category=None):
+    if self._is_interned():
+      return
+
     # Validate the arguments
     if not isinstance(name, str) or name == '':
       raise TypeError('Must provide a name for the information')
-    _days = DaySequence(dayseq)
+    _days = DaySequence.interned(dayseq)
     if num_copies < 1:
       raise TypeError('Must provide a positive number of copies')
     
     # Store the information for use later
-    self._title = name
+    self._title = sys.intern(name)
     self._days = _days
     self._copies = num_copies
     self._category = category or 'Newspaper'
+    self._intern()
+
+  def _is_interned(self):
+    '''Check if this instance is the interned instance for its values'''
+    return self._key is not None and _BaseDayInfo._interned.get(self._key) is self
+
+  def _intern(self):
+    '''Make this instance the interned instance for its values, unless already present'''
+    if self._key is not None:
+      _BaseDayInfo._interned.setdefault(self._key, self)
+
+  def _with_mask(self, mask):
+    '''Return the instance holding the same values as this instance but the days
+       given by MASK'''
+    if mask == self._days._mask:
+      return self
+    key = self._key[:2] + (mask,) + self._key[3:] if self._key is not None else None
+    inst = _BaseDayInfo._interned.get(key) if key is not None else None
+    if inst is None:
+      inst = object.__new__(self.__class__)
+      for field in self._fields:
+        setattr(inst, field, getattr(self, field))
+      inst._days = DaySequence._interned[mask]
+      inst._key = key
+      inst._intern()
+    return inst
+
+  def _fingerprint_text(self):
+    '''Return the text identifying the values of this instance in a fingerprint, which
+       is kept as the values of an instance do not change'''
+    try:
+      return self._text
+    except AttributeError:
+      self._text = self._fingerprint_values()
+      return self._text
+
+  def _fingerprint_values(self):
+    return repr((self.__class__.__name__, self._title, self._days._mask, self._copies,
+                 self._category))
+
+  def __reduce__(self):
+    '''Support pickling, restoring the interned instance when already present'''
+    return (_restore_dayinfo, (self.__class__, {field: getattr(self, field) for field in self._fields}))
     
-  def add_days(self, days):
-    'Add a sequence of days to the current days'
-    self._days.add_days(days)
+  def with_days(self, days):
+    'Return the instance delivered on the given sequence of days and the current days'
+    return self._with_mask(self._days._mask | DaySequence._parse_mask(days))
     
+  def without_days(self, days):
+    'Return the instance delivered on the current days without the given sequence of days'
+    return self._with_mask(self._days._mask & ~DaySequence._parse_mask(days))
+
+  def add_days(self, days):
+    raise TypeError('Unable to modify a shared {}, use with_days instead'.format(
+                    self.__class__.__name__))
+
   def remove_days(self, days):
-    'Remove a sequence of days from the current days'
-    self._days.remove_days(days)
+    raise TypeError('Unable to modify a shared {}, use without_days instead'.format(
+                    self.__class__.__name__))
     
   @property
   def days(self):
@@ -345,24 +980,58 @@ class _BaseDayInfo:
   @property
   def is_everyday(self):
     '''Return whether delivery is everyday'''
-    return self._days.days is self._days._def_days   # TODO Check if this true
+    return self._days._mask == _all_days_mask
+
+
+def _restore_dayinfo(cls, state):
+  '''Recreate a pickled _BaseDayInfo, returning the interned instance when present'''
+  key = state.get('_key')
+  inst = _BaseDayInfo._interned.get(key) if key is not None else None
+  if inst is None:
+    inst = object.__new__(cls)
+    for field, value in state.items():
+      setattr(inst, field, value)
+    inst._intern()
+  return inst
   
   
 class PaperInfo(_BaseDayInfo):
   '''Class representing an individual paper'''
+  __slots__ = ()
+
+  @classmethod
+  def _intern_key(cls, name, dayseq=None, num_copies=1):
+    return cls._make_key(name, dayseq, num_copies, 'Newspaper')
+
   def __init__(self, name, dayseq=None, num_copies=1):
     super().__init__(name, dayseq, num_copies=num_copies, category='Newspaper')
 
 
 class MagazineInfo(_BaseDayInfo):
   '''Class representing an individual magazine'''
+  __slots__ = ('_frequency',)
+  _fields = _BaseDayInfo._fields + ('_frequency',)
+
+  @classmethod
+  def _intern_key(cls, name, dayseq, frequency=None):
+    return cls._make_key(name, dayseq, 1, 'Magazine', frequency or "W")
+
   def __init__(self, name, dayseq, frequency=None):
-    super().__init__(name, dayseq, num_copies=1, category='Magazine')
+    if self._is_interned():
+      return
     self._frequency = frequency or "W"
+    super().__init__(name, dayseq, num_copies=1, category='Magazine')
+
+  def _fingerprint_values(self):
+    return repr((self.__class__.__name__, self._title, self._days._mask, self._frequency))
 
 
 class HouseInfo:
-  '''Class representing a house within a round'''
+  '''Class representing a house within a round, the days on which a box is used being
+     held as a day mask, with 0 when no box is used, and the TitleTotals of the rounds
+     that hold the house being told of changes to its titles'''
+  __slots__ = ('_house', '_road', '_titles', '_use_box', '_totals')
+
   def __init__(self, name_or_number, road, paper, use_box=None):
     # Validate the arguments
     if isinstance(name_or_number, int):
@@ -379,25 +1048,75 @@ class HouseInfo:
     
     # Store the information for use later
     self._house = name_or_number
-    self._road = road
+    self._road = sys.intern(road)
     self._titles = PaperList(paper)
+    self._totals = ()
+    self._use_box = 0
     if use_box:
       if isinstance(use_box, bool):
         if use_box == True:
-          self._use_box = DaySequence()
+          self._use_box = _all_days_mask
       else:
-        self._use_box = DaySequence(use_box)
+        self._use_box = DaySequence._parse_mask(use_box)
 
   def __eq__(self, other):
     '''Check if this instance matches the other instance'''
     if not isinstance(other, HouseInfo):
       return False
     return self._house == other._house and self._road == other._road
+
+  def __hash__(self):
+    return hash((self._house, self._road))
+
+  def __getstate__(self):
+    '''Support pickling and copying, leaving out the TitleTotals told of changes'''
+    state = {name: getattr(self, name) for name in self.__slots__}
+    state['_totals'] = ()
+    return None, state
   
+  @property
+  def use_box(self):
+    '''Return the days on which a box is used, or None if a box is never used'''
+    return DaySequence._interned[self._use_box] if self._use_box else None
+
   def flags(self, dayseq=None):
-    '''Return the current flags for the given day sequence'''
-    return 'use_box' if hasattr(self, '_use_box') else None # TODO Implement a more correct solution
-  
+    '''Return the flags for the given day sequence, which defaults to every day, with
+       'use_box' given when a box is used on all the days in the sequence'''
+    mask = DaySequence._parse_mask(dayseq) if dayseq else _all_days_mask
+    return 'use_box' if self._use_box & mask == mask else None
+
+  def _rebind_title(self, title, func):
+    '''Replace the entry for TITLE with the result of FUNC, leaving the shared entry unchanged'''
+    paper = self._titles[title]
+    new = self._titles[self._titles.index(paper)] = func(paper)
+    for totals in self._watchers():
+      totals._change_paper(self, paper, new)
+
+  def _watchers(self):
+    '''Return the TitleTotals that are told of changes to the titles of this house,
+       dropping any that have been released'''
+    watchers = [totals for totals in (item() for item in self._totals) if totals is not None]
+    if len(watchers) != len(self._totals):
+      self._totals = tuple(ref(totals) for totals in watchers)
+    return watchers
+
+  def _watch(self, totals, watch=True):
+    '''Start telling TOTALS of changes to the titles of this house, or stop when WATCH
+       is not set. The totals are held weakly, so that those of a discarded round are
+       released, and any that have been released are dropped.'''
+    kept = [item for item in self._totals if item() is not None and item() is not totals]
+    if watch:
+      kept.append(ref(totals))
+    self._totals = tuple(kept)
+
+  def add_days(self, title, dayseq):
+    '''Add the given day sequence to the delivery of TITLE to this house'''
+    self._rebind_title(title, lambda paper: paper.with_days(dayseq))
+
+  def remove_days(self, title, dayseq):
+    '''Remove the given day sequence from the delivery of TITLE to this house'''
+    self._rebind_title(title, lambda paper: paper.without_days(dayseq))
+
   def title_iter(self):
     '''Generator returning each of the paperinfo entries for house'''
     for paper in self._titles:
@@ -406,6 +1125,8 @@ class HouseInfo:
 
 class OrderInfo:
   '''Class representing an entry in the order of a round'''
+  __slots__ = ('_house', '_road')
+
   def __init__(self, name_or_number, road):
     # Validate the arguments
     if not isinstance(name_or_number, (str, int)):
@@ -421,16 +1142,36 @@ class OrderInfo:
     
     # Store the information for use later
     self._house = name_or_number
-    self._road = road
+    self._road = sys.intern(road)
+
+  def __eq__(self, other):
+    '''Check if this instance refers to the same house'''
+    if not isinstance(other, OrderInfo):
+      return False
+    return self._house == other._house and self._road == other._road
+
+  def __hash__(self):
+    return hash((self._house, self._road))
 
 
 class _LimitList(list):
   '''Mixin providing extra functionality over a normal list object,
      which limits the addition of elements to a particular instance
      of object and adds comparison that checks each element.'''
+  # Hold the element type and name in slots, so that a list holding no further
+  # attributes, such as the PaperList of each house, does not create a dictionary
+  __slots__ = ('_type', '_name', '_version', '_digests', '__dict__')
+
+  # Provide the functions returning the text of an element used in the fingerprint, and
+  # in the digest compared by __eq__ when that only compares part of an element, with
+  # lists that do not provide them not being fingerprinted
+  _elem_text = None
+  _elem_eq_text = None
+
   def __init__(self, type_, name, elems=None):
     self._type = type_
     self._name = name
+    self._version = 0
     
     # Invoke the actual initialiser
     super().__init__()
@@ -441,14 +1182,40 @@ class _LimitList(list):
     
   def _all(self, elems, except_=ValueError, _flatten=True):
     '''Check if any elements are not of the correct type for this instance'''
-    act_elems = self._flatten(elems, except_=except_) if _flatten else elems
+    if _flatten:
+      # Both ways of flattening only provide elements of the correct type
+      act_elems = self._flat(elems)
+      if act_elems is None:
+        act_elems = self._flatten(elems, except_=except_)
+    else:
+      act_elems = elems
     if not act_elems and except_:
       raise except_("Must provide a sequence with at least one '{}' instance".format(self._name))
-    if any([not isinstance(elem, self._type) for elem in act_elems]):
-      if except_:
-        raise except_("Must provide a sequence of '{}' instances".format(self._name))
-      return None
+    if not _flatten:
+      type_ = self._type
+      for elem in act_elems:
+        if not isinstance(elem, type_):
+          if except_:
+            raise except_("Must provide a sequence of '{}' instances".format(self._name))
+          return None
     return act_elems
+
+  def _flat(self, elems):
+    '''Return the elements of a single element, or of a flat list or tuple of elements,
+       including one that is the only argument, all of the correct type for this
+       instance, otherwise None so that the elements are flattened instead'''
+    type_ = self._type
+    if isinstance(elems, type_):
+      return (elems,)
+    if not isinstance(elems, (tuple, list)):
+      return None
+    if len(elems) == 1 and isinstance(elems[0], (tuple, list)):
+      elems = elems[0]
+    for elem in elems:
+      if not isinstance(elem, type_):
+        return None
+    # Avoid returning this instance, which the caller may go on to modify
+    return elems if elems is not self else list(elems)
     
   def _flatten(self, elems, except_=None, _res_elems=None):
     '''Flatten the elements into a single sequence of elements'''
@@ -470,41 +1237,181 @@ class _LimitList(list):
     '''Perform an append of a single object controlled by this instance'''
     if not isinstance(elem, self._type):
       raise ValueError("All elements must be '{}' instances".format(self._name))
-    super().append(elem)
+    self._extend((elem,))
     
   def extend(self, *elems):
     '''Perform an extend of a sequence of objects controlled by this instance'''
-    super().extend(self._all(elems, except_=ValueError))
+    self._extend(self._all(elems, except_=ValueError))
     
   def __iadd__(self, elems):
     '''Perform an inline append of the given elements of type controlled by this instance'''
-    super().extend(self._all(elems, except_=ValueError))
+    self._extend(self._all(elems, except_=ValueError))
     return self
   
   def remove(self, elems):
-    '''Remove the given element(s) of the correct type for this instance'''
-    for elem in self._all(elems, except_=ValueError):
-      super().remove(elem)
+    '''Remove the first occurrence of each of the given element(s) of the correct type
+       for this instance, many elements being removed in a single pass over the list
+       after checking that all of them are present'''
+    act_elems = self._all(elems, except_=ValueError)
+    if len(act_elems) > 1:
+      try:
+        remaining = Counter(act_elems)
+        keep, removed = list(), list()
+        for item in self:
+          (removed if _take(remaining, item) else keep).append(item)
+      except TypeError:
+        # The elements cannot be hashed so are removed in turn
+        pass
+      else:
+        if any(remaining.values()):
+          raise ValueError('list.remove(x): x not in list')
+        self._replace(keep, removed)
+        return self
+    for elem in act_elems:
+      self._remove(elem)
     return self
 
+  def _extend(self, elems):
+    '''Add the given elements, which have already been checked, to the end of the list'''
+    self._version += 1
+    list.extend(self, elems)
+
+  def _remove(self, elem):
+    '''Remove the first occurrence of the given element, which has already been checked'''
+    self._version += 1
+    list.remove(self, elem)
+
+  def _replace(self, elems, removed=None):
+    '''Replace all the elements with the given elements, which have already been checked,
+       REMOVED optionally giving the elements no longer present'''
+    self._version += 1
+    list.__setitem__(self, slice(None), elems)
+
+  def _digest_version(self, eq=False):
+    '''Return the version of the contents covered by the digest'''
+    return self._version
+
+  def _cached_digest(self, eq=False):
+    '''Return the digest that is kept, if the contents have not since changed, or None'''
+    eq = eq and self._elem_eq_text is not None
+    cached = getattr(self, '_digests', {}).get(eq)
+    if cached is not None and cached[0] == self._digest_version(eq):
+      return cached[1]
+    return None
+
+  def _digest(self, eq=False):
+    '''Return the digest of the elements, EQ giving the digest of only the parts compared
+       by __eq__, which is kept until the contents are changed'''
+    if self._elem_text is None:
+      raise TypeError("Unable to fingerprint a list of '{}' instances".format(self._name))
+    try:
+      digests = self._digests
+    except AttributeError:
+      digests = self._digests = dict()
+    eq = eq and self._elem_eq_text is not None
+    version = self._digest_version(eq)
+    cached = digests.get(eq)
+    if cached is not None and cached[0] == version:
+      return cached[1]
+    text = self._elem_eq_text if eq else self._elem_text
+    digest = blake2b('\x1e'.join(map(text, self)).encode(), digest_size=16).digest()
+    digests[eq] = (version, digest)
+    return digest
+
+  def fingerprint(self):
+    '''Return the stable fingerprint of the contents of the list, as a hexadecimal string,
+       which is the same for lists with the same contents in any process. The digest of
+       the parts compared by __eq__ is also kept, so that comparing two lists that have
+       been fingerprinted does not need to compare their elements.'''
+    self._digest(eq=True)
+    return self._digest().hex()
+
+  def _trusted_extend(self, elems):
+    '''Add the given elements without checking them, for use by the builders within
+       the package that already guarantee the elements are of the correct type'''
+    self._extend(elems if isinstance(elems, (tuple, list)) else list(elems))
+
+  @classmethod
+  def _trusted(cls, elems):
+    '''Return a new instance holding the given elements without checking them'''
+    obj = cls()
+    obj._trusted_extend(elems)
+    return obj
+
   def insert(self, index, element):
     '''Insert the given element of the correct type for this instance'''
     if isinstance(element, (list, tuple)) or not isinstance(element, self._type):
       raise ValueError("Must pass a single instance of '{}'".format(self._name))
     super().insert(index, element)
+    self._version += 1
+
+  def pop(self, index=-1):
+    self._version += 1
+    return super().pop(index)
+
+  def clear(self):
+    self._version += 1
+    super().clear()
+
+  def __setitem__(self, index, value):
+    self._version += 1
+    super().__setitem__(index, value)
+
+  def __delitem__(self, index):
+    self._version += 1
+    super().__delitem__(index)
+
+  def __imul__(self, count):
+    self._version += 1
+    return super().__imul__(count)
+
+  def sort(self, *args, **kwds):
+    self._version += 1
+    super().sort(*args, **kwds)
+
+  def reverse(self):
+    self._version += 1
+    super().reverse()
     
   def __contains__(self, elems):
-    '''Perform a check if all elements are present in the associated list'''
+    '''Perform a check if all elements are present in the associated list, many
+       elements being found in a single pass over the list'''
     act_elems = self._all(elems, except_=ValueError)
+    if len(act_elems) > 1:
+      try:
+        wanted = set(act_elems)
+        for item in self:
+          wanted.discard(item)
+          if not wanted:
+            return True
+        return False
+      except TypeError:
+        # The elements cannot be hashed so are found in turn
+        pass
     for elem in act_elems:
       if not super().__contains__(elem):
         return False
     return True
       
+  def __reduce__(self):
+    '''Support pickling, restoring the attributes before the elements are restored'''
+    state = dict(self.__dict__, _type=self._type, _name=self._name, _version=0)
+    return (_rebuild_limitlist, (self.__class__, state, list(self)))
+
+  def __ne__(self, other):
+    if not isinstance(other, list):
+      return True
+    return not self.__eq__(other)
+
   def __eq__(self, other):
     '''Check if both objects are of the correct instance and elements are also correct'''
     if len(self) != len(other):
       return False
+    if self._elem_text is not None and type(other) is type(self):
+      mine, theirs = self._cached_digest(eq=True), other._cached_digest(eq=True)
+      if mine is not None and theirs is not None:
+        # The digests cover exactly the parts of the elements that are compared
+        return mine == theirs
     for selem, oelem in zip(self, other):
       if not isinstance(selem, self._type) or not isinstance(oelem, self._type):
         return False
@@ -512,37 +1419,199 @@ class _LimitList(list):
         return False
     return True  
 
+
+def _take(remaining, item):
+  '''Take one from the count of ITEM in REMAINING, returning whether it was present'''
+  count = remaining.get(item)
+  if count:
+    remaining[item] = count - 1
+    return True
+  return False
+
+def _rebuild_limitlist(cls, state, elems):
+  '''Recreate a pickled _LimitList from its attributes and elements'''
+  obj = list.__new__(cls)
+  for name, value in state.items():
+    setattr(obj, name, value)
+  obj._trusted_extend(elems)
+  return obj
+
     
 class HouseList(_LimitList):
-  '''Class providing a list limited to instances of HouseInfo'''
+  '''Class providing a list limited to instances of HouseInfo, which keeps an index of
+     the houses present, keyed on the house and road, so that finding a house and
+     checking whether it is present do not search the list. The index holds the first
+     matching house in the list and the number of matching houses.
+  '''
   def __init__(self, houses=None):
+    self._index = dict()
     super().__init__(HouseInfo, 'HouseInfo', houses)
 
+  @staticmethod
+  def _elem_text(house):
+    return '{!r}\x1f{}'.format((house._house, house._road, house._use_box),
+                               '\x1f'.join([paper._fingerprint_text() for paper in house._titles]))
+
+  @staticmethod
+  def _elem_eq_text(house):
+    return repr((house._house, house._road))
+
+  def _digest_version(self, eq=False):
+    '''Return the version of the houses, and for the fingerprint of their titles, which
+       only increases as the titles of any house are changed'''
+    if eq:
+      return self._version
+    return self._version, sum(house._titles._version for house in self)
+
+  def _extend(self, elems):
+    '''Add the given houses to the end of the list and the index'''
+    self._version += 1
+    list.extend(self, elems)
+    index = self._index
+    for elem in elems:
+      key = (elem._house, elem._road)
+      entry = index.get(key)
+      if entry is None:
+        index[key] = [elem, 1]
+      else:
+        entry[1] += 1
+
+  def _remove(self, elem):
+    '''Remove the first occurrence of the given house from the list and the index'''
+    key = (elem._house, elem._road)
+    if key not in self._index:
+      raise ValueError('list.remove(x): x not in list')
+    self._version += 1
+    list.remove(self, elem)
+    self._unindex(key)
+
+  def _replace(self, elems, removed=None):
+    '''Replace all the houses with the given houses, removing the REMOVED houses from
+       the index when given, otherwise rebuilding the index'''
+    if removed is None:
+      list.clear(self)
+      self._index = dict()
+      self._extend(elems)
+    else:
+      self._version += 1
+      list.__setitem__(self, slice(None), elems)
+      for elem in removed:
+        self._unindex((elem._house, elem._road))
+
+  def _unindex(self, key):
+    '''Remove one occurrence of the house given by KEY from the index'''
+    entry = self._index[key]
+    entry[1] -= 1
+    if entry[1] == 0:
+      del self._index[key]
+    else:
+      entry[0] = self._first(key)
+
+  def _first(self, key):
+    '''Return the first house in the list matching the given KEY'''
+    for item in self:
+      if (item._house, item._road) == key:
+        return item
+
+  def _reindex(self):
+    '''Rebuild the index from the houses in the list'''
+    self._replace(list(self))
+
+  def _substitute(self, index, house):
+    '''Replace the house at INDEX by HOUSE, which has the same key, without rebuilding
+       the index'''
+    old = list.__getitem__(self, index)
+    list.__setitem__(self, index, house)
+    self._version += 1
+    entry = self._index[(house._house, house._road)]
+    if entry[0] is old:
+      entry[0] = house
+
+  def insert(self, index, element):
+    '''Insert the given house, updating the index'''
+    super().insert(index, element)
+    key = (element._house, element._road)
+    entry = self._index.get(key)
+    if entry is None:
+      self._index[key] = [element, 1]
+    else:
+      entry[0] = self._first(key)
+      entry[1] += 1
+
+  def pop(self, index=-1):
+    '''Remove and return the house at the given position, updating the index'''
+    elem = super().pop(index)
+    self._unindex((elem._house, elem._road))
+    return elem
+
+  def clear(self):
+    '''Remove all the houses and the index'''
+    super().clear()
+    self._index.clear()
+
+  def __setitem__(self, index, value):
+    super().__setitem__(index, value)
+    self._reindex()
+
+  def __delitem__(self, index):
+    super().__delitem__(index)
+    self._reindex()
+
+  def __imul__(self, count):
+    super().__imul__(count)
+    self._reindex()
+    return self
+
+  def sort(self, *args, **kwds):
+    super().sort(*args, **kwds)
+    self._reindex()
+
+  def reverse(self):
+    super().reverse()
+    self._reindex()
+
+  def __reduce__(self):
+    '''Support pickling, rebuilding the index as the houses are restored'''
+    rebuild, (cls, state, elems) = super().__reduce__()
+    state['_index'] = dict()
+    return (rebuild, (cls, state, elems))
+
+  def __contains__(self, elems):
+    '''Check whether all the given houses are present using the index'''
+    if isinstance(elems, HouseInfo):
+      return (elems._house, elems._road) in self._index
+    index = self._index
+    return all((elem._house, elem._road) in index
+               for elem in self._all(elems, except_=ValueError))
+
   def __getitem__(self, house):
     if isinstance(house, HouseInfo):
-      for item in self:
-        if house == item:
-          return item
+      entry = self._index.get((house._house, house._road))
+      return entry[0] if entry is not None else None
     elif isinstance(house, int):
-      for item in self:
-        if house == 0:
-          return item
-        house -= 1
+      return super().__getitem__(house) if 0 <= house < len(self) else None
     else:
       raise ValueError("Must pass either an integer or instance of 'HouseInfo'")
-    return None
 
     
 class OrderList(_LimitList):
   '''Class providing a list limited to instances of OrderInfo'''
   def __init__(self, orders=None):
     super().__init__(OrderInfo, 'OrderInfo', orders)
+
+  @staticmethod
+  def _elem_text(order):
+    return repr((order._house, order._road))
     
 
 class PaperList(_LimitList):
   '''Class providing a list limited to instances of _BaseDayInfo'''
   def __init__(self, papers=None):
     super().__init__(_BaseDayInfo, 'PaperInfo', papers)
+
+  @staticmethod
+  def _elem_text(paper):
+    return paper._fingerprint_text()
       
   def __getitem__(self, name_or_number):
     '''Retrieve an element by index or name'''
@@ -556,6 +1625,334 @@ class PaperList(_LimitList):
     else:
       raise ValueError("Must pass an integer or string to use as index")
 
+
+def _nearest_stop(stop, keys, numbers, position):
+  '''Return the key of the stop that STOP is to be placed next to, and whether it is
+     placed before that stop, given the KEYS of the stops of its road, their sorted
+     house NUMBERS and the function giving the POSITION of a key. This is the stop of
+     the same road with the nearest house number, the last stop of the road when no
+     house numbers can be compared, or None to place it at the end of the order when
+     the road has no stops'''
+  if not keys:
+    return None, False
+  if numbers and isinstance(stop._house, int):
+    num = bisect(numbers, stop._house)
+    if num and (num == len(numbers) or
+                stop._house - numbers[num - 1] <= numbers[num] - stop._house):
+      return (numbers[num - 1], stop._road), False
+    return (numbers[num], stop._road), True
+  return max(keys, key=position), False
+
+
+class _OrderBlocks:
+  '''Class providing the stops of an order held in blocks of limited size, so that a
+     stop is inserted or removed, and its position found, without shifting or searching
+     the whole order. Each stop is found from its key through the block holding it, the
+     position of a block from the running totals of the block sizes, and the stops of a
+     road from the keys and sorted house numbers held for the road.
+  '''
+  __slots__ = ('blocks', 'numbers', 'totals', 'where', 'roads', 'houses', 'version', 'dirty')
+  _block_size = 64
+
+  def __init__(self, order):
+    size, stops = self._block_size, list(order)
+    self.blocks = [stops[num:num + size] for num in range(0, len(stops), size)] or [[]]
+    self.where = dict()
+    self.roads = dict()
+    self.houses = dict()
+    for block in self.blocks:
+      for stop in block:
+        self._add_key((stop._house, stop._road), block)
+    self._renumber()
+    self.version = order._version
+    self.dirty = False
+
+  def _renumber(self):
+    '''Rebuild the numbers and running totals of the blocks, which is needed only when
+       a block is split or dropped'''
+    self.numbers = {id(block): num for num, block in enumerate(self.blocks)}
+    self.totals = _Fenwick(len(block) for block in self.blocks)
+
+  def _add_key(self, key, block):
+    '''Record a stop with the given KEY held in BLOCK'''
+    entry = self.where.get(key)
+    if entry is None:
+      self.where[key] = [block, 1]
+      self.roads.setdefault(key[1], dict())[key] = None
+      if isinstance(key[0], int):
+        insort(self.houses.setdefault(key[1], []), key[0])
+    else:
+      entry[1] += 1
+
+  def __len__(self):
+    return self.totals.before(len(self.blocks))
+
+  def __contains__(self, key):
+    return key in self.where
+
+  def stops(self):
+    '''Return the list of stops in order'''
+    return [stop for block in self.blocks for stop in block]
+
+  @staticmethod
+  def _index(block, key):
+    '''Return the index of the first stop in BLOCK with the given KEY, or None'''
+    for num, stop in enumerate(block):
+      if stop._house == key[0] and stop._road == key[1]:
+        return num
+    return None
+
+  def _find(self, key):
+    '''Return the block holding the stop with the given KEY and the index of the stop
+       within the block, searching the other blocks only for a key that has been held
+       more than once'''
+    entry = self.where[key]
+    num = self._index(entry[0], key)
+    if num is None:
+      for block in self.blocks:
+        num = self._index(block, key)
+        if num is not None:
+          entry[0] = block
+          break
+    return entry[0], num
+
+  def position(self, key):
+    '''Return the position of the stop with the given KEY within the order'''
+    block, num = self._find(key)
+    return self.totals.before(self.numbers[id(block)]) + num
+
+  def insert(self, stop, anchor=None, before=False):
+    '''Insert STOP after, or BEFORE, the stop with the key ANCHOR, or at the end of the
+       order when ANCHOR is None'''
+    if anchor is None:
+      block = self.blocks[-1]
+      num = len(block)
+    else:
+      block, num = self._find(anchor)
+      num += 0 if before else 1
+    block.insert(num, stop)
+    self._add_key((stop._house, stop._road), block)
+    index = self.numbers[id(block)]
+    self.totals.add(index, 1)
+    if len(block) > 2 * self._block_size:
+      tail = block[self._block_size:]
+      del block[self._block_size:]
+      self.blocks.insert(index + 1, tail)
+      for stop in tail:
+        entry = self.where[(stop._house, stop._road)]
+        if entry[0] is block:
+          entry[0] = tail
+      self._renumber()
+    self.dirty = True
+
+  def nearest(self, stop):
+    '''Return the key of the stop that STOP is to be placed next to, and whether it is
+       placed before that stop, see _nearest_stop'''
+    return _nearest_stop(stop, self.roads.get(stop._road), self.houses.get(stop._road),
+                         self.position)
+
+  def insert_near(self, stop):
+    '''Insert STOP next to the nearest stop of the same road, see nearest'''
+    self.insert(stop, *self.nearest(stop))
+
+  def remove(self, key):
+    '''Remove the first stop with the given KEY from the order'''
+    block, num = self._find(key)
+    del block[num]
+    entry = self.where[key]
+    entry[1] -= 1
+    if not entry[1]:
+      del self.where[key]
+      road = self.roads[key[1]]
+      del road[key]
+      if not road:
+        del self.roads[key[1]]
+      if isinstance(key[0], int):
+        numbers = self.houses[key[1]]
+        del numbers[bisect_left(numbers, key[0])]
+    index = self.numbers[id(block)]
+    self.totals.add(index, -1)
+    if not block and len(self.blocks) > 1:
+      del self.blocks[index]
+      self._renumber()
+    self.dirty = True
+
+
+class _Route:
+  '''Class providing the houses of a round in delivery order, resolved from the order
+     by a single join against the index of the houses. Each stop of the order holds the
+     matching house, or None when the house is not in the round, while the houses that
+     are not in the order are held, in the order they are found, as unordered.
+  '''
+  __slots__ = ('stops', 'positions', 'unordered', 'versions')
+
+  def __init__(self, houses, order):
+    index = houses._index
+    self.stops = list()
+    self.positions = dict()
+    for num, stop in enumerate(order):
+      key = (stop._house, stop._road)
+      self.positions.setdefault(key, []).append(num)
+      entry = index.get(key)
+      self.stops.append(entry[0] if entry is not None else None)
+    self.unordered = dict()
+    for house in houses:
+      key = (house._house, house._road)
+      if key not in self.positions:
+        self.unordered.setdefault(key, house)
+    self.versions = self.state(houses, order)
+
+  @staticmethod
+  def state(houses, order):
+    '''Return the state of HOUSES and ORDER that the route was resolved from'''
+    return id(houses), houses._version, id(order), order._version
+
+  def add(self, house, houses):
+    '''Update the route after the given HOUSE was added to HOUSES'''
+    key = (house._house, house._road)
+    positions = self.positions.get(key)
+    if positions is None:
+      self.unordered.setdefault(key, house)
+    else:
+      for num in positions:
+        if self.stops[num] is None:
+          self.stops[num] = house
+    self.versions = (id(houses), houses._version) + self.versions[2:]
+
+  def remove(self, house, houses):
+    '''Update the route after the given HOUSE was removed from HOUSES, using any
+       matching house that remains'''
+    key = (house._house, house._road)
+    remains = houses[house]
+    positions = self.positions.get(key)
+    if positions is None:
+      if remains is None:
+        self.unordered.pop(key, None)
+      else:
+        self.unordered[key] = remains
+    else:
+      for num in positions:
+        self.stops[num] = remains
+    self.versions = (id(houses), houses._version) + self.versions[2:]
+
+
+# Select whether the title totals of a round are checked against a full count after
+# every change, as given by the PYDELIVERY_DEBUG_TOTALS environment variable
+_debug_totals = os.environ.get('PYDELIVERY_DEBUG_TOTALS', '0') not in ('', '0')
+
+# Provide the index of each day, with Monday being 0, for each of the possible day masks
+_mask_indices = tuple(tuple(num for num in range(7) if mask >> num & 1)
+                      for mask in range(_all_days_mask + 1))
+
+class TitleTotals:
+  '''Class providing the copies of each title needed by a round on each day of the
+     week, starting with Monday. The totals are kept up to date as houses are added
+     to and removed from the round by add_house and rem_house, and as the days of the
+     titles of a house are changed by add_days and remove_days, so that reading them
+     does not go through the houses. They are counted again when next read if the
+     houses of the round are otherwise changed. When debug is set, which defaults to
+     the PYDELIVERY_DEBUG_TOTALS environment variable, the totals are checked against
+     a full count after every change and when read.
+  '''
+  debug = _debug_totals
+
+  def __init__(self, roundinfo):
+    self._round = roundinfo
+    self._recount()
+
+  @staticmethod
+  def _add_paper(counts, paper, sign=1):
+    '''Add, or with a negative SIGN remove, the copies of PAPER to COUNTS, a title
+       only having a row while a paper delivered on at least one day is counted'''
+    if not paper._days._mask:
+      return
+    row = counts.get(paper._title)
+    if row is None:
+      row = counts[paper._title] = [0] * 7
+    copies = paper._copies * sign
+    for num in _mask_indices[paper._days._mask]:
+      row[num] += copies
+    if sign < 0 and not any(row):
+      del counts[paper._title]
+
+  @classmethod
+  def _count(cls, houses):
+    '''Return the copies of each title needed by the given HOUSES on each day'''
+    counts = dict()
+    for house in houses:
+      for paper in house._titles:
+        cls._add_paper(counts, paper)
+    return counts
+
+  def _recount(self):
+    '''Count the totals over all the houses of the round'''
+    houses = self._round._houses
+    for house in houses:
+      house._watch(self)
+    self._counts = self._count(houses)
+    self._version = houses._version
+
+  def _synced(self):
+    '''Return whether the totals match the houses of the round'''
+    return self._version == self._round._houses._version
+
+  def _change_house(self, house, sign, new=None):
+    '''Update the totals after HOUSE was added to, or with a negative SIGN removed from,
+       the round, when the totals matched the round before the change, NEW giving the
+       house added in its place'''
+    for paper in house._titles:
+      self._add_paper(self._counts, paper, sign)
+    house._watch(self, sign > 0)
+    if new is not None:
+      return self._change_house(new, 1)
+    self._version = self._round._houses._version
+    if self.debug:
+      self.verify()
+
+  def _change_paper(self, house, old, new):
+    '''Update the totals after the OLD entry of a title of HOUSE was replaced by NEW'''
+    if not self._synced() or self._round._houses[house] is not house:
+      return
+    self._add_paper(self._counts, old, -1)
+    self._add_paper(self._counts, new)
+    if self.debug:
+      self.verify()
+
+  def _current(self):
+    '''Return the totals, counting them again if the houses were otherwise changed'''
+    if not self._synced():
+      self._recount()
+    elif self.debug:
+      self.verify()
+    return self._counts
+
+  def verify(self):
+    '''Check the totals against a full count over the houses of the round'''
+    if self._synced() and self._count(self._round._houses) != self._counts:
+      raise RuntimeError("Title totals of round '{}' differ from a full count".format(
+                         self._round._name))
+
+  def __getitem__(self, title):
+    '''Return the copies of the given TITLE needed on each day of the week'''
+    return tuple(self._current()[title])
+
+  def __contains__(self, title):
+    return title in self._current()
+
+  def __iter__(self):
+    return iter(list(self._current()))
+
+  def __len__(self):
+    return len(self._current())
+
+  def day(self, day):
+    '''Return a dictionary giving the copies of each title needed on the given DAY'''
+    mask = DaySequence._parse_mask(day)
+    if mask & (mask - 1):
+      raise ValueError('Must provide a single day for the totals')
+    num = _mask_indices[mask][0]
+    return {title: row[num] for title, row in self._current().items() if row[num]}
+
       
 class RoundInfo:
   '''Class representing an entire round'''
@@ -581,12 +1978,136 @@ class RoundInfo:
       self._order = order
     else:
       self._order = order if isinstance(order, OrderList) else OrderList(order)
+    self._resolved = None
+    self._digests = dict()
+    self._totals = None
+
+  @property
+  def _order(self):
+    '''The OrderList of the round, or None, brought up to date with the stops inserted
+       or removed by add_house and rem_house since it was last used'''
+    blocks = self._blocks
+    if blocks is not None and blocks.dirty:
+      self._order_list._replace(blocks.stops())
+      blocks.version, blocks.dirty = self._order_list._version, False
+    return self._order_list
+
+  @_order.setter
+  def _order(self, order):
+    self._order_list = order
+    self._blocks = None
+
+  def _has_order(self):
+    '''Return whether the round has an order with at least one stop'''
+    blocks = self._blocks
+    if blocks is not None and blocks.dirty:
+      return len(blocks) > 0
+    return bool(self._order_list)
+
+  def _order_blocks(self):
+    '''Return the blocks of the order used to insert and remove stops, which are built
+       when first needed and rebuilt if the order has otherwise been changed'''
+    blocks = self._blocks
+    if blocks is None or (not blocks.dirty and blocks.version != self._order_list._version):
+      blocks = self._blocks = _OrderBlocks(self._order_list)
+    return blocks
+
+  def __getstate__(self):
+    state = self.__dict__.copy()
+    state['_order_list'] = self._order
+    state['_blocks'] = None
+    state['_totals'] = None
+    return state
+
+  def totals(self):
+    '''Return the TitleTotals of the round, which are counted when first needed and
+       then kept up to date'''
+    if self._totals is None:
+      self._totals = TitleTotals(self)
+    return self._totals
+
+  def _synced_totals(self):
+    '''Return the TitleTotals of the round when they match its houses, otherwise None'''
+    totals = self._totals
+    return totals if totals is not None and totals._synced() else None
+
+  def _digest_state(self, eq=False):
+    '''Return the state of the round covered by the digest'''
+    return (self._number, self._name, id(self._houses), self._houses._digest_version(eq),
+            id(self._order), self._order._version if self._order else None)
+
+  def _cached_digest(self, eq=False):
+    '''Return the digest that is kept, if the round has not since changed, or None'''
+    cached = self._digests.get(eq)
+    if cached is not None and cached[0] == self._digest_state(eq):
+      return cached[1]
+    return None
+
+  def _digest(self, eq=False):
+    '''Return the digest of the round, EQ giving the digest of only the parts compared by
+       __eq__, which is kept until the round is changed'''
+    state = self._digest_state(eq)
+    cached = self._digests.get(eq)
+    if cached is not None and cached[0] == state:
+      return cached[1]
+    text = '{!r}\x1e{}\x1e{}'.format((self._number, self._name), self._houses._digest(eq).hex(),
+                                     self._order._digest(eq).hex() if self._order else '')
+    digest = blake2b(text.encode(), digest_size=16).digest()
+    self._digests[eq] = (state, digest)
+    return digest
+
+  def fingerprint(self):
+    '''Return the stable fingerprint of the contents of the round, as a hexadecimal
+       string, which is the same for rounds with the same contents in any process, so
+       that an unchanged round can be found without comparing its contents. As for
+       _LimitList, comparing two rounds that have been fingerprinted uses their digests.'''
+    self._digest(eq=True)
+    return self._digest().hex()
+  
+  def _route(self):
+    '''Return the resolved route of the round, which is built when first needed and
+       kept up to date by add_house and rem_house, being rebuilt if the houses or order
+       are otherwise changed'''
+    route, order = self._resolved, self._order
+    if route is None or route.versions != _Route.state(self._houses, order):
+      route = self._resolved = _Route(self._houses, order)
+    return route
+
+  def route_iter(self):
+    '''Generator providing the houses of this round in delivery order, those not in the
+       order following the ordered houses, or the houses when there is no order'''
+    if not self._order:
+      yield from self._houses
+      return
+    route = self._route()
+    for house in route.stops:
+      if house is not None:
+        yield house
+    yield from route.unordered.values()
+
+  def orphans(self):
+    '''Return the entries of the order for which the house is not in the round'''
+    if not self._order:
+      return []
+    return [stop for stop, house in zip(self._order, self._route().stops) if house is None]
+
+  def unordered(self):
+    '''Return the houses of the round that are not in the order, when there is one'''
+    if not self._order:
+      return []
+    return list(self._route().unordered.values())
   
   def house_iter(self):
     '''Generator providing the houses within this round'''
     for house in self._houses:
       yield house
       
+  def flags(self, dayseq=None):
+    '''Return the flags of every house in the round for the given day sequence, which
+       defaults to every day, in the order given by house_iter'''
+    mask = DaySequence._parse_mask(dayseq) if dayseq else _all_days_mask
+    return ['use_box' if house._use_box & mask == mask else None for house in self._houses]
+
   def order_iter(self):
     '''Generator providing the order of houses in this round'''
     if self._order:
@@ -603,6 +2124,10 @@ class RoundInfo:
     '''Compare the attributes of both objects to see if they are equal'''
     if not isinstance(other, self.__class__):
       return False
+    mine, theirs = self._cached_digest(eq=True), other._cached_digest(eq=True)
+    if mine is not None and theirs is not None:
+      # The digests cover exactly the parts of the rounds that are compared
+      return mine == theirs
     if self._number != other._number:
       return False
     if self._name != other._name:
@@ -621,8 +2146,11 @@ class RoundInfo:
       return False
     return True
   
-  def add_house(self, house, order=None):
-    '''Add a house to the current round, unless it is already present'''
+  def add_house(self, house, order=None, before=False):
+    '''Add a house to the current round, unless it is already present. When the round
+       has an order, a stop for the house is placed after the given ORDER, an OrderInfo
+       of a stop in the order, or BEFORE it, and otherwise next to the nearest house in
+       the same road, unless the house already has a stop'''
     # Validate the house
     if not isinstance(house, HouseInfo):
       raise ValueError('Can only add instances of HouseInfo')
@@ -632,14 +2160,37 @@ class RoundInfo:
       raise ValueError('House is already present in round')
   
     # Check if the order, if provided, is valid
-    if isinstance(order, OrderInfo):
-      pass    # TODO Implement ordering of houses
+    blocks = self._order_blocks() if self._has_order() else None
+    key = (house._house, house._road)
+    if order is not None:
+      if not isinstance(order, OrderInfo):
+        raise ValueError('Must pass an instance of OrderInfo as the order')
+      anchor = (order._house, order._road)
+      if blocks is None or anchor not in blocks:
+        raise ValueError("House '{}' in road '{}' not present in order".format(*anchor))
+      if key in blocks:
+        raise ValueError('House is already present in order')
       
-    # Add to the list of internal list of houses
+    # Add to the list of internal list of houses and to the totals, placing it in the
+    # order when needed and otherwise updating the route when resolved
+    totals = self._synced_totals()
     self._houses.append(house)
+    if totals is not None:
+      totals._change_house(house, 1)
+    if blocks is not None and key not in blocks:
+      stop = OrderInfo(house._house, house._road)
+      if order is None:
+        blocks.insert_near(stop)
+      else:
+        blocks.insert(stop, anchor, before)
+      self._resolved = None
+    elif self._resolved is not None and blocks is not None:
+      self._resolved.add(house, self._houses)
 
-  def rem_house(self, house):    
-    '''Remove a house from the current round, unless it is not present'''
+  def rem_house(self, house, order=False):
+    '''Remove a house from the current round, unless it is not present. When ORDER is
+       set, the stop for the house is also removed from the order, unless another house
+       with the same number and road remains'''
     # Validate the house
     if not isinstance(house, HouseInfo):
       raise ValueError('Can only remove instances of HouseInfo')
@@ -648,8 +2199,91 @@ class RoundInfo:
     if house not in self._houses:
       raise ValueError('House not present in round')
     
-    # Remove from the list of houses
+    # Remove from the list of houses and from the totals, removing the stop when needed
+    # and otherwise updating the route when resolved
+    totals, removed = self._synced_totals(), self._houses[house]
     self._houses.remove(house)
+    if totals is not None:
+      totals._change_house(removed, -1)
+    key, has_order = (house._house, house._road), self._has_order()
+    blocks = self._order_blocks() if order and has_order else None
+    if blocks is not None and key in blocks and self._houses[house] is None:
+      blocks.remove(key)
+      self._resolved = None
+    elif self._resolved is not None and has_order:
+      self._resolved.remove(house, self._houses)
+
+  def replace_house(self, house, new):
+    '''Replace a house of the current round by NEW, which must have the same number
+       and road, keeping its position in the round'''
+    # Validate the houses
+    if not isinstance(house, HouseInfo) or not isinstance(new, HouseInfo):
+      raise ValueError('Can only replace instances of HouseInfo')
+    if house != new:
+      raise ValueError('Replacement house must have the same number and road')
+    
+    # Check if house not present within the round
+    old = self._houses[house]
+    if old is None:
+      raise ValueError('House not present in round')
+
+    # Replace the entry of the list of houses, updating the totals and the route
+    totals = self._synced_totals()
+    num = next(num for num, item in enumerate(self._houses) if item is old)
+    self._houses._substitute(num, new)
+    if totals is not None:
+      totals._change_house(old, -1, new)
+    if self._resolved is not None and self._has_order():
+      self._resolved.remove(new, self._houses)
+
+  def _apply_changes(self, removed, changed, added, stops, delta):
+    '''Apply the changes recorded by a RoundOverlay in a single pass over the houses,
+       REMOVED and CHANGED mapping the key of a house to the house removed or to its
+       replacement, ADDED giving the houses to add, STOPS the stops to insert in turn
+       with the key of the stop each is placed next to and whether it is placed before
+       it, and DELTA the change in the copies of each title on each day'''
+    totals = self._synced_totals()
+    houses = self._houses
+    gone, replaced = list(), list()
+    if removed or changed:
+      kept = list()
+      for house in houses:
+        key = (house._house, house._road)
+        if key in removed:
+          gone.append(house)
+        elif key in changed:
+          replaced.append(house)
+          kept.append(changed[key])
+        else:
+          kept.append(house)
+      houses._replace(kept, gone)
+      for house in replaced:
+        entry = houses._index[(house._house, house._road)]
+        if entry[0] is house:
+          entry[0] = changed[(house._house, house._road)]
+    if added:
+      houses._extend(added)
+    if stops:
+      blocks = self._order_blocks()
+      for stop, anchor, before in stops:
+        blocks.insert(stop, anchor, before)
+    self._resolved = None
+
+    # Update the totals with the changes, when they matched the round before
+    if totals is not None:
+      for title, row in delta.items():
+        total = totals._counts.setdefault(title, [0] * 7)
+        for num, copies in enumerate(row):
+          total[num] += copies
+        if not any(total):
+          del totals._counts[title]
+      for house in gone + replaced:
+        house._watch(totals, False)
+      for house in list(changed.values()) + list(added):
+        house._watch(totals)
+      totals._version = houses._version
+      if totals.debug:
+        totals.verify()
 
     
 # Provide some specialisations for known papers or magazines
@@ -665,28 +2299,116 @@ _Round_locals = dict(RoundInfo    = RoundInfo,
                      HasStandard  = HasStandard,  HasStandard2 = HasStandard2,
                     )
 
-def load_round(name):
-  '''Load the round information with a restricted list of objects, then tidy up.'''
-  
-  # Load the round information from the given NAME file
-  with open(name, 'rt') as fd:
-    code = fd.read()
-    
-  # Create a new namespace from a copy of the locals dictionary
-  round_dict = _Round_locals.copy()
-  exec(code, globals(), round_dict)
-  
-  # Mark the original locals to be removed from the dictionary
-  rem_name = set(_Round_locals)
-  
-  # Add any items that are not RoundInfo instances
-  for name in round_dict:
-    if not isinstance(round_dict[name], RoundInfo):
-      rem_name.add(name)
-      
-  # Remove the items which correspond to the remembered names
-  for name in rem_name:
-    del round_dict[name]
+# Provide the literal values that may be used by a round file
+_Round_literals = (str, int, float, bool, type(None))
+
+def _round_fault(node, name, fault=None):
+  '''Return the ValueError raised for the FAULT found at the NODE of the round file NAME,
+     being the type of the NODE that cannot be handled if not given'''
+  fault = fault or "Unable to handle '{}'".format(type(node).__name__)
+  return ValueError("{} on line {} of '{}'".format(fault, node.lineno, name))
+
+def _eval_round(tree, name):
+  '''Build the objects assigned by the round file NAME from its module TREE, which may
+     only assign the results of calls to the objects of _Round_locals, with literal, list
+     and tuple arguments, to names, or give expressions of these, such as a docstring.
+     Only these nodes are evaluated, so that nothing else in the file can be run.'''
+  round_dict = _trusted_locals()
+  calls = {id(value): value for value in round_dict.values() if callable(value)}
+
+  def use(node, key):
+    if key.startswith('__'):
+      raise _round_fault(node, name, "Unable to use the name '{}'".format(key))
+    return key
+
+  def value(node):
+    kind = type(node)
+    if kind is ast.Constant:
+      if not isinstance(node.value, _Round_literals):
+        raise _round_fault(node, name, 'Unable to handle a constant that is not a literal')
+      return node.value
+    if kind is ast.Name:
+      try:
+        return round_dict[use(node, node.id)]
+      except KeyError:
+        raise NameError("The name '{}' is not defined on line {} of '{}'".format(
+                        node.id, node.lineno, name)) from None
+    if kind is ast.Call:
+      func = value(node.func) if type(node.func) is ast.Name else None
+      if id(func) not in calls:
+        raise _round_fault(node, name, 'Unable to call anything but a round object')
+      if any(keyword.arg is None for keyword in node.keywords):
+        raise _round_fault(node, name, "Unable to handle '**'")
+      return func(*[value(arg) for arg in node.args],
+                  **{keyword.arg: value(keyword.value) for keyword in node.keywords})
+    if kind is ast.List:
+      return [value(elem) for elem in node.elts]
+    if kind is ast.Tuple:
+      return tuple(value(elem) for elem in node.elts)
+    if (kind is ast.UnaryOp and type(node.op) in (ast.USub, ast.UAdd) and
+        type(node.operand) is ast.Constant and type(node.operand.value) in (int, float)):
+      return -node.operand.value if type(node.op) is ast.USub else node.operand.value
+    raise _round_fault(node, name)
 
-  # Return the resultant dictionary of RoundInfo objects
+  for stmt in tree.body:
+    kind = type(stmt)
+    if kind is ast.Assign and all(type(target) is ast.Name for target in stmt.targets):
+      result = value(stmt.value)
+      for target in stmt.targets:
+        round_dict[use(target, target.id)] = result
+    elif kind is ast.Expr:
+      value(stmt.value)
+    else:
+      raise _round_fault(stmt, name)
   return round_dict
+
+def _trusted_locals():
+  '''Return the objects available to a round file, with the constructors replaced by
+     functions that share the papers made from the same arguments and hold lists of
+     checked elements without checking them again'''
+  papers = dict()
+  def paper_type(cls):
+    def paper(*args, **kwds):
+      key = (cls, args, tuple(kwds.items()))
+      try:
+        inst = papers.get(key)
+      except TypeError:
+        return cls(*args, **kwds)
+      if inst is None:
+        inst = papers[key] = cls(*args, **kwds)
+      return inst
+    return paper
+
+  def checked(elems, type_):
+    return type(elems) is list and elems and all(isinstance(elem, type_) for elem in elems)
+
+  def house(name_or_number, road, paper, use_box=None):
+    if not checked(paper, _BaseDayInfo):
+      return HouseInfo(name_or_number, road, paper, use_box)
+    inst = HouseInfo(name_or_number, road, None, use_box)
+    inst._titles = PaperList._trusted(paper)
+    return inst
+
+  def round_(number, name, houses=None, order=None):
+    if checked(houses, HouseInfo):
+      houses = HouseList._trusted(houses)
+    if checked(order, OrderInfo):
+      order = OrderList._trusted(order)
+    return RoundInfo(number, name, houses, order)
+
+  return dict(_Round_locals, RoundInfo=round_, HouseInfo=house,
+              PaperInfo=paper_type(PaperInfo), MagazineInfo=paper_type(MagazineInfo))
+
+def _round_dict(round_dict):
+  '''Return the RoundInfo instances assigned by a round file from its namespace'''
+  return {name: value for name, value in round_dict.items()
+          if name not in _Round_locals and isinstance(value, RoundInfo)}
+
+def load_round(name):
+  '''Load the round information from the file NAME, which may only assign the results
+     of calls to the objects of _Round_locals with literal arguments, returning the
+     dictionary of the RoundInfo instances assigned. The file is parsed and its calls
+     made directly, without running it, the objects being built through trusted paths.'''
+  with open(name, 'rt') as fd:
+    tree = ast.parse(fd.read(), name)
+  return _round_dict(_eval_round(tree, name))
@@ -0,0 +1,62 @@
+'''
+This module provides the pick list, which gives the order in which the titles for each
+house are to be bundled, following the order of the titles within a TitleMap and its
+placement of magazines relative to the papers.
+'''
+
+# Detail the list of objects that will be exported by default
+__all__ = ('PickList',)
+
+class PickList:
+  '''Class providing the order in which the titles for each house are picked. The
+     TitleMap is turned into integer sort keys, one per title, which are kept until
+     the mapping of the TitleMap is changed. Titles not present in the TitleMap are
+     picked after those that are, in the order they appear for the house.
+  '''
+  def __init__(self, titlemap):
+    self._titlemap = titlemap
+    self._snapshot = None
+    self._version = None
+    self._title_keys = None
+    self._category_keys = None
+    self._unknown = 0
+
+  def _sort_keys(self):
+    '''Return the title and category sort keys, rebuilding them if the TitleMap changed'''
+    map_ = self._titlemap._map
+    version = getattr(map_, '_version', None)
+    if map_ is not self._snapshot or version != self._version or version is None:
+      self._title_keys = {title: num for num, title in enumerate(map_)}
+      stride = self._unknown = len(self._title_keys)
+      stride += 1
+      order = self._titlemap._order or ()
+      self._category_keys = {category: num * stride for num, category in enumerate(order)}
+      self._default_category = len(order) * stride
+      self._snapshot, self._version = map_, version
+    return self._title_keys, self._category_keys
+
+  def sort_key(self, paper):
+    '''Return the integer sort key of the given PAPER'''
+    title_keys, category_keys = self._sort_keys()
+    return (category_keys.get(paper._category, self._default_category) +
+            title_keys.get(paper._title, self._unknown))
+
+  def _key_func(self):
+    '''Return a function providing the sort key of a paper from the current keys'''
+    title_keys, category_keys = self._sort_keys()
+    get_title, get_category = title_keys.get, category_keys.get
+    unknown, default = self._unknown, self._default_category
+    return lambda paper: get_category(paper._category, default) + get_title(paper._title, unknown)
+
+  def bundle(self, house):
+    '''Return the titles of the given HOUSE in the order they are to be picked'''
+    return sorted(house._titles, key=self._key_func())
+
+  def round_bundles(self, roundinfo):
+    '''Generator returning each house of the given ROUNDINFO, in delivery order, with its
+       titles in the order they are to be picked, using a single set of sort keys for
+       the round
+    '''
+    key = self._key_func()
+    for house in roundinfo.route_iter():
+      yield house, sorted(house._titles, key=key)
@@ -0,0 +1,118 @@
+'''
+This module provides the persistent registry that assigns the integer values that are
+stored in the application database for roads and titles, so that the value used for a
+key does not change between runs of the parseround program.
+'''
+
+import os
+
+try:
+  import fcntl
+except ImportError:
+  fcntl = None
+
+# Detail the list of objects that will be exported by default
+__all__ = ('IdRegistry',)
+
+class IdRegistry:
+  '''Class providing a registry of keys stored in a file, with each key being assigned
+     the next integer value the first time it is seen. The file holds one key per line,
+     the value of a key being its line number, and is only ever appended to so that a
+     value never changes once it has been assigned. Appends are made holding an
+     exclusive lock on the file, where the platform provides one, after reading the
+     keys appended by any other registry using the same file.
+  '''
+  _encoding = 'utf-8'
+
+  def __init__(self, path):
+    self._path = os.fspath(path)
+    self._ids = dict()
+    self._keys = list()
+    self._size = 0
+    self._load()
+
+  def _load(self):
+    '''Read the keys from the registry file'''
+    try:
+      fd = open(self._path, 'rb')
+    except FileNotFoundError:
+      return
+    with fd:
+      self._read(fd)
+
+  def _read(self, fd):
+    '''Read the keys of the complete lines of the open registry file FD beyond those
+       already read, returning the length of any partial line that follows them'''
+    fd.seek(self._size)
+    data = fd.read()
+    end = data.rfind(b'\n') + 1
+    if end:
+      keys = data[:end].decode(self._encoding).split('\n')
+      keys.pop()
+      ids, all_keys = self._ids, self._keys
+      for key in keys:
+        ids.setdefault(key, len(all_keys))
+        all_keys.append(key)
+      self._size += end
+    return len(data) - end
+
+  def _append(self, keys):
+    '''Append those of the KEYS not yet in the registry file using a single write,
+       holding the lock on the file while the keys appended by other registries are
+       read, so that the new keys are assigned the values following them'''
+    with open(self._path, 'a+b') as fd:
+      if fcntl is not None:
+        # The lock is released when the file is closed
+        fcntl.flock(fd.fileno(), fcntl.LOCK_EX)
+      if self._read(fd):
+        # Drop the partial line left by an interrupted append, which cannot be one in
+        # progress while the lock is held
+        fd.truncate(self._size)
+      keys = [key for key in keys if key not in self._ids]
+      if keys:
+        data = ''.join(key + '\n' for key in keys).encode(self._encoding)
+        fd.write(data)
+        fd.flush()
+        for key in keys:
+          self._ids[key] = len(self._keys)
+          self._keys.append(key)
+        self._size += len(data)
+
+  def __len__(self):
+    return len(self._keys)
+
+  def __contains__(self, key):
+    return key in self._ids
+
+  def __getitem__(self, key):
+    '''Return the value assigned to the given KEY'''
+    return self._ids[key]
+
+  def key(self, ident):
+    '''Return the key that was assigned the given IDENT value'''
+    if ident < 0:
+      raise KeyError("Value '{}' not present in registry".format(ident))
+    try:
+      return self._keys[ident]
+    except IndexError:
+      raise KeyError("Value '{}' not present in registry".format(ident))
+
+  def lookup(self, keys, default=None):
+    '''Return the values of all the given KEYS, using DEFAULT for unknown keys'''
+    get = self._ids.get
+    return [get(key, default) for key in keys]
+
+  def assign(self, keys):
+    '''Return the values of all the given KEYS, assigning new values to unknown keys
+       and appending them to the registry file
+    '''
+    keys, get, new_keys = list(keys), self._ids.get, dict()
+    for key in keys:
+      if get(key) is None and key not in new_keys:
+        if not isinstance(key, str) or not key or '\n' in key:
+          raise ValueError("Key '{}' must be a non-empty single line string".format(key))
+        new_keys[key] = None
+    if new_keys:
+      self._append(new_keys)
+    ids = self._ids
+    return [ids[key] for key in keys]
@@ -0,0 +1,136 @@
+'''
+This module expands the frequency of a title into the dates on which it is delivered
+within a range of dates, the dates being provided as NumPy datetime64[D] arrays. The
+frequency of a MagazineInfo is one of:
+
+  W       every week, on each of the days of the title
+  <n>W    every n weeks, counting from the week holding the anchor date, such as 2W
+  M       every month, on the occurrence of each day of the title that is in the same
+          week of the month as the anchor date, such as the second Thursday
+  M<n>    every month, on the n-th occurrence (1 to 5) of each day of the title
+  ML      every month, on the last occurrence of each day of the title
+
+Titles without a frequency, such as a PaperInfo, are delivered every week. The dates of
+each distinct rule, days and range are calculated once and shared, as many subscriptions
+use the same rule. NumPy is only imported when the dates are first calculated.
+'''
+
+from collections import Counter
+from datetime import date
+from functools import lru_cache
+import re
+from .demand import TitleDemand, _numpy, _round_list, _title_rows
+
+# Detail the list of objects that will be exported by default
+__all__ = ('DatedDemand', 'delivery_dates', 'dated_demand')
+
+# Provide the patterns of the frequencies that are understood
+_weekly_re = re.compile(r'([1-9][0-9]*)?W$')
+_monthly_re = re.compile(r'M([1-5]|L)?$')
+
+# Offset that gives the weekday, with Monday being 0, of a count of days since 1970-01-01
+_epoch_weekday = 3
+_epoch_ordinal = date(1970, 1, 1).toordinal()
+
+@lru_cache(maxsize=256)
+def _parse_frequency(frequency):
+  '''Return the kind ('W' or 'M') and step of the given FREQUENCY. The step of a weekly
+     frequency is the number of weeks, that of a monthly frequency the occurrence of the
+     day within the month, with 0 using the anchor date and -1 the last occurrence.'''
+  match = _weekly_re.match(frequency) if isinstance(frequency, str) else None
+  if match:
+    return 'W', int(match.group(1) or 1)
+  match = _monthly_re.match(frequency) if isinstance(frequency, str) else None
+  if match:
+    step = match.group(1)
+    return 'M', -1 if step == 'L' else int(step or 0)
+  raise ValueError("Unknown delivery frequency '{}'".format(frequency))
+
+def _to_day(value):
+  '''Return the number of days since 1970-01-01 of the given date'''
+  if isinstance(value, date):
+    return value.toordinal() - _epoch_ordinal
+  import numpy as np
+  return int(np.datetime64(value, 'D').astype(np.int64))
+
+def _rule(kind, step, anchor):
+  '''Return the step and phase of the rule, with the anchor date, given as a count of
+     days, reduced to the only part that changes the dates returned'''
+  if kind == 'W':
+    return step, (anchor + _epoch_weekday) // 7 % step
+  if step == 0:
+    return (date.fromordinal(anchor + _epoch_ordinal).day - 1) // 7 + 1, 0
+  return step, 0
+
+def _expand(mask, kind, step, phase, start, end):
+  '''Return the read-only array of dates from START up to END, given as counts of days,
+     that are on the days of MASK and selected by the rule'''
+  import numpy as np
+  days = np.arange(start, end, dtype=np.int64)
+  select = ((mask >> ((days + _epoch_weekday) % 7)) & 1).astype(bool)
+  if kind == 'W':
+    if step > 1:
+      select &= (days + _epoch_weekday) // 7 % step == phase
+  else:
+    dates = days.astype('datetime64[D]')
+    months = dates.astype('datetime64[M]')
+    if step > 0:
+      select &= (dates - months.astype('datetime64[D]')).astype(np.int64) // 7 + 1 == step
+    else:
+      select &= ((months + 1).astype('datetime64[D]') - dates).astype(np.int64) <= 7
+  result = days[select].astype('datetime64[D]')
+  result.flags.writeable = False
+  return result
+
+_expand_cached = lru_cache(maxsize=4096)(_expand)
+
+def delivery_dates(info, start, end, anchor=None):
+  '''Return the dates from START up to, but not including, END on which the title given
+     by INFO is delivered. ANCHOR is a date on which the title is delivered, or is in
+     the same week of a monthly cycle, and defaults to START. The dates may be given as
+     a datetime.date, a NumPy datetime64 or an ISO 8601 string. The returned array is
+     shared between calls and is read-only.
+  '''
+  _numpy('calculate the delivery dates')
+  kind, step = _parse_frequency(getattr(info, '_frequency', 'W'))
+  start, end = _to_day(start), _to_day(end)
+  if end < start:
+    raise ValueError('The end date must not be before the start date')
+  step, phase = _rule(kind, step, start if anchor is None else _to_day(anchor))
+  return _expand_cached(info._days._mask, kind, step, phase, start, end)
+
+
+class DatedDemand(TitleDemand):
+  '''Class providing the copies of each title needed on each date, the counts being a
+     matrix with a row for each title, in the order given by titles, and a column for
+     each date, in the order given by dates, so that daily_totals provides the total
+     copies needed on each date.
+  '''
+  def __init__(self, titles, dates, counts):
+    super().__init__(titles, counts)
+    self.dates = dates
+
+
+def dated_demand(rounds, start, end, anchors=None, titlemap=None):
+  '''Return the DatedDemand of the given ROUNDS for each date from START up to, but not
+     including, END, following the frequency of each title. ANCHORS optionally maps a
+     title to its anchor date, see delivery_dates. The rows are ordered as for
+     title_demand.
+  '''
+  np = _numpy('calculate the delivery dates')
+
+  # Count each distinct title information, these being shared between houses
+  papers = Counter(paper
+                   for roundinfo in _round_list(rounds)
+                   for house in roundinfo.house_iter()
+                   for paper in house._titles)
+  rows = _title_rows(titlemap, (paper._title for paper in papers))
+
+  first = _to_day(start)
+  dates = np.arange(first, max(_to_day(end), first), dtype=np.int64).astype('datetime64[D]')
+  counts = np.zeros((len(rows), len(dates)), dtype=np.int64)
+  anchors = anchors or dict()
+  for paper, num in papers.items():
+    when = delivery_dates(paper, start, end, anchors.get(paper._title))
+    counts[rows[paper._title], when.astype(np.int64) - first] += paper._copies * num
+  return DatedDemand(rows, dates, counts)
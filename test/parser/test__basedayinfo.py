@@ -1,8 +1,7 @@
 '''
 This is the test suite for the _BaseDayInfo object.
 '''
-from pydelivery.parser.parseround import _BaseDayInfo, DaySequence
-from PySide2.QtCore import Qt
+from pydelivery.parser.parseround import _BaseDayInfo, DaySequence, Weekday
 import unittest
 
 class Test__BaseDayInfo(unittest.TestCase):
@@ -17,7 +16,7 @@ class Test__BaseDayInfo(unittest.TestCase):
     bdi = _BaseDayInfo('Name1', '12')
     self.assertIsInstance(bdi._days, DaySequence)
     self.assertEqual(bdi.is_everyday, False)
-    self.assertEqual(bdi.days, {Qt.DayOfWeek.Monday, Qt.DayOfWeek.Tuesday})
+    self.assertEqual(bdi.days, {Weekday.Monday, Weekday.Tuesday})
     self.assertEqual(bdi._copies, 1)
     self.assertEqual(bdi._category, 'Newspaper')
 
@@ -102,3 +102,16 @@ class Test_IncrMap(unittest.TestCase):
     self.assertEqual(next(imit), (3, 'd'))
     with self.assertRaises(StopIteration):
       next(imit)
+
+  def test_13_update(self):
+    im = _IncrMap()
+    im._incr('b')
+    im._update(['a', 'b', 'a'])
+    self.assertEqual(list(im), [('b', 2), ('a', 2)])
+
+  def test_14_update_str(self):
+    im = _IncrMap()
+    im._map['a'] = '1'
+    with self.assertRaises(ValueError) as e:
+      im._update(['a'])
+    self.assertEqual(e.exception.args[0], "Key 'a' value must be an integer")
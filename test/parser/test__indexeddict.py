@@ -0,0 +1,127 @@
+'''
+This module will test the _IndexedDict object that provides the ordered mapping used
+by the mapping objects, checking that positions are maintained across removals.
+'''
+
+import unittest
+from pydelivery.parser.parseround import _IndexedDict, _BaseMap
+
+class Test__IndexedDict(unittest.TestCase):
+  def test_01_init(self):
+    idm = _IndexedDict()
+    self.assertEqual(len(idm), 0)
+    self.assertEqual(list(idm), [])
+
+  def test_02_init(self):
+    idm = _IndexedDict([('a', 1), ('b', 2)])
+    self.assertEqual(list(idm.items()), [('a', 1), ('b', 2)])
+
+  def test_03_index(self):
+    idm = _IndexedDict()
+    for num, key in enumerate('abcde'):
+      idm[key] = num
+    for num, key in enumerate('abcde'):
+      with self.subTest(key=key):
+        self.assertEqual(idm.index(key), num)
+        self.assertEqual(idm.key_at(num), key)
+
+  def test_04_update(self):
+    idm = _IndexedDict([('a', 1), ('b', 2)])
+    idm['a'] = 3
+    self.assertEqual(list(idm.items()), [('a', 3), ('b', 2)])
+    self.assertEqual(idm.index('a'), 0)
+
+  def test_05_remove(self):
+    idm = _IndexedDict([('a', 1), ('b', 2), ('c', 3), ('d', 4)])
+    del idm['b']
+    self.assertEqual(list(idm), ['a', 'c', 'd'])
+    self.assertEqual(idm.index('c'), 1)
+    self.assertEqual(idm.key_at(2), 'd')
+    self.assertNotIn('b', idm)
+
+  def test_06_remove_last(self):
+    idm = _IndexedDict([('a', 1), ('b', 2)])
+    del idm['b']
+    self.assertEqual(idm._holes, 0)
+    self.assertEqual(list(idm), ['a'])
+
+  def test_07_reinsert(self):
+    idm = _IndexedDict([('a', 1), ('b', 2)])
+    del idm['a']
+    idm['a'] = 5
+    self.assertEqual(list(idm.items()), [('b', 2), ('a', 5)])
+    self.assertEqual(idm.index('a'), 1)
+
+  def test_08_compaction(self):
+    idm = _IndexedDict((num, num) for num in range(100))
+    for num in range(0, 98, 2):
+      del idm[num]
+    self.assertLessEqual(idm._holes, len(idm))
+    self.assertEqual(list(idm), [num for num in range(100) if num % 2 or num >= 98])
+    self.assertEqual(idm.index(99), len(idm) - 1)
+
+  def test_09_missing(self):
+    idm = _IndexedDict([('a', 1)])
+    with self.assertRaises(KeyError):
+      idm.index('b')
+    with self.assertRaises(KeyError):
+      del idm['b']
+    with self.assertRaises(IndexError):
+      idm.key_at(1)
+    with self.assertRaises(IndexError):
+      idm.key_at(-1)
+
+  def test_10_copy(self):
+    idm = _IndexedDict([('a', 1), ('b', 2), ('c', 3)])
+    del idm['a']
+    cpy = idm.copy()
+    cpy['d'] = 4
+    self.assertEqual(list(idm), ['b', 'c'])
+    self.assertEqual(list(cpy), ['b', 'c', 'd'])
+
+  def test_11_clear(self):
+    idm = _IndexedDict([('a', 1), ('b', 2)])
+    idm.clear()
+    self.assertEqual(len(idm), 0)
+    idm['c'] = 3
+    self.assertEqual(idm.index('c'), 0)
+
+  def test_12_basemap(self):
+    bm = _BaseMap()
+    for key in ('a', 'b', 'c', 'd'):
+      bm[key] = key
+    bm._remove('b')
+    self.assertEqual(bm._index('d'), 2)
+    self.assertEqual(bm[1], 'c')
+    self.assertEqual(list(bm.numeric_iter()), [(0, 'a'), (1, 'c'), (2, 'd')])
+    with self.assertRaises(KeyError) as e:
+      bm[3]
+    self.assertEqual(e.exception.args[0], "Element '3' does not exist")
+
+  def test_13_interleaved(self):
+    idm = _IndexedDict((num, num) for num in range(20))
+    keys = list(range(20))
+    for num in (3, 7, 0, 12, 5):
+      del idm[num]
+      keys.remove(num)
+      idm[num + 100] = num
+      keys.append(num + 100)
+      for pos, key in enumerate(keys):
+        with self.subTest(key=key):
+          self.assertEqual(idm.index(key), pos)
+          self.assertEqual(idm.key_at(pos), key)
+    del idm[105]
+    self.assertEqual(idm.key_at(len(idm) - 1), 112)
+    with self.assertRaises(IndexError):
+      idm.key_at(len(idm))
+
+  def test_14_lookup_holes(self):
+    idm = _IndexedDict((num, num) for num in range(1000))
+    for num in range(10):
+      del idm[num * 5]
+      self.assertEqual(idm.index(999), 998 - num)
+      self.assertEqual(idm.key_at(0), 1)
+    self.assertEqual(idm._holes, 10)
+    for num in range(200):
+      self.assertEqual(idm.index(999), 989)
+    self.assertEqual(idm._holes, 0)
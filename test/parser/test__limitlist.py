@@ -223,5 +223,57 @@ class Test__LimitList(unittest.TestCase):
   def test_42_contains(self):
     ll = Check_HouseList([hi1, hi2])
     self.assertTrue([hi1, hi2] in ll)
-    
-    
+
+  def test_43_pickle(self):
+    import pickle
+    ll = Check_HouseList([hi1, hi2])
+    cpy = pickle.loads(pickle.dumps(ll))
+    self.assertIsInstance(cpy, Check_HouseList)
+    self.assertEqual(cpy._name, 'HouseInfo')
+    self.assertListEqual(cpy, [hi1, hi2])
+
+  def test_44_flat(self):
+    ll = Check_HouseList()
+    self.assertEqual(ll._flat(hi1), (hi1,))
+    self.assertEqual(ll._flat(([hi1, hi2],)), [hi1, hi2])
+    self.assertEqual(ll._flat((hi1, hi2)), (hi1, hi2))
+    self.assertIsNone(ll._flat(([hi1, [hi2]],)))
+    self.assertIsNone(ll._flat([hi1, pi]))
+
+  def test_45_extend_self(self):
+    ll = Check_HouseList([hi1, hi2])
+    ll.extend(ll)
+    self.assertListEqual(ll, [hi1, hi2, hi1, hi2])
+    ll.remove(ll)
+    self.assertListEqual(ll, [])
+
+  def test_46_trusted(self):
+    ll = Check_HouseList([hi1])
+    ll._trusted_extend(iter([hi2, hi3]))
+    self.assertListEqual(ll, [hi1, hi2, hi3])
+    self.assertListEqual(Check_HouseList._trusted((hi3, hi1)), [hi3, hi1])
+
+  def test_47_contains_many(self):
+    ll = Check_HouseList([hi1, hi2, hi1])
+    self.assertTrue([hi2, hi1, hi2] in ll)
+    self.assertFalse([hi1, hi3] in ll)
+
+  def test_48_remove_many(self):
+    ll = Check_HouseList([hi1, hi2, hi1, hi3, hi1])
+    ll.remove([hi1, hi3, hi1])
+    self.assertListEqual(ll, [hi2, hi1])
+
+  def test_49_remove_many_missing(self):
+    ll = Check_HouseList([hi1, hi2, hi3])
+    with self.assertRaises(ValueError) as e:
+      ll.remove([hi1, hi1])
+    self.assertEqual(e.exception.args[0], 'list.remove(x): x not in list')
+    # The list is left unchanged when any element is not present
+    self.assertListEqual(ll, [hi1, hi2, hi3])
+
+  def test_50_unhashable(self):
+    ll = _LimitList(dict, 'dict')
+    ll.extend(({'a': 1}, {'b': 2}, {'c': 3}))
+    self.assertTrue(({'a': 1}, {'c': 3}) in ll)
+    ll.remove(({'c': 3}, {'a': 1}))
+    self.assertListEqual(ll, [{'b': 2}])
@@ -0,0 +1,57 @@
+'''
+This is the test suite for the totals of a whole depot, summed over rounds and round
+files.
+'''
+
+import unittest
+from os.path import dirname, join
+from pydelivery.parser.parseround import RoundInfo, HouseInfo, PaperInfo, load_round
+from pydelivery.parser.aggregate import DepotTotals, depot_totals
+
+filedir = dirname(__file__)
+filename = join(filedir, 'testround.inp')
+
+class Test_DepotTotals(unittest.TestCase):
+  def setUp(self):
+    self.ri1 = RoundInfo(1, 'Round1', [HouseInfo(1, 'Road1', PaperInfo('Sun', '67', num_copies=2)),
+                                       HouseInfo(2, 'Road2', PaperInfo('Mail', '1'))])
+    self.ri2 = RoundInfo(2, 'Round2', [HouseInfo(3, 'Road2', [PaperInfo('Times', '7'),
+                                                             PaperInfo('Sun', '6')])])
+
+  def test_01_rounds(self):
+    totals = depot_totals([self.ri1, self.ri2])
+    self.assertIsInstance(totals, DepotTotals)
+    self.assertEqual(list(totals.titles), ['Sun', 'Mail', 'Times'])
+    self.assertEqual(totals['Sun'], (0, 0, 0, 0, 0, 3, 2))
+    self.assertEqual(list(totals.roads), [('Road1', 1), ('Road2', 2)])
+    self.assertEqual(totals.rounds, 2)
+    self.assertEqual(totals.daily_totals(), (1, 0, 0, 0, 0, 3, 3))
+
+  def test_02_single(self):
+    totals = depot_totals(self.ri2)
+    self.assertEqual(totals['Sun'], (0, 0, 0, 0, 0, 1, 0))
+    self.assertNotIn('Mail', totals)
+    self.assertEqual(depot_totals([]).daily_totals(), (0,) * 7)
+
+  def test_03_file(self):
+    rounds = load_round(filename)
+    expected = depot_totals(rounds)
+    totals = depot_totals(filename)
+    self.assertEqual(totals.titles, expected.titles)
+    self.assertEqual(list(totals.roads), list(expected.roads))
+    self.assertEqual(totals.rounds, len(rounds))
+
+  def test_04_workers(self):
+    sources = [filename, self.ri1, filename, self.ri2, filename]
+    expected = depot_totals(sources, max_workers=1)
+    totals = depot_totals(sources, max_workers=2, min_parallel=2)
+    self.assertEqual(list(totals.titles.items()), list(expected.titles.items()))
+    self.assertEqual(list(totals.roads), list(expected.roads))
+    self.assertEqual(totals.rounds, expected.rounds)
+    self.assertEqual(totals['Sun'], tuple(3 * sun + other for sun, other in
+                                          zip(depot_totals(filename)['Sun'], (0, 0, 0, 0, 0, 3, 2))))
+
+  def test_05_bad_source(self):
+    with self.assertRaises(ValueError) as e:
+      depot_totals([self.ri1, 5])
+    self.assertEqual(e.exception.args[0], 'Must pass instances of RoundInfo or names of round files')
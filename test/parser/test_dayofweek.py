@@ -3,32 +3,36 @@ This test suite will check that the DayOfWeek object is working as expected
 '''
 
 import unittest
-from pydelivery.parser.parseround import DayOfWeek
-from PySide2.QtCore import Qt
+from pydelivery.parser.parseround import DayOfWeek, Weekday
+
+try:
+  from PySide2.QtCore import Qt
+except ImportError:
+  Qt = None
 
 class TestDayOfWeek(unittest.TestCase):
   def test_01_init(self):
     dow = DayOfWeek()
-    for day, info in (('Monday', Qt.DayOfWeek.Monday),
-                      ('Tuesday', Qt.DayOfWeek.Tuesday),
-                      ('Wednesday', Qt.DayOfWeek.Wednesday),
-                      ('Thursday', Qt.DayOfWeek.Thursday),
-                      ('Friday', Qt.DayOfWeek.Friday),
-                      ('Saturday', Qt.DayOfWeek.Saturday),
-                      ('Sunday', Qt.DayOfWeek.Sunday)):
+    for day, info in (('Monday', Weekday.Monday),
+                      ('Tuesday', Weekday.Tuesday),
+                      ('Wednesday', Weekday.Wednesday),
+                      ('Thursday', Weekday.Thursday),
+                      ('Friday', Weekday.Friday),
+                      ('Saturday', Weekday.Saturday),
+                      ('Sunday', Weekday.Sunday)):
       with self.subTest(day=day, info=info):
         self.assertEqual(dow._dow_dict[day], info)
     self.assertEqual(dow._dow_names, set(['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']))
 
   def test_02_init(self):
     dow = DayOfWeek()
-    self.assertEqual(dow.Monday, Qt.DayOfWeek.Monday)
-    self.assertEqual(dow.Tuesday, Qt.DayOfWeek.Tuesday)
-    self.assertEqual(dow.Wednesday, Qt.DayOfWeek.Wednesday)
-    self.assertEqual(dow.Thursday, Qt.DayOfWeek.Thursday)
-    self.assertEqual(dow.Friday, Qt.DayOfWeek.Friday)
-    self.assertEqual(dow.Saturday, Qt.DayOfWeek.Saturday)
-    self.assertEqual(dow.Sunday, Qt.DayOfWeek.Sunday)
+    self.assertEqual(dow.Monday, Weekday.Monday)
+    self.assertEqual(dow.Tuesday, Weekday.Tuesday)
+    self.assertEqual(dow.Wednesday, Weekday.Wednesday)
+    self.assertEqual(dow.Thursday, Weekday.Thursday)
+    self.assertEqual(dow.Friday, Weekday.Friday)
+    self.assertEqual(dow.Saturday, Weekday.Saturday)
+    self.assertEqual(dow.Sunday, Weekday.Sunday)
     
   def test_03_int(self):
     dow = DayOfWeek()
@@ -64,9 +68,35 @@ class TestDayOfWeek(unittest.TestCase):
 
   def test_09_sunday(self):
     dow = DayOfWeek()
-    self.assertEqual(dow[0], Qt.DayOfWeek.Sunday)
-    self.assertEqual(dow[7], Qt.DayOfWeek.Sunday)
+    self.assertEqual(dow[0], Weekday.Sunday)
+    self.assertEqual(dow[7], Weekday.Sunday)
     
   def test_10_contains(self):
     dow = DayOfWeek()
     self.assertEqual('Monday' in dow, True)
+
+  def test_11_backend(self):
+    with self.assertRaises(ValueError) as e:
+      DayOfWeek('gtk')
+    self.assertEqual(e.exception.args[0], "Unknown day of week backend 'gtk'")
+
+  def test_12_enum(self):
+    dow = DayOfWeek('enum')
+    self.assertIs(dow['Mon'], Weekday.Monday)
+    self.assertEqual(list(dow.days()), list(Weekday))
+    self.assertEqual(dow['Friday'], 5)
+
+
+@unittest.skipIf(Qt is None, 'PySide2 is not available')
+class TestDayOfWeek_Qt(unittest.TestCase):
+  def test_01_init(self):
+    dow = DayOfWeek('qt')
+    self.assertEqual(dow.Monday, Qt.DayOfWeek.Monday)
+    self.assertEqual(dow[0], Qt.DayOfWeek.Sunday)
+    self.assertEqual(list(dow.days())[-1], Qt.DayOfWeek.Sunday)
+
+  def test_02_adapt(self):
+    dow = DayOfWeek('qt')
+    for day in Weekday:
+      with self.subTest(day=day.name):
+        self.assertEqual(dow[day], getattr(Qt.DayOfWeek, day.name))
@@ -143,3 +143,102 @@ class TestDaySequence(unittest.TestCase):
       ds.add_days('8')
     self.assertEqual(e.exception.args[0], "Day sequence contains no valid days")
     self.assertEqual(ds.days, {1, 6})
+
+  def test_30_mask(self):
+    self.assertEqual(DaySequence('1').mask, 0x01)
+    self.assertEqual(DaySequence('7').mask, 0x40)
+    self.assertEqual(DaySequence().mask, 0x7f)
+
+  def test_31_slots(self):
+    ds = DaySequence('12')
+    with self.assertRaises(AttributeError):
+      ds.other = 1
+
+  def test_32_contains(self):
+    ds = DaySequence('135')
+    dow = DayOfWeek()
+    self.assertIn(1, ds)
+    self.assertIn('Wed', ds)
+    self.assertIn(dow.Friday, ds)
+    self.assertNotIn(2, ds)
+    self.assertNotIn('Noneday', ds)
+
+  def test_33_hash(self):
+    lookup = {DaySequence.interned('12'): 'weekday', DaySequence.interned('67'): 'weekend'}
+    self.assertEqual(lookup[DaySequence.interned('21')], 'weekday')
+    self.assertEqual(lookup[DaySequence.interned('SatSun')], 'weekend')
+    ds = DaySequence('12')
+    with self.assertRaises(TypeError):
+      hash(ds)
+    self.assertEqual(lookup[DaySequence.interned(ds)], 'weekday')
+
+  def test_34_interned(self):
+    self.assertIs(DaySequence.interned('123'), DaySequence.interned('321'))
+    self.assertIs(DaySequence.interned(), DaySequence.interned('1234567'))
+    self.assertEqual(DaySequence.interned('12'), DaySequence('12'))
+    self.assertEqual(len({id(DaySequence.interned(mask)) for mask in range(1, 8)}), 7)
+
+  def test_35_interned_frozen(self):
+    ds = DaySequence.interned('12')
+    with self.assertRaises(TypeError) as e:
+      ds.add_days('3')
+    self.assertEqual(e.exception.args[0], 'Unable to modify a shared day sequence')
+    self.assertEqual(DaySequence.interned('12').days, {1, 2})
+
+  def test_36_default_unshared(self):
+    ds = DaySequence()
+    ds.remove_days('7')
+    self.assertEqual(len(DaySequence().days), 7)
+    self.assertEqual(ds.days, {1, 2, 3, 4, 5, 6})
+
+  def test_37_pickle(self):
+    import pickle
+    ds = DaySequence.interned('246')
+    self.assertIs(pickle.loads(pickle.dumps(ds)), ds)
+    self.assertEqual(pickle.loads(pickle.dumps(DaySequence('13'))), DaySequence('13'))
+
+  def test_38_repr(self):
+    self.assertEqual(repr(DaySequence('SunMon')), "DaySequence('17')")
+
+
+class TestDaySequence_Cache(unittest.TestCase):
+  def setUp(self):
+    DaySequence.parse_cache_clear()
+
+  def test_01_hits(self):
+    for _ in range(5):
+      DaySequence('1234567')
+      DaySequence('6')
+    info = DaySequence.parse_cache_info()
+    self.assertEqual(info.misses, 2)
+    self.assertEqual(info.hits, 8)
+    self.assertEqual(info.currsize, 2)
+
+  def test_02_clear(self):
+    DaySequence('12')
+    DaySequence.parse_cache_clear()
+    self.assertEqual(DaySequence.parse_cache_info().currsize, 0)
+
+  def test_03_sequences(self):
+    self.assertEqual(DaySequence([1, 2]), DaySequence((1, 2)))
+    self.assertEqual(DaySequence({6, 7}), DaySequence(frozenset({6, 7})))
+    info = DaySequence.parse_cache_info()
+    self.assertEqual(info.misses, 2)
+    self.assertEqual(info.hits, 2)
+
+  def test_04_typed(self):
+    self.assertEqual(DaySequence(3).days, {3})
+    self.assertEqual(DaySequence('3').days, {3})
+    self.assertEqual(DaySequence.parse_cache_info().misses, 2)
+
+  def test_05_errors(self):
+    for _ in range(2):
+      with self.assertRaises(KeyError) as e:
+        DaySequence('MonTudWedFri')
+      self.assertEqual(e.exception.args[0], 'Tud')
+    self.assertEqual(DaySequence.parse_cache_info().currsize, 0)
+
+  def test_06_unhashable(self):
+    ds = DaySequence([1, [2]])
+    self.assertEqual(ds.days, {1})
+    self.assertEqual(DaySequence.parse_cache_info().currsize, 0)
@@ -0,0 +1,61 @@
+'''
+This is the test suite for the title demand matrix of one or more rounds.
+'''
+
+import unittest
+from os.path import dirname, join
+from pydelivery.parser.parseround import (load_round, RoundInfo, HouseInfo, PaperInfo,
+                                          MagazineInfo, TitleMap)
+
+try:
+  import numpy as np
+  from pydelivery.parser.demand import title_demand
+except ImportError:
+  np = None
+
+# Determine the directory in which this test is found
+filedir = dirname(__file__)
+
+@unittest.skipIf(np is None, 'numpy is not available')
+class Test_TitleDemand(unittest.TestCase):
+  def setUp(self):
+    self.ri1 = RoundInfo(1, 'Round1', [
+      HouseInfo(1, 'Road1', [PaperInfo('Sun', '123456'), PaperInfo('Mail', '7', num_copies=2)]),
+      HouseInfo(2, 'Road1', [PaperInfo('Sun', '123456'), MagazineInfo('Radio', '4')])])
+    self.ri2 = RoundInfo(2, 'Round2', [HouseInfo(3, 'Road2', PaperInfo('Mail'))])
+
+  def tearDown(self):
+    TitleMap.drop_namespace('demand')
+
+  def test_01_round(self):
+    demand = title_demand(self.ri1)
+    self.assertEqual(demand.titles, ('Sun', 'Mail', 'Radio'))
+    self.assertEqual(demand.counts.shape, (3, 7))
+    self.assertEqual(demand['Sun'].tolist(), [2, 2, 2, 2, 2, 2, 0])
+    self.assertEqual(demand['Mail'].tolist(), [0, 0, 0, 0, 0, 0, 2])
+    self.assertEqual(demand['Radio'].tolist(), [0, 0, 0, 1, 0, 0, 0])
+
+  def test_02_rounds(self):
+    demand = title_demand([self.ri1, self.ri2])
+    self.assertEqual(demand['Mail'].tolist(), [1, 1, 1, 1, 1, 1, 3])
+    self.assertEqual(demand.daily_totals().tolist(), [3, 3, 3, 4, 3, 3, 3])
+
+  def test_03_titlemap(self):
+    tm = TitleMap(namespace='demand')
+    tm.add('Times')
+    tm.add('Mail')
+    demand = title_demand(self.ri1, tm)
+    self.assertEqual(demand.titles, ('Times', 'Mail', 'Sun', 'Radio'))
+    self.assertEqual(demand['Times'].tolist(), [0] * 7)
+    self.assertEqual(demand['Mail'].tolist(), [0, 0, 0, 0, 0, 0, 2])
+
+  def test_04_empty(self):
+    demand = title_demand(RoundInfo(1, 'Round1'))
+    self.assertEqual(demand.titles, ())
+    self.assertEqual(demand.counts.shape, (0, 7))
+
+  def test_05_load_round(self):
+    demand = title_demand(load_round(join(filedir, 'testround.inp')))
+    self.assertEqual(demand['Standard'].tolist(), [0, 0, 0, 0, 14, 0, 0])
+    self.assertEqual(demand['Mail'].tolist(), [7, 7, 7, 7, 7, 8, 5])
+    self.assertNotIn('Express', demand)
@@ -157,19 +157,23 @@ class TestHouseInfo_Oper(unittest.TestCase):
   'Test the operation of the HouseInfo class'
   def test_50_use_box(self):
     hi = HouseInfo(20, 'Road1', Oper_Pi, use_box=None)
-    self.assertFalse(hasattr(hi, '_use_box'))
+    self.assertEqual(hi._use_box, 0)
+    self.assertIsNone(hi.use_box)
     
   def test_51_use_box(self):
     hi = HouseInfo(20, 'Road1', Oper_Pi, use_box=True)
-    self.assertEqual(hi._use_box, DaySequence())
+    self.assertEqual(hi._use_box, 0x7f)
+    self.assertEqual(hi.use_box, DaySequence())
     
   def test_52_use_box(self):
     hi = HouseInfo(20, 'Road1', Oper_Pi, use_box=False)
-    self.assertFalse(hasattr(hi, '_use_box'))
+    self.assertEqual(hi._use_box, 0)
+    self.assertIsNone(hi.use_box)
     
   def test_53_use_box(self):
     hi = HouseInfo(20, 'Road1', Oper_Pi, use_box='')
-    self.assertFalse(hasattr(hi, '_use_box'))
+    self.assertEqual(hi._use_box, 0)
+    self.assertIsNone(hi.use_box)
     
   def test_54_use_box(self):
     with self.assertRaises(ValueError) as e:
@@ -178,15 +182,15 @@ class TestHouseInfo_Oper(unittest.TestCase):
     
   def test_55_use_box(self):
     hi = HouseInfo(20, 'Road1', Oper_Pi, use_box='67')
-    self.assertEqual(hi._use_box, {6, 7})
+    self.assertEqual(hi.use_box, {6, 7})
     
   def test_56_use_box(self):
     hi = HouseInfo(20, 'Road1', Oper_Pi, use_box=2)
-    self.assertEqual(hi._use_box, {2})
+    self.assertEqual(hi.use_box, {2})
 
   def test_57_use_box(self):
     hi = HouseInfo(20, 'Road1', Oper_Pi, use_box=DaySequence(2))
-    self.assertEqual(hi._use_box, {2})
+    self.assertEqual(hi.use_box, {2})
     
   def test_60_title_iter(self):
     pi1 = PaperInfo('Paper1', '125')
@@ -195,3 +199,28 @@ class TestHouseInfo_Oper(unittest.TestCase):
     pi4 = PaperInfo('Paper4', '157')
     hi = HouseInfo(20, 'Road1', [pi1, pi2, pi3, pi4])
     self.assertTrue(isinstance(hi._titles, list))
+
+  def test_70_slots(self):
+    hi = HouseInfo(20, 'Road1', Oper_Pi)
+    self.assertFalse(hasattr(hi, '__dict__'))
+    with self.assertRaises(AttributeError):
+      hi._other = 1
+
+  def test_71_intern_road(self):
+    hi1 = HouseInfo(20, ''.join(['Road', '1']), Oper_Pi)
+    hi2 = HouseInfo(21, ''.join(['Road', '1']), Oper_Pi)
+    self.assertIs(hi1._road, hi2._road)
+
+  def test_72_flags(self):
+    self.assertIsNone(HouseInfo(20, 'Road1', Oper_Pi).flags())
+    self.assertEqual(HouseInfo(20, 'Road1', Oper_Pi, use_box=True).flags(), 'use_box')
+    self.assertIsNone(HouseInfo(20, 'Road1', Oper_Pi, use_box='6').flags())
+
+  def test_73_flags_per_day(self):
+    hi = HouseInfo(20, 'Road1', Oper_Pi, use_box='67')
+    self.assertEqual(hi.flags('6'), 'use_box')
+    self.assertEqual(hi.flags(7), 'use_box')
+    self.assertEqual(hi.flags('67'), 'use_box')
+    self.assertIsNone(hi.flags('5'))
+    self.assertIsNone(hi.flags('567'))
+    self.assertEqual(hi.use_box, {6, 7})
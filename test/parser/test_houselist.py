@@ -3,6 +3,7 @@ This is the test suite for the HouseList object
 '''
 
 from pydelivery.parser.parseround import HouseList, HouseInfo
+import pickle
 import unittest
 
 # Declare some example HouseInfo instances
@@ -40,3 +41,118 @@ class Test_HouseList(unittest.TestCase):
     with self.assertRaises(ValueError) as e:
       hl['Road1']
     self.assertEqual(e.exception.args[0], "Must pass either an integer or instance of 'HouseInfo'")
+
+  def test_08_int_range(self):
+    hl = HouseList([hi1, hi2])
+    self.assertIsNone(hl[2])
+    self.assertIsNone(hl[-1])
+
+  def test_09_contains(self):
+    hl = HouseList([hi1, hi2])
+    self.assertTrue(hi1 in hl)
+    self.assertTrue(HouseInfo('Name1', 'Road2', None) in hl)
+    self.assertFalse(hi3 in hl)
+
+
+class Test_HouseList_Index(unittest.TestCase):
+  def check_index(self, hl):
+    '''Check the index matches a search of the list'''
+    keys = {(item._house, item._road) for item in hl}
+    self.assertEqual(set(hl._index), keys)
+    for key, (elem, count) in hl._index.items():
+      matches = [item for item in hl if (item._house, item._road) == key]
+      self.assertIs(elem, matches[0])
+      self.assertEqual(count, len(matches))
+
+  def test_01_hash(self):
+    self.assertEqual(hash(hi1), hash(HouseInfo('Name1', 'Road1', None)))
+    self.assertEqual(len({hi1, hi2, hi3, HouseInfo('Name1', 'Road1', None)}), 3)
+
+  def test_02_append(self):
+    hl = HouseList(hi1)
+    hl.append(hi2)
+    hl.extend(hi3)
+    self.check_index(hl)
+    self.assertIs(hl[HouseInfo('Name2', 'Road1', None)], hi3)
+
+  def test_03_iadd(self):
+    hl = HouseList()
+    hl += [hi1, [hi2, hi3]]
+    self.check_index(hl)
+
+  def test_04_insert(self):
+    hl = HouseList([hi1, hi2])
+    dup = HouseInfo('Name1', 'Road1', None)
+    hl.insert(0, dup)
+    hl.insert(1, hi3)
+    self.check_index(hl)
+    self.assertIs(hl[hi1], dup)
+
+  def test_05_remove(self):
+    dup = HouseInfo('Name1', 'Road1', None)
+    hl = HouseList([hi1, hi2, dup])
+    hl.remove(hi1)
+    self.check_index(hl)
+    self.assertIs(hl[hi1], dup)
+    hl.remove([dup, hi2])
+    self.check_index(hl)
+    self.assertFalse(hi1 in hl)
+    with self.assertRaises(ValueError) as e:
+      hl.remove(hi3)
+    self.assertEqual(e.exception.args[0], 'list.remove(x): x not in list')
+
+  def test_06_pop_del_clear(self):
+    hl = HouseList([hi1, hi2, hi3])
+    self.assertIs(hl.pop(), hi3)
+    self.check_index(hl)
+    del hl[0]
+    self.check_index(hl)
+    hl[0] = hi3
+    self.check_index(hl)
+    hl.clear()
+    self.check_index(hl)
+    self.assertIsNone(hl[hi3])
+
+  def test_07_pickle(self):
+    hl = pickle.loads(pickle.dumps(HouseList([hi1, hi2])))
+    self.check_index(hl)
+    self.assertEqual(hl[hi2], hi2)
+
+  def test_08_trusted(self):
+    hl = HouseList._trusted([hi1, hi2])
+    hl._trusted_extend(house for house in [hi3])
+    self.check_index(hl)
+    self.assertIs(hl[hi3], hi3)
+
+  def test_09_remove_many(self):
+    dup = HouseInfo('Name1', 'Road1', None)
+    hl = HouseList([hi1, hi2, dup, hi3])
+    hl.remove([hi3, hi1])
+    self.assertListEqual(hl, [hi2, dup])
+    self.check_index(hl)
+    self.assertIs(hl[hi1], dup)
+    self.assertTrue([hi1, hi2] in hl)
+    self.assertFalse([hi1, hi3] in hl)
+    with self.assertRaises(ValueError) as e:
+      hl.remove([hi2, hi3])
+    self.assertEqual(e.exception.args[0], 'list.remove(x): x not in list')
+    self.assertListEqual(hl, [hi2, dup])
+
+  def test_10_repeat_sort_reverse(self):
+    dup = HouseInfo('Name1', 'Road1', None)
+    hl = HouseList([hi1, hi2])
+    hl *= 3
+    self.check_index(hl)
+    hl.remove(hi2)
+    self.check_index(hl)
+    self.assertTrue(hi2 in hl)
+    hl.append(dup)
+    hl.reverse()
+    self.check_index(hl)
+    self.assertIs(hl[hi1], dup)
+    hl.sort(key=lambda house: house is dup)
+    self.check_index(hl)
+    self.assertIs(hl[hi1], hi1)
+    hl *= 0
+    self.check_index(hl)
+    self.assertFalse(hi1 in hl)
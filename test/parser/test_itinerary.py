@@ -0,0 +1,78 @@
+'''
+This is the test suite for the weekly itinerary and the sinks that write it.
+'''
+
+import csv
+import io
+import os
+import tempfile
+import unittest
+from pydelivery.parser.parseround import RoundInfo, HouseInfo, PaperInfo, OrderInfo, Weekday
+from pydelivery.parser.itinerary import (ItinerarySink, TextSink, CSVSink, HTMLSink, itinerary,
+                                         write_itinerary)
+
+class Test_Itinerary(unittest.TestCase):
+  def setUp(self):
+    self.ri1 = RoundInfo(1, 'Round1', [
+      HouseInfo(1, 'Road1', [PaperInfo('Sun', '67', num_copies=2), PaperInfo('Mail', '1')]),
+      HouseInfo('Mill', 'Road<2>', PaperInfo('Mail', '6'), use_box='6')],
+      [OrderInfo('Mill', 'Road<2>'), OrderInfo(1, 'Road1')])
+    self.ri2 = RoundInfo(2, 'Round2', [HouseInfo(5, 'Road3', PaperInfo('Sun', '7'))])
+
+  def test_01_itinerary(self):
+    rows = list(itinerary([self.ri1, self.ri2]))
+    self.assertEqual([(day, entry.round, entry.house) for day, entry in rows],
+                     [(Weekday.Monday, 1, 1), (Weekday.Saturday, 1, 'Mill'),
+                      (Weekday.Saturday, 1, 1), (Weekday.Sunday, 1, 1), (Weekday.Sunday, 2, 5)])
+
+  def test_02_days(self):
+    rows = list(itinerary({1: self.ri1}, days='7,1'))
+    self.assertEqual([day for day, _ in rows], [Weekday.Monday, Weekday.Sunday])
+
+  def test_03_text(self):
+    out = io.StringIO()
+    self.assertEqual(write_itinerary(self.ri1, TextSink(out), days='6'), 2)
+    self.assertEqual(out.getvalue(),
+                     'Round 1 - Saturday\n'
+                     '    1  Mill, Road<2>                  Mail  [use_box]\n'
+                     '    2  1, Road1                       Sun x2\n')
+
+  def test_04_csv(self):
+    out = io.StringIO()
+    write_itinerary([self.ri1, self.ri2], CSVSink(out), days='67', chunksize=1)
+    rows = list(csv.reader(io.StringIO(out.getvalue())))
+    self.assertEqual(rows[0], list(CSVSink._header))
+    self.assertEqual(rows[1], ['Saturday', '1', '1', 'Mill', 'Road<2>', 'Mail', '1', 'use_box'])
+    self.assertEqual(len(rows), 5)
+
+  def test_05_html(self):
+    out = io.StringIO()
+    write_itinerary(self.ri1, HTMLSink(out), days='16')
+    html = out.getvalue()
+    self.assertEqual(html.count('<table>'), 2)
+    self.assertEqual(html.count('</table>'), 2)
+    self.assertIn('<td>Road&lt;2&gt;</td>', html)
+    self.assertTrue(html.endswith('</html>\n'))
+    out = io.StringIO()
+    write_itinerary(RoundInfo(3, 'Round3'), HTMLSink(out))
+    self.assertNotIn('table', out.getvalue())
+
+  def test_06_file(self):
+    with tempfile.TemporaryDirectory() as path:
+      name = os.path.join(path, 'itinerary.txt')
+      sink = TextSink(name)
+      write_itinerary([self.ri1, self.ri2], sink)
+      self.assertIsNone(sink._fd)
+      with open(name) as fd:
+        text = fd.read()
+    self.assertEqual(text.count('Round '), 4)
+
+  def test_07_errors(self):
+    with self.assertRaises(ValueError) as e:
+      write_itinerary(self.ri1, io.StringIO())
+    self.assertEqual(e.exception.args[0], 'Must pass an instance of ItinerarySink')
+    with self.assertRaises(ValueError) as e:
+      write_itinerary(self.ri1, TextSink(io.StringIO()), chunksize=0)
+    self.assertEqual(e.exception.args[0], 'Must provide a positive chunk size')
+    with self.assertRaises(TypeError):
+      ItinerarySink(io.StringIO())
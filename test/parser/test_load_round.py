@@ -3,16 +3,91 @@ This is the test suite to check that the load_round function is working as expec
 within the parseround module.
 '''
 
+import os
+import tempfile
 import unittest
 from os.path import dirname, join
-from pydelivery.parser.parseround import RoundInfo, load_round
+from pydelivery.parser.parseround import RoundInfo, load_round, _Round_locals, _round_dict
 
 # Determine the directory in which this test is found
 filedir=dirname(__file__)
 
+def _exec_round(name):
+  '''Load the round file NAME by running it with the objects of _Round_locals'''
+  with open(name, 'rt') as fd:
+    code = fd.read()
+  round_dict = _Round_locals.copy()
+  exec(code, {}, round_dict)
+  return _round_dict(round_dict)
+
 class Test_LoadRound(unittest.TestCase):
   def test_01_load(self):
     ri = load_round(join(filedir, 'testround.inp'))
     self.assertIn('Round05', ri)
     self.assertIsInstance(ri['Round05'], RoundInfo)
     self.assertNotIn('NonesenseRound', ri)
+
+  def test_02_exec(self):
+    name = join(filedir, 'testround.inp')
+    ri, ex = load_round(name), _exec_round(name)
+    self.assertEqual(sorted(ri), sorted(ex))
+    for key in ri:
+      self.assertEqual(ri[key], ex[key])
+      self.assertEqual(ri[key].fingerprint(), ex[key].fingerprint())
+      self.assertEqual(ri[key].totals()['Mail'], ex[key].totals()['Mail'])
+
+  def _load(self, text):
+    fd, name = tempfile.mkstemp(suffix='.inp')
+    self.addCleanup(os.remove, name)
+    with os.fdopen(fd, 'wt') as fd:
+      fd.write(text)
+    return load_round(name)
+
+  def test_03_literals(self):
+    ri = self._load("Round01 = RoundInfo(1, 'Round1', houses = [\n"
+                    "  HouseInfo(1, 'Road', [PaperInfo('Sun', '123456'), HasStandard]),\n"
+                    "  HouseInfo(2, 'Road', PaperInfo('Sun', '123456'), use_box = '7'),\n"
+                    "  HouseInfo(3, 'Road', [[PaperInfo('Sun', '123456')], PaperInfo('Mail', '7')]),\n"
+                    "], order = [OrderInfo(2, 'Road'), OrderInfo(1, 'Road')])\n"
+                    "Round02 = Round01\n"
+                    "Paper = PaperInfo('Sun', '123456')\n")
+    self.assertEqual(sorted(ri), ['Round01', 'Round02'])
+    houses = list(ri['Round01'].house_iter())
+    self.assertEqual(len(houses), 3)
+    self.assertIs(houses[0]._titles[0], houses[1]._titles[0])
+    self.assertEqual([paper._title for paper in houses[2]._titles], ['Sun', 'Mail'])
+    self.assertEqual(ri['Round01'].orphans(), [])
+
+  def test_04_invalid(self):
+    with self.assertRaises(ValueError):
+      self._load("Round01 = RoundInfo(1, 'Round1', houses = [HouseInfo(1, 'Road', [1])])\n")
+    with self.assertRaises(ValueError):
+      self._load("Round01 = RoundInfo(1, 'Round1', houses = [HouseInfo(1, 'Road', [HasStandard]), 2])\n")
+    with self.assertRaises(TypeError):
+      self._load("Round01 = RoundInfo(1, 'Round1', houses = [HouseInfo(0, 'Road', [HasStandard])])\n")
+
+  def test_05_code(self):
+    with self.assertRaisesRegex(ValueError, "Unable to handle 'Import' on line 2"):
+      self._load("Round01 = RoundInfo(1, 'Round1')\nimport os\n")
+    with self.assertRaisesRegex(ValueError, "Unable to handle 'Attribute'"):
+      self._load("Paper = HasStandard._title\n")
+    with self.assertRaisesRegex(ValueError, "Unable to use the name '__import__'"):
+      self._load("os = __import__('os')\n")
+    with self.assertRaisesRegex(ValueError, "Unable to call"):
+      self._load("Paper = (lambda: HasStandard)()\n")
+    with self.assertRaisesRegex(ValueError, "Unable to handle 'Lambda'"):
+      self._load("Paper = lambda: HasStandard\n")
+    with self.assertRaisesRegex(ValueError, "Unable to call"):
+      self._load("Paper = HasStandard()\n")
+    with self.assertRaisesRegex(ValueError, "Unable to handle a constant"):
+      self._load("Paper = PaperInfo(b'Sun', '7')\n")
+    with self.assertRaises(NameError):
+      self._load("Paper = open('testround.inp')\n")
+
+  def test_06_docstring(self):
+    ri = self._load("'''\nThe rounds of the depot\n'''\n"
+                    "Round01 = Round02 = RoundInfo(1, 'Round1', houses = [\n"
+                    "  HouseInfo(1, 'Road', [PaperInfo('Sun', '123456', num_copies = +2)])])\n"
+                    "'Round01 is also Round02'\n")
+    self.assertEqual(sorted(ri), ['Round01', 'Round02'])
+    self.assertIs(ri['Round01'], ri['Round02'])
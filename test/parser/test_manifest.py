@@ -0,0 +1,68 @@
+'''
+This is the test suite for the delivery manifest of a single day of the week.
+'''
+
+import unittest
+from pydelivery.parser.parseround import (RoundInfo, HouseInfo, PaperInfo, MagazineInfo,
+                                          OrderInfo, TitleMap)
+from pydelivery.parser.picklist import PickList
+from pydelivery.parser.manifest import ManifestEntry, manifest, manifest_chunks
+
+class Test_Manifest(unittest.TestCase):
+  def setUp(self):
+    self.ri1 = RoundInfo(1, 'Round1', [
+      HouseInfo(1, 'Road1', [PaperInfo('Sun', '67', num_copies=2), MagazineInfo('Radio', '6')]),
+      HouseInfo(2, 'Road1', PaperInfo('Mail', '12345')),
+      HouseInfo('Mill', 'Road2', [PaperInfo('Mail', '6'), PaperInfo('Sun', '6')], use_box='6')],
+      [OrderInfo('Mill', 'Road2'), OrderInfo(2, 'Road1'), OrderInfo(1, 'Road1')])
+    self.ri2 = RoundInfo(2, 'Round2', [HouseInfo(5, 'Road3', PaperInfo('Sun', '7'))])
+
+  def test_01_day(self):
+    entries = list(manifest(self.ri1, '6'))
+    self.assertEqual(entries, [
+      ManifestEntry(1, 1, 'Mill', 'Road2', (('Mail', 1), ('Sun', 1)), 'use_box'),
+      ManifestEntry(1, 3, 1, 'Road1', (('Sun', 2), ('Radio', 1)), None)])
+
+  def test_02_position(self):
+    self.assertEqual([(entry.position, entry.house) for entry in manifest(self.ri1, 'Mon')],
+                     [(2, 2)])
+
+  def test_03_rounds(self):
+    entries = manifest({1: self.ri1, 2: self.ri2}, 7)
+    self.assertEqual([(entry.round, entry.house, entry.titles) for entry in entries],
+                     [(1, 1, (('Sun', 2),)), (2, 5, (('Sun', 1),))])
+
+  def test_04_picklist(self):
+    tm = TitleMap(namespace='manifest')
+    try:
+      for title in ('Sun', 'Mail', 'Radio'):
+        tm.add(title)
+      entries = list(manifest(self.ri1, '6', PickList(tm)))
+      self.assertEqual(entries[0].titles, (('Sun', 1), ('Mail', 1)))
+    finally:
+      TitleMap.drop_namespace('manifest')
+
+  def test_05_single_day(self):
+    with self.assertRaises(ValueError) as e:
+      next(manifest(self.ri1, '67'))
+    self.assertEqual(e.exception.args[0], 'Must provide a single day for the manifest')
+
+  def test_06_chunks(self):
+    rounds = [self.ri1, self.ri2, RoundInfo(3, 'Round3', [HouseInfo(num, 'Road4', PaperInfo('Sun'))
+                                                          for num in range(1, 6)])]
+    chunks = list(manifest_chunks(rounds, '6', size=3))
+    self.assertEqual([len(chunk) for chunk in chunks], [3, 3, 1])
+    self.assertEqual([entry for chunk in chunks for entry in chunk], list(manifest(rounds, '6')))
+    with self.assertRaises(ValueError) as e:
+      next(manifest_chunks(rounds, '6', size=0))
+    self.assertEqual(e.exception.args[0], 'Must provide a positive chunk size')
+
+  def test_07_lazy(self):
+    taken = list()
+    def rounds():
+      for roundinfo in (self.ri1, self.ri2):
+        taken.append(roundinfo._number)
+        yield roundinfo
+    entries = manifest(rounds(), '7')
+    self.assertEqual(next(entries).round, 1)
+    self.assertEqual(taken, [1])
@@ -42,3 +42,8 @@ class Test_OrderInfo_Init(unittest.TestCase):
     
   def test_08_init(self):
     oi = OrderInfo('Name', 'Road')
+
+  def test_09_slots(self):
+    oi = OrderInfo('Name', ''.join(['Ro', 'ad']))
+    self.assertFalse(hasattr(oi, '__dict__'))
+    self.assertIs(oi._road, OrderInfo('Other', ''.join(['Ro', 'ad']))._road)
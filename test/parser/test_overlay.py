@@ -0,0 +1,197 @@
+'''
+This is the test suite for the RoundOverlay object, which records short term changes to
+a round without changing it.
+'''
+
+import unittest
+from copy import deepcopy
+from random import Random
+from pydelivery.parser.parseround import RoundInfo, HouseInfo, PaperInfo, OrderInfo
+from pydelivery.parser.overlay import RoundOverlay
+
+def _keys(houses):
+  return [(house._house, house._road) for house in houses]
+
+class Test_RoundOverlay(unittest.TestCase):
+  def setUp(self):
+    self.houses = [HouseInfo(1, 'Road1', PaperInfo('Sun', '67')),
+                   HouseInfo(5, 'Road1', [PaperInfo('Sun', '6'), PaperInfo('Mail', '12')]),
+                   HouseInfo(9, 'Road1', PaperInfo('Mail', '1234567'))]
+    self.order = [OrderInfo(9, 'Road1'), OrderInfo(5, 'Road1'), OrderInfo(1, 'Road1'),
+                  OrderInfo(2, 'Road2')]
+    self.ri = RoundInfo(1, 'Round1', list(self.houses), self.order)
+    self.ov = RoundOverlay(self.ri)
+
+  def test_01_empty(self):
+    self.assertEqual(list(self.ov.route_iter()), list(self.ri.route_iter()))
+    self.assertEqual(list(self.ov.house_iter()), list(self.ri.house_iter()))
+    self.assertEqual(list(self.ov), list(self.ri))
+    self.assertEqual(self.ov.orphans(), self.ri.orphans())
+    self.assertEqual(self.ov.totals()['Sun'], self.ri.totals()['Sun'])
+    self.assertEqual(self.ov.changes(), (0, 0, 0))
+
+  def test_02_add_rem(self):
+    self.ov.add_house(HouseInfo(6, 'Road1', PaperInfo('Times', '1')))
+    self.ov.add_house(HouseInfo(2, 'Road2', PaperInfo('Sun', '7')))
+    self.ov.rem_house(HouseInfo(1, 'Road1', None))
+    self.assertEqual(_keys(self.ov.route_iter()), [(9, 'Road1'), (5, 'Road1'), (6, 'Road1'),
+                                                   (2, 'Road2')])
+    self.assertEqual(self.ov.orphans(), [OrderInfo(1, 'Road1')])
+    self.assertEqual(self.ov.totals()['Sun'], (0, 0, 0, 0, 0, 1, 1))
+    self.assertEqual(self.ov.totals()['Times'], (1, 0, 0, 0, 0, 0, 0))
+    self.assertEqual(self.ov.changes(), (2, 1, 0))
+    # The base round is left unchanged
+    self.assertEqual(list(self.ri.house_iter()), self.houses)
+    self.assertEqual(self.ri.totals()['Sun'], (0, 0, 0, 0, 0, 2, 1))
+    self.assertNotIn('Times', self.ri.totals())
+
+  def test_03_change_days(self):
+    self.ov.suspend(HouseInfo(5, 'Road1', None), '6')
+    self.ov.add_days(HouseInfo(1, 'Road1', None), 'Sun', '1')
+    self.assertEqual(self.ov.totals()['Sun'], (1, 0, 0, 0, 0, 1, 1))
+    self.assertEqual(self.ov.totals()['Mail'], (2, 2, 1, 1, 1, 1, 1))
+    self.assertEqual(self.houses[0]._titles[0]._days._mask, 0x60)
+    self.assertIs(list(self.ri.house_iter())[0], self.houses[0])
+    self.assertEqual(self.ov.changes(), (0, 0, 2))
+    self.ov.totals().verify()
+
+  def test_04_commit(self):
+    self.ov.add_house(HouseInfo(7, 'Road1', PaperInfo('Times', '1')))
+    self.ov.add_house(HouseInfo(6, 'Road1', PaperInfo('Times', '1')))
+    self.ov.add_house(HouseInfo(3, 'Road3', PaperInfo('Times', '1')))
+    self.ov.rem_house(HouseInfo(9, 'Road1', None))
+    self.ov.remove_days(HouseInfo(5, 'Road1', None), 'Mail', '1')
+    totals = self.ri.totals()
+    route, order = list(self.ov.route_iter()), list(self.ov.order_iter())
+    expected = {title: self.ov.totals()[title] for title in self.ov.totals()}
+    self.ov.commit()
+    self.assertEqual(list(self.ri.route_iter()), route)
+    self.assertEqual(list(self.ri.order_iter()), order)
+    self.assertEqual(self.ri._houses[HouseInfo(5, 'Road1', None)]._titles['Mail']._days._mask, 0x02)
+    self.assertIs(self.ri.totals(), totals)
+    self.assertTrue(totals._synced())
+    self.assertEqual({title: totals[title] for title in totals}, expected)
+    totals.verify()
+    self.assertEqual(self.ov.changes(), (0, 0, 0))
+    self.assertEqual(list(self.ov.route_iter()), route)
+
+  def test_05_readd(self):
+    self.ov.rem_house(HouseInfo(1, 'Road1', None))
+    self.ov.add_house(HouseInfo(1, 'Road1', PaperInfo('Times', '7')))
+    self.assertEqual(self.ov.changes(), (0, 0, 1))
+    self.assertEqual(_keys(self.ov.route_iter()), [(9, 'Road1'), (5, 'Road1'), (1, 'Road1')])
+    self.assertNotIn('Sun', [title for title in self.ov.totals()
+                             if self.ov.totals()[title][6]])
+
+  def test_06_errors(self):
+    with self.assertRaises(TypeError) as e:
+      RoundOverlay(None)
+    self.assertEqual(e.exception.args[0], 'Must provide an instance of RoundInfo')
+    with self.assertRaises(ValueError) as e:
+      self.ov.add_house(HouseInfo(1, 'Road1', None))
+    self.assertEqual(e.exception.args[0], 'House is already present in round')
+    with self.assertRaises(ValueError) as e:
+      self.ov.rem_house(HouseInfo(4, 'Road1', None))
+    self.assertEqual(e.exception.args[0], 'House not present in round')
+    with self.assertRaises(ValueError) as e:
+      self.ov.add_house(HouseInfo(4, 'Road1', None), OrderInfo(4, 'Road9'))
+    self.assertEqual(e.exception.args[0], "House '4' in road 'Road9' not present in order")
+
+  def test_07_stale(self):
+    self.ov.rem_house(HouseInfo(1, 'Road1', None))
+    self.ri.add_house(HouseInfo(3, 'Road1', None))
+    with self.assertRaises(ValueError) as e:
+      self.ov.commit()
+    self.assertEqual(e.exception.args[0], 'Round has been changed since the overlay was created')
+    self.ov.discard()
+    self.ov.commit()
+    self.assertEqual(len(list(self.ri.house_iter())), 4)
+
+  def test_08_no_order(self):
+    ri = RoundInfo(2, 'Round2', list(self.houses))
+    ov = RoundOverlay(ri)
+    ov.add_house(HouseInfo(2, 'Road1', PaperInfo('Sun')))
+    ov.rem_house(HouseInfo(5, 'Road1', None))
+    self.assertEqual(_keys(ov), [(1, 'Road1'), (9, 'Road1'), (2, 'Road1')])
+    self.assertEqual(ov.flags(), [None, None, None])
+    ov.commit()
+    self.assertEqual(_keys(ri), [(1, 'Road1'), (9, 'Road1'), (2, 'Road1')])
+    self.assertIsNone(ri._order)
+
+  def test_09_add_sequence(self):
+    ri = RoundInfo(2, 'Round2', [HouseInfo(2, 'Road1', None), HouseInfo(10, 'Road1', None)],
+                   [OrderInfo(2, 'Road1'), OrderInfo(10, 'Road1')])
+    ov = RoundOverlay(ri)
+    ov.add_house(HouseInfo(4, 'Road1', None))
+    ov.add_house(HouseInfo(6, 'Road1', None))
+    expected = [(2, 'Road1'), (4, 'Road1'), (6, 'Road1'), (10, 'Road1')]
+    self.assertEqual(_keys(ov.order_iter()), expected)
+    ov.commit()
+    self.assertEqual(_keys(ri.order_iter()), expected)
+
+  def test_10_add_random(self):
+    rand = Random(3)
+    houses = [HouseInfo(num, 'Road{}'.format(num % 4), None) for num in range(1, 80, 3)]
+    order = [OrderInfo(house._house, house._road) for house in houses]
+    rand.shuffle(order)
+    ri = RoundInfo(2, 'Round2', list(houses), order)
+    seq = deepcopy(ri)
+    ov = RoundOverlay(ri)
+    added = [HouseInfo(num, 'Road{}'.format(num % 6), None) for num in range(2, 90, 3)]
+    added += [HouseInfo(name, 'Road{}'.format(num), None) for num in range(6) for name in 'AB']
+    rand.shuffle(added)
+    for num, house in enumerate(added):
+      if num % 5 == 4:
+        stops = [stop for stop in seq.order_iter() if stop not in ov.orphans()]
+        anchor, before = rand.choice(stops), bool(num % 2)
+        ov.add_house(house, anchor, before)
+        seq.add_house(house, anchor, before)
+      else:
+        ov.add_house(house)
+        seq.add_house(house)
+    expected = _keys(seq.order_iter())
+    self.assertEqual(_keys(ov.order_iter()), expected)
+    self.assertEqual(_keys(ov.route_iter()), _keys(seq.route_iter()))
+    ov.commit()
+    self.assertEqual(_keys(ri.order_iter()), expected)
+
+
+  def test_11_add_rem_added(self):
+    seq = deepcopy(self.ri)
+    for target in (self.ov, seq):
+      target.add_house(HouseInfo(3, 'Road1', PaperInfo('Sun', '7')))
+      target.add_house(HouseInfo(4, 'Road1', None))
+      target.rem_house(HouseInfo(3, 'Road1', None))
+      target.add_house(HouseInfo(6, 'Road1', None))
+    expected = _keys(seq.order_iter())
+    self.assertIn((3, 'Road1'), expected)
+    self.assertEqual(_keys(self.ov.order_iter()), expected)
+    self.assertEqual(self.ov.orphans(), seq.orphans())
+    self.assertEqual(_keys(self.ov.route_iter()), _keys(seq.route_iter()))
+    self.assertEqual(self.ov.totals()['Sun'], seq.totals()['Sun'])
+    # Adding the house again uses the stop that was left
+    self.ov.add_house(HouseInfo(3, 'Road1', None))
+    seq.add_house(HouseInfo(3, 'Road1', None))
+    self.ov.rem_house(HouseInfo(3, 'Road1', None))
+    seq.rem_house(HouseInfo(3, 'Road1', None))
+    self.assertEqual(_keys(self.ov.order_iter()), expected)
+    self.ov.commit()
+    self.assertEqual(_keys(self.ri._order), expected)
+    self.assertEqual(self.ri.orphans(), seq.orphans())
+
+class Test_ReplaceHouse(unittest.TestCase):
+  def test_01_replace(self):
+    houses = [HouseInfo(1, 'Road1', PaperInfo('Sun', '6')), HouseInfo(2, 'Road1', PaperInfo('Sun', '6'))]
+    ri = RoundInfo(1, 'Round1', houses, [OrderInfo(2, 'Road1'), OrderInfo(1, 'Road1')])
+    totals = ri.totals()
+    list(ri.route_iter())
+    new = HouseInfo(1, 'Road1', PaperInfo('Sun', '7'))
+    ri.replace_house(HouseInfo(1, 'Road1', None), new)
+    self.assertIs(list(ri.house_iter())[0], new)
+    self.assertIs(list(ri.route_iter())[1], new)
+    self.assertIs(ri._houses[new], new)
+    self.assertEqual(totals['Sun'], (0, 0, 0, 0, 0, 1, 1))
+    self.assertEqual(houses[0]._totals, ())
+    with self.assertRaises(ValueError) as e:
+      ri.replace_house(new, HouseInfo(3, 'Road1', None))
+    self.assertEqual(e.exception.args[0], 'Replacement house must have the same number and road')
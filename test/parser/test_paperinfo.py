@@ -3,8 +3,9 @@ This module will test the PaperInfo object that is part of the parseround
 program that will generate a database from the provided *.inp files.
 '''
 
+import pickle
 import unittest
-from pydelivery.parser.parseround import PaperInfo
+from pydelivery.parser.parseround import PaperInfo, MagazineInfo, HouseInfo
 
 class TestPaperInfo_Init(unittest.TestCase):
   'Class that tests the initialisation of the PaperInfo object'
@@ -57,21 +58,94 @@ class TestPaperInfo_Oper(unittest.TestCase):
   'Class that tests the operation of the PaperInfo object'
   def test_01_add_days(self):
     pi = PaperInfo('Paper', '6')       # Add a paper delivered on Saturday
-    pi.add_days('5')                   # Add a paer to be delivered on Friday
+    pi = pi.with_days('5')             # Add a paer to be delivered on Friday
     self.assertEqual(pi.days, {5, 6})
 
+  def test_02_add_days_shared(self):
+    pi = PaperInfo('Paper', '6')
+    with self.assertRaises(TypeError) as e:
+      pi.add_days('5')
+    self.assertEqual(e.exception.args[0], 'Unable to modify a shared PaperInfo, use with_days instead')
+    with self.assertRaises(TypeError):
+      pi.remove_days('6')
+    with self.assertRaises(TypeError):
+      MagazineInfo('Mag', '6').add_days('5')
+    self.assertEqual(pi.days, {6})
+
   def test_51_add_days_fail(self):
     pi = PaperInfo('Paper', '6')
     with self.assertRaises(ValueError) as e:
-      pi.add_days('9')
+      pi.with_days('9')
     self.assertEqual(e.exception.args[0], 'Day sequence contains no valid days')
     
   def test_52_add_days_fail(self):
     pi = PaperInfo('Paper', '6')
-    pi.add_days('7')
+    pi = pi.with_days('7')
     self.assertEqual(pi.days, {6, 7})
     
   def test_53_remove_days(self):
     pi = PaperInfo('Paper', '567')
-    pi.remove_days('6')
+    pi = pi.without_days('6')
     self.assertEqual(pi.days, {5, 7})
+
+
+class TestPaperInfo_Intern(unittest.TestCase):
+  'Class that tests the sharing of identical PaperInfo objects'
+  def test_01_identity(self):
+    self.assertIs(PaperInfo('Paper', '1234567'), PaperInfo('Paper', '1234567'))
+    self.assertIs(PaperInfo('Paper'), PaperInfo('Paper', '1234567'))
+    self.assertIs(PaperInfo('Paper', '67', 2), PaperInfo('Paper', '76', num_copies=2))
+
+  def test_02_distinct(self):
+    self.assertIsNot(PaperInfo('Paper', '67'), PaperInfo('Paper', '6'))
+    self.assertIsNot(PaperInfo('Paper', '67'), PaperInfo('Paper', '67', 2))
+    self.assertIsNot(PaperInfo('Paper', '67'), PaperInfo('Other', '67'))
+    self.assertIsNot(PaperInfo('Paper', '67'), MagazineInfo('Paper', '67'))
+    self.assertIsNot(MagazineInfo('Mag', '6'), MagazineInfo('Mag', '6', 'M'))
+
+  def test_03_magazine(self):
+    mi = MagazineInfo('Mag', '6')
+    self.assertIs(mi, MagazineInfo('Mag', '6', 'W'))
+    self.assertEqual(mi._frequency, 'W')
+    self.assertEqual(mi._category, 'Magazine')
+
+  def test_04_copy_on_write(self):
+    pi = PaperInfo('Paper', '6')
+    pi2 = pi.with_days('5')
+    self.assertEqual(pi.days, {6})
+    self.assertEqual(pi2.days, {5, 6})
+    self.assertIs(pi2, PaperInfo('Paper', '56'))
+    self.assertIs(pi2.without_days('5'), pi)
+    self.assertIs(pi.with_days('6'), pi)
+
+  def test_05_copy_on_write_magazine(self):
+    mi = MagazineInfo('Mag', '6', 'M')
+    mi2 = mi.with_days('7')
+    self.assertEqual(mi.days, {6})
+    self.assertEqual(mi2._frequency, 'M')
+    self.assertIs(mi2, MagazineInfo('Mag', '67', 'M'))
+
+  def test_06_pickle(self):
+    pi = PaperInfo('Paper', '135', 2)
+    self.assertIs(pickle.loads(pickle.dumps(pi)), pi)
+    mi = MagazineInfo('Mag', '6', 'M')
+    self.assertIs(pickle.loads(pickle.dumps(mi)), mi)
+
+  def test_07_house_copy_on_write(self):
+    shared = PaperInfo('Paper', '6')
+    hi = HouseInfo(1, 'Road', [shared])
+    hi2 = HouseInfo(2, 'Road', [shared])
+    hi.add_days('Paper', '7')
+    self.assertEqual(hi._titles['Paper'].days, {6, 7})
+    self.assertIs(hi2._titles['Paper'], shared)
+    self.assertEqual(shared.days, {6})
+    hi.remove_days('Paper', '67')
+    self.assertEqual(hi._titles['Paper'].days, set())
+    with self.assertRaises(ValueError) as e:
+      hi.add_days('Missing', '7')
+    self.assertEqual(e.exception.args[0], "Unable to find item indexed by 'Missing'")
+
+  def test_08_slots(self):
+    self.assertFalse(hasattr(PaperInfo('Paper', '6'), '__dict__'))
+    self.assertFalse(hasattr(MagazineInfo('Mag', '6'), '__dict__'))
+    self.assertIs(PaperInfo(''.join(['Pa', 'per']), '6')._title, PaperInfo('Paper', '7')._title)
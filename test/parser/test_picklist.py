@@ -0,0 +1,57 @@
+'''
+This is the test suite for the PickList object, which orders the titles of each house
+according to a TitleMap.
+'''
+
+import unittest
+from pydelivery.parser.parseround import TitleMap, PaperInfo, MagazineInfo, HouseInfo, RoundInfo
+from pydelivery.parser.picklist import PickList
+
+pi_sun = PaperInfo('Sun')
+pi_mail = PaperInfo('Mail')
+pi_local = PaperInfo('Local', '5')
+mi_radio = MagazineInfo('Radio', '2')
+
+class Test_PickList(unittest.TestCase):
+  def setUp(self):
+    tm = TitleMap(namespace='picklist')
+    for title in ('Radio', 'Mail', 'Sun'):
+      tm.add(title)
+    self.house = HouseInfo(1, 'Road1', [pi_sun, mi_radio, pi_local, pi_mail])
+
+  def tearDown(self):
+    TitleMap.drop_namespace('picklist')
+
+  def test_01_after_paper(self):
+    pl = PickList(TitleMap(mag_order='after_paper', namespace='picklist'))
+    self.assertEqual(pl.bundle(self.house), [pi_mail, pi_sun, pi_local, mi_radio])
+
+  def test_02_before_paper(self):
+    pl = PickList(TitleMap(mag_order='before_paper', namespace='picklist'))
+    self.assertEqual(pl.bundle(self.house), [mi_radio, pi_mail, pi_sun, pi_local])
+
+  def test_03_inwith_paper(self):
+    pl = PickList(TitleMap(mag_order='inwith_paper', namespace='picklist'))
+    self.assertEqual(pl.bundle(self.house), [mi_radio, pi_mail, pi_sun, pi_local])
+
+  def test_04_sort_key(self):
+    pl = PickList(TitleMap(namespace='picklist'))
+    self.assertLess(pl.sort_key(pi_sun), pl.sort_key(pi_local))
+    self.assertLess(pl.sort_key(pi_local), pl.sort_key(mi_radio))
+
+  def test_05_cache(self):
+    tm = TitleMap(namespace='picklist')
+    pl = PickList(tm)
+    keys = pl._sort_keys()
+    self.assertIs(pl._sort_keys()[0], keys[0])
+    tm.add('Local')
+    self.assertIsNot(pl._sort_keys()[0], keys[0])
+    self.assertEqual(pl.bundle(self.house), [pi_mail, pi_sun, pi_local, mi_radio])
+
+  def test_06_round(self):
+    hi2 = HouseInfo(2, 'Road1', [pi_local, pi_sun])
+    ri = RoundInfo(1, 'Round1', [self.house, hi2])
+    pl = PickList(TitleMap(namespace='picklist'))
+    bundles = list(pl.round_bundles(ri))
+    self.assertEqual(bundles, [(self.house, [pi_mail, pi_sun, pi_local, mi_radio]),
+                               (hi2, [pi_sun, pi_local])])
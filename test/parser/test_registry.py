@@ -0,0 +1,90 @@
+'''
+This is the test suite for the IdRegistry object, which assigns the persistent integer
+values used for the roads and titles.
+'''
+
+import os
+import unittest
+from tempfile import TemporaryDirectory
+from pydelivery.parser.registry import IdRegistry
+from pydelivery.parser.parseround import RoadMap, HouseInfo
+
+class Test_IdRegistry(unittest.TestCase):
+  def setUp(self):
+    self.tmpdir = TemporaryDirectory()
+    self.path = os.path.join(self.tmpdir.name, 'roads.reg')
+
+  def tearDown(self):
+    self.tmpdir.cleanup()
+
+  def test_01_empty(self):
+    reg = IdRegistry(self.path)
+    self.assertEqual(len(reg), 0)
+    self.assertFalse(os.path.exists(self.path))
+
+  def test_02_assign(self):
+    reg = IdRegistry(self.path)
+    self.assertEqual(reg.assign(['Road1', 'Road2', 'Road1']), [0, 1, 0])
+    self.assertEqual(reg['Road2'], 1)
+    self.assertEqual(reg.key(0), 'Road1')
+
+  def test_03_persist(self):
+    IdRegistry(self.path).assign(['Road1', 'Road2'])
+    reg = IdRegistry(self.path)
+    self.assertEqual(reg.assign(['Road3', 'Road2']), [2, 1])
+    self.assertEqual(IdRegistry(self.path).lookup(['Road1', 'Road2', 'Road3']), [0, 1, 2])
+
+  def test_04_lookup(self):
+    reg = IdRegistry(self.path)
+    reg.assign(['Road1'])
+    self.assertEqual(reg.lookup(['Road1', 'Road2']), [0, None])
+    self.assertEqual(reg.lookup(['Road2'], default=-1), [-1])
+    self.assertNotIn('Road2', reg)
+
+  def test_05_bad_key(self):
+    reg = IdRegistry(self.path)
+    with self.assertRaises(ValueError) as e:
+      reg.assign(['Road1\nRoad2'])
+    self.assertEqual(e.exception.args[0], "Key 'Road1\nRoad2' must be a non-empty single line string")
+    self.assertEqual(len(reg), 0)
+
+  def test_06_partial_line(self):
+    with open(self.path, 'wb') as fd:
+      fd.write('Road1\nRoad2\nRo'.encode())
+    reg = IdRegistry(self.path)
+    self.assertEqual(len(reg), 2)
+    reg.assign(['Road3'])
+    self.assertEqual(IdRegistry(self.path).lookup(['Road1', 'Road2', 'Road3']), [0, 1, 2])
+
+  def test_07_missing(self):
+    reg = IdRegistry(self.path)
+    with self.assertRaises(KeyError) as e:
+      reg.key(0)
+    self.assertEqual(e.exception.args[0], "Value '0' not present in registry")
+
+  def test_08_roadmap(self):
+    rm = RoadMap(registry=self.path)
+    rm.add(HouseInfo(1, 'Road1', None))
+    rm.add(HouseInfo(1, 'Road2', None))
+    self.assertEqual(list(rm.numeric_iter()), [(0, 'Road1'), (1, 'Road2')])
+    rm = RoadMap(registry=self.path)
+    rm.add(HouseInfo(1, 'Road3', None))
+    rm.add(HouseInfo(2, 'Road2', None))
+    self.assertEqual(list(rm.numeric_iter()), [(2, 'Road3'), (1, 'Road2')])
+
+  def test_09_shared_file(self):
+    reg_a, reg_b = IdRegistry(self.path), IdRegistry(self.path)
+    self.assertEqual(reg_b.assign(['Road1']), [0])
+    self.assertEqual(reg_a.assign(['Road2', 'Road1']), [1, 0])
+    self.assertEqual(reg_a.key(0), 'Road1')
+    self.assertEqual(reg_b.assign(iter(['Road3', 'Road2'])), [2, 1])
+    self.assertEqual(IdRegistry(self.path).lookup(['Road1', 'Road2', 'Road3']), [0, 1, 2])
+
+  def test_10_shared_partial_line(self):
+    reg = IdRegistry(self.path)
+    reg.assign(['Road1'])
+    with open(self.path, 'ab') as fd:
+      fd.write('Road2\nRo'.encode())
+    self.assertEqual(reg.assign(['Road3']), [2])
+    with open(self.path, 'rb') as fd:
+      self.assertEqual(fd.read().decode(), 'Road1\nRoad2\nRoad3\n')
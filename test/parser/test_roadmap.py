@@ -87,3 +87,62 @@ class TestRoadMap_Oper(unittest.TestCase):
     rm = Mock_RoadMap()
     rm.add(Mock_HouseInfo('House', 'Road1'))
     self.assertIn('Road1', rm)
+
+
+class TestRoadMap_Bulk(unittest.TestCase):
+  def setUp(self):
+    from pydelivery.parser.parseround import HouseList, RoundInfo
+    self.hl1 = HouseList([HouseInfo(1, 'Road1', None), HouseInfo(2, 'Road2', None),
+                          HouseInfo(3, 'Road1', None)])
+    self.hl2 = HouseList([HouseInfo(1, 'Road3', None), HouseInfo(2, 'Road1', None)])
+    self.ri1 = RoundInfo(1, 'Round1', self.hl1)
+    self.ri2 = RoundInfo(2, 'Round2', self.hl2)
+
+  def test_01_update(self):
+    rm = Mock_RoadMap()
+    rm.update(self.hl1)
+    self.assertEqual(list(rm), [('Road1', 2), ('Road2', 1)])
+
+  def test_02_update_round(self):
+    rm = Mock_RoadMap()
+    rm.update(self.ri2)
+    rm.update(self.ri1)
+    self.assertEqual(list(rm), [('Road3', 1), ('Road1', 3), ('Road2', 1)])
+
+  def test_03_update_bad(self):
+    rm = Mock_RoadMap()
+    with self.assertRaises(ValueError) as e:
+      rm.update([Mock_HouseInfo('House', 'Road1')])
+    self.assertEqual(e.exception.args[0], 'Must pass an instance of HouseList or RoundInfo')
+
+  def test_04_merge(self):
+    rm1, rm2 = Mock_RoadMap(), Mock_RoadMap()
+    rm1.update(self.hl1)
+    rm2.update(self.hl2)
+    rm1.merge(rm2)
+    self.assertEqual(list(rm1), [('Road1', 3), ('Road2', 1), ('Road3', 1)])
+    self.assertEqual(list(rm2), [('Road3', 1), ('Road1', 1)])
+
+  def test_05_add(self):
+    rm1, rm2, rm3 = Mock_RoadMap(), Mock_RoadMap(), Mock_RoadMap()
+    rm1.update(self.hl1)
+    rm2.update(self.hl2)
+    rm3._incr('Road4')
+    left, right = (rm1 + rm2) + rm3, rm1 + (rm2 + rm3)
+    self.assertEqual(list(left), list(right))
+    self.assertEqual(list(left), [('Road1', 3), ('Road2', 1), ('Road3', 1), ('Road4', 1)])
+    self.assertEqual(list(rm1), [('Road1', 2), ('Road2', 1)])
+    self.assertIsInstance(left, Mock_RoadMap)
+
+  def test_06_merge_bad(self):
+    rm = Mock_RoadMap()
+    with self.assertRaises(ValueError) as e:
+      rm.merge(dict(Road1=1))
+    self.assertEqual(e.exception.args[0], 'Can only merge instances of _IncrMap')
+
+  def test_07_from_rounds(self):
+    rounds = [self.ri1, self.ri2] * 3
+    expected = RoadMap.from_rounds(rounds, max_workers=1)
+    self.assertEqual(list(expected), [('Road1', 9), ('Road2', 3), ('Road3', 3)])
+    rm = RoadMap.from_rounds(rounds, max_workers=2)
+    self.assertEqual(list(rm), list(expected))
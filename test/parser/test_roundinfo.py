@@ -3,8 +3,17 @@ This is the test suite for the RoundInfo object which incorporates the other rel
 into a single entity.
 '''
 
+import gc
+import os
+import pickle
+import subprocess
+import sys
 import unittest
-from pydelivery.parser.parseround import RoundInfo, HouseInfo, PaperInfo, OrderInfo, OrderList
+from copy import copy
+from random import Random
+from pydelivery.parser.parseround import (RoundInfo, HouseInfo, PaperInfo, OrderInfo, OrderList,
+                                          PaperList, _LimitList)
+from pydelivery.parser.aggregate import depot_totals
 
 class TestRoundInfo_Init(unittest.TestCase):
   def test_01_init(self):
@@ -228,3 +237,330 @@ class TestRoundInfo_Oper(unittest.TestCase):
     ri1 = RoundInfo(1, 'Round1', [mhi1], [oi1])
     ri2 = RoundInfo(1, 'Round1', [mhi1], [oi1])
     self.assertTrue(ri1 == ri2)
+
+  def test_16_flags(self):
+    ri = RoundInfo(1, 'Round1', [HouseInfo(1, 'Road1', None, use_box='67'),
+                                 HouseInfo(2, 'Road1', None),
+                                 HouseInfo(3, 'Road1', None, use_box=True)])
+    self.assertEqual(ri.flags('6'), ['use_box', None, 'use_box'])
+    self.assertEqual(ri.flags('1'), [None, None, 'use_box'])
+    self.assertEqual(ri.flags(), [None, None, 'use_box'])
+    self.assertEqual(ri.flags('6'), [house.flags('6') for house in ri.house_iter()])
+    self.assertEqual(RoundInfo(2, 'Round2').flags('6'), [])
+
+
+class TestRoundInfo_Route(unittest.TestCase):
+  def setUp(self):
+    self.h1 = HouseInfo(1, 'Road1', None)
+    self.h2 = HouseInfo(2, 'Road1', None)
+    self.h3 = HouseInfo(3, 'Road2', None)
+    self.h4 = HouseInfo(4, 'Road2', None)
+    self.order = [OrderInfo(3, 'Road2'), OrderInfo(9, 'Road9'), OrderInfo(1, 'Road1'),
+                  OrderInfo(2, 'Road1')]
+
+  def test_01_no_order(self):
+    ri = RoundInfo(1, 'Round1', [self.h2, self.h1])
+    self.assertEqual(list(ri.route_iter()), [self.h2, self.h1])
+    self.assertEqual(ri.orphans(), [])
+    self.assertEqual(ri.unordered(), [])
+
+  def test_02_route(self):
+    ri = RoundInfo(1, 'Round1', [self.h1, self.h2, self.h3, self.h4], self.order)
+    self.assertEqual(list(ri.route_iter()), [self.h3, self.h1, self.h2, self.h4])
+    self.assertEqual(ri.orphans(), [self.order[1]])
+    self.assertEqual(ri.unordered(), [self.h4])
+
+  def test_03_add_house(self):
+    ri = RoundInfo(1, 'Round1', [self.h1], self.order)
+    self.assertEqual(list(ri.route_iter()), [self.h1])
+    route = ri._resolved
+    ri.add_house(self.h3)
+    self.assertIs(ri._resolved, route)
+    ri.add_house(self.h4)
+    self.assertEqual(list(ri.route_iter()), [self.h3, self.h4, self.h1])
+    self.assertEqual(ri.orphans(), [self.order[1], self.order[3]])
+    self.assertEqual(ri.unordered(), [])
+
+  def test_04_rem_house(self):
+    ri = RoundInfo(1, 'Round1', [self.h1, self.h2, self.h3, self.h4], self.order)
+    list(ri.route_iter())
+    route = ri._resolved
+    ri.rem_house(self.h1)
+    ri.rem_house(self.h4)
+    self.assertIs(ri._resolved, route)
+    self.assertEqual(list(ri.route_iter()), [self.h3, self.h2])
+    self.assertEqual(ri.orphans(), self.order[1:3])
+    self.assertEqual(ri.unordered(), [])
+
+  def test_05_direct_change(self):
+    ri = RoundInfo(1, 'Round1', [self.h1], self.order)
+    list(ri.route_iter())
+    ri._houses.append(self.h2)
+    self.assertEqual(list(ri.route_iter()), [self.h1, self.h2])
+
+  def test_06_same_size_change(self):
+    houses, order = [self.h1, self.h2, self.h3], self.order[::2] + self.order[3:]
+    ri = RoundInfo(1, 'Round1', houses, order)
+    self.assertEqual(list(ri.route_iter()), [self.h3, self.h1, self.h2])
+    ri._order.reverse()
+    self.assertEqual(list(ri.route_iter()), [self.h2, self.h1, self.h3])
+    h9 = HouseInfo(9, 'Road9', None)
+    ri._houses[0] = h9
+    self.assertEqual(list(ri.route_iter()), [self.h2, self.h3, h9])
+    self.assertEqual(ri.orphans(), [self.order[2]])
+
+
+class TestRoundInfo_Insert(unittest.TestCase):
+  def setUp(self):
+    self.order = [OrderInfo(1, 'Road1'), OrderInfo(5, 'Road1'), OrderInfo('Mill', 'Road2'),
+                  OrderInfo(2, 'Road3')]
+    self.ri = RoundInfo(1, 'Round1', [HouseInfo(stop._house, stop._road, None)
+                                      for stop in self.order], self.order)
+
+  def stops(self):
+    return [(stop._house, stop._road) for stop in self.ri._order]
+
+  def test_01_after(self):
+    self.ri.add_house(HouseInfo(7, 'Road4', None), OrderInfo(5, 'Road1'))
+    self.assertEqual(self.stops(), [(1, 'Road1'), (5, 'Road1'), (7, 'Road4'),
+                                    ('Mill', 'Road2'), (2, 'Road3')])
+    self.assertEqual(list(self.ri.route_iter())[2], HouseInfo(7, 'Road4', None))
+
+  def test_02_before(self):
+    self.ri.add_house(HouseInfo(7, 'Road4', None), OrderInfo(1, 'Road1'), before=True)
+    self.assertEqual(self.stops()[:2], [(7, 'Road4'), (1, 'Road1')])
+
+  def test_03_nearest(self):
+    self.ri.add_house(HouseInfo(3, 'Road1', None))
+    self.ri.add_house(HouseInfo(9, 'Road1', None))
+    self.ri.add_house(HouseInfo(1, 'Road3', None))
+    self.assertEqual(self.stops(), [(1, 'Road1'), (3, 'Road1'), (5, 'Road1'), (9, 'Road1'),
+                                    ('Mill', 'Road2'), (1, 'Road3'), (2, 'Road3')])
+
+  def test_04_road(self):
+    self.ri.add_house(HouseInfo(4, 'Road2', None))
+    self.ri.add_house(HouseInfo('Farm', 'Road1', None))
+    self.ri.add_house(HouseInfo(1, 'Road5', None))
+    self.assertEqual(self.stops(), [(1, 'Road1'), (5, 'Road1'), ('Farm', 'Road1'),
+                                    ('Mill', 'Road2'), (4, 'Road2'), (2, 'Road3'), (1, 'Road5')])
+    self.assertEqual(self.ri.unordered(), [])
+
+  def test_05_errors(self):
+    with self.assertRaises(ValueError) as e:
+      self.ri.add_house(HouseInfo(7, 'Road4', None), OrderInfo(7, 'Road1'))
+    self.assertEqual(e.exception.args[0], "House '7' in road 'Road1' not present in order")
+    with self.assertRaises(ValueError) as e:
+      self.ri.add_house(HouseInfo(7, 'Road4', None), 'Road1')
+    self.assertEqual(e.exception.args[0], 'Must pass an instance of OrderInfo as the order')
+    self.ri.rem_house(HouseInfo(2, 'Road3', None))
+    with self.assertRaises(ValueError) as e:
+      self.ri.add_house(HouseInfo(2, 'Road3', None), OrderInfo(1, 'Road1'))
+    self.assertEqual(e.exception.args[0], 'House is already present in order')
+    self.assertEqual(len(self.ri._houses), 3)
+    with self.assertRaises(ValueError) as e:
+      RoundInfo(1, 'Round1').add_house(HouseInfo(1, 'Road1', None), OrderInfo(1, 'Road1'))
+    self.assertEqual(e.exception.args[0], "House '1' in road 'Road1' not present in order")
+
+  def test_06_remove(self):
+    self.ri.rem_house(HouseInfo(5, 'Road1', None), order=True)
+    self.ri.rem_house(HouseInfo('Mill', 'Road2', None))
+    self.assertEqual(self.stops(), [(1, 'Road1'), ('Mill', 'Road2'), (2, 'Road3')])
+    self.assertEqual(self.ri.orphans(), [OrderInfo('Mill', 'Road2')])
+
+  def test_07_no_order(self):
+    ri = RoundInfo(1, 'Round1')
+    ri.add_house(HouseInfo(1, 'Road1', None))
+    self.assertIsNone(ri._order)
+
+  def test_08_batch(self):
+    rand = Random(1)
+    houses = [HouseInfo(num, 'Road{}'.format(num % 7), None) for num in range(1, 401)]
+    ri = RoundInfo(1, 'Round1', houses[:100], [OrderInfo(house._house, house._road)
+                                                for house in houses[:100]])
+    expected = [(house._house, house._road) for house in houses[:100]]
+    for house in houses[100:]:
+      anchor = rand.choice(expected)
+      before = rand.random() < 0.5
+      ri.add_house(house, OrderInfo(*anchor), before)
+      expected.insert(expected.index(anchor) + (0 if before else 1), (house._house, house._road))
+      if rand.random() < 0.2:
+        gone = rand.choice(expected)
+        ri.rem_house(HouseInfo(gone[0], gone[1], None), order=True)
+        expected.remove(gone)
+    self.assertGreater(len(ri._blocks.blocks), 1)
+    self.assertEqual([(stop._house, stop._road) for stop in ri._order], expected)
+    self.assertEqual([(house._house, house._road) for house in ri.route_iter()], expected)
+
+  def test_09_pickle(self):
+    self.ri.add_house(HouseInfo(3, 'Road1', None))
+    ri = pickle.loads(pickle.dumps(self.ri))
+    self.assertEqual([(stop._house, stop._road) for stop in ri._order], self.stops())
+    ri.add_house(HouseInfo(4, 'Road1', None))
+    self.assertEqual(len(ri._order), 6)
+
+
+class TestRoundInfo_Totals(unittest.TestCase):
+  def setUp(self):
+    self.h1 = HouseInfo(1, 'Road1', [PaperInfo('Sun', '67', num_copies=2), PaperInfo('Mail', '1')])
+    self.h2 = HouseInfo(2, 'Road1', PaperInfo('Sun', '6'))
+    self.ri = RoundInfo(1, 'Round1', [self.h1, self.h2])
+
+  def no_recount(self, totals):
+    def fail():
+      self.fail('Totals were counted again')
+    totals._recount = fail
+
+  def test_01_totals(self):
+    totals = self.ri.totals()
+    self.assertIs(self.ri.totals(), totals)
+    self.assertEqual(totals['Sun'], (0, 0, 0, 0, 0, 3, 2))
+    self.assertEqual(totals['Mail'], (1, 0, 0, 0, 0, 0, 0))
+    self.assertEqual(sorted(totals), ['Mail', 'Sun'])
+    self.assertEqual(totals.day('6'), {'Sun': 3})
+    self.assertNotIn('Times', totals)
+
+  def test_02_add_rem_house(self):
+    totals = self.ri.totals()
+    self.no_recount(totals)
+    self.ri.add_house(HouseInfo(3, 'Road1', [PaperInfo('Times', '12'), PaperInfo('Sun', '7')]))
+    self.assertEqual(totals['Sun'], (0, 0, 0, 0, 0, 3, 3))
+    self.assertEqual(totals['Times'], (1, 1, 0, 0, 0, 0, 0))
+    self.ri.rem_house(HouseInfo(1, 'Road1', None))
+    self.assertEqual(totals['Sun'], (0, 0, 0, 0, 0, 1, 1))
+    self.assertNotIn('Mail', totals)
+    self.assertEqual(self.h1._totals, ())
+    totals.verify()
+
+  def test_03_days(self):
+    totals = self.ri.totals()
+    self.no_recount(totals)
+    self.h2.add_days('Sun', '17')
+    self.h1.remove_days('Sun', '6')
+    self.assertEqual(totals['Sun'], (1, 0, 0, 0, 0, 1, 3))
+    totals.verify()
+
+  def test_04_direct_change(self):
+    totals = self.ri.totals()
+    self.ri._houses.append(HouseInfo(3, 'Road1', PaperInfo('Sun', '1')))
+    self.assertEqual(totals['Sun'], (1, 0, 0, 0, 0, 3, 2))
+    removed = self.ri._houses.pop(0)
+    self.assertEqual(totals['Sun'], (1, 0, 0, 0, 0, 1, 0))
+    removed.add_days('Sun', '1')
+    self.assertEqual(totals['Sun'], (1, 0, 0, 0, 0, 1, 0))
+
+  def test_05_shared_house(self):
+    ri2 = RoundInfo(2, 'Round2', [self.h2])
+    totals1, totals2 = self.ri.totals(), ri2.totals()
+    self.h2.add_days('Sun', '5')
+    self.assertEqual(totals1['Sun'][4], 1)
+    self.assertEqual(totals2['Sun'], (0, 0, 0, 0, 1, 1, 0))
+
+  def test_06_debug(self):
+    totals = self.ri.totals()
+    totals.debug = True
+    totals._counts['Sun'][0] += 1
+    with self.assertRaises(RuntimeError) as e:
+      self.h2.add_days('Sun', '5')
+    self.assertEqual(e.exception.args[0], "Title totals of round 'Round1' differ from a full count")
+
+  def test_07_copy(self):
+    self.ri.totals()
+    self.assertEqual(copy(self.h1)._totals, ())
+    ri = pickle.loads(pickle.dumps(self.ri))
+    self.assertIsNone(ri._totals)
+    self.assertEqual(ri._houses[0]._totals, ())
+    self.assertEqual(ri.totals()['Sun'], (0, 0, 0, 0, 0, 3, 2))
+
+  def test_08_released(self):
+    for num in range(3):
+      RoundInfo(num + 2, 'Round{}'.format(num + 2), [self.h1]).totals()['Sun']
+    depot_totals([RoundInfo(5, 'Round5', [self.h1])])
+    gc.collect()
+    totals = self.ri.totals()
+    self.assertEqual(self.h1._watchers(), [totals])
+    self.assertEqual(len(self.h1._totals), 1)
+    self.h1.add_days('Mail', '2')
+    self.assertEqual(totals['Mail'], (1, 1, 0, 0, 0, 0, 0))
+
+  def test_09_no_days(self):
+    h3, h4 = HouseInfo(3, 'Road1', PaperInfo('Times', '7')), HouseInfo(4, 'Road1', PaperInfo('Times', '7'))
+    self.ri.add_house(h3)
+    self.ri.add_house(h4)
+    totals = self.ri.totals()
+    totals.debug = True
+    h3.remove_days('Times', '7')
+    self.assertEqual(totals['Times'], (0, 0, 0, 0, 0, 0, 1))
+    self.ri.rem_house(h4)
+    self.assertNotIn('Times', totals)
+    totals.verify()
+
+
+def _fingerprint_round():
+  return RoundInfo(1, 'Round1', [HouseInfo(1, 'Road1', PaperInfo('Sun', '123456'), use_box='6'),
+                                 HouseInfo('Mill', 'Road2', PaperInfo('Mail', '7', 2))],
+                   [OrderInfo('Mill', 'Road2'), OrderInfo(1, 'Road1')])
+
+class TestRoundInfo_Fingerprint(unittest.TestCase):
+  def test_01_same(self):
+    ri1, ri2 = _fingerprint_round(), _fingerprint_round()
+    self.assertEqual(ri1.fingerprint(), ri2.fingerprint())
+    self.assertTrue(ri1 == ri2)
+
+  def test_02_stable(self):
+    code = ('from test.parser.test_roundinfo import _fingerprint_round;'
+            'print(_fingerprint_round().fingerprint())')
+    for seed in ('1', '2'):
+      out = subprocess.run([sys.executable, '-c', code], env=dict(os.environ, PYTHONHASHSEED=seed),
+                           check=True, capture_output=True, text=True).stdout.strip()
+      self.assertEqual(out, _fingerprint_round().fingerprint())
+
+  def test_03_content(self):
+    ri1, ri2 = _fingerprint_round(), _fingerprint_round()
+    ri2._houses[0].add_days('Sun', '7')
+    self.assertNotEqual(ri1.fingerprint(), ri2.fingerprint())
+    # The titles of a house are not compared by __eq__
+    self.assertTrue(ri1 == ri2)
+
+  def test_04_invalidate(self):
+    ri1, ri2 = _fingerprint_round(), _fingerprint_round()
+    before = ri2.fingerprint()
+    ri2.add_house(HouseInfo(3, 'Road1', None))
+    self.assertNotEqual(ri2.fingerprint(), before)
+    self.assertFalse(ri1 == ri2)
+    ri2.rem_house(HouseInfo(3, 'Road1', None), order=True)
+    self.assertEqual(ri2.fingerprint(), before)
+    ri2._order.reverse()
+    self.assertNotEqual(ri2.fingerprint(), before)
+    self.assertFalse(ri1 == ri2)
+
+  def test_05_cached(self):
+    ri = _fingerprint_round()
+    digest = ri._digest()
+    self.assertIs(ri._digest(), digest)
+    self.assertIs(ri._houses._digest(), ri._houses._digest())
+
+  def test_06_order_eq(self):
+    self.assertEqual(OrderInfo(1, 'Road1'), OrderInfo(1, 'Road1'))
+    self.assertNotEqual(OrderInfo(1, 'Road1'), OrderInfo(1, 'Road2'))
+    self.assertEqual(hash(OrderInfo(1, 'Road1')), hash(OrderInfo(1, 'Road1')))
+    self.assertTrue(OrderList([OrderInfo(1, 'Road1')]) == OrderList([OrderInfo(1, 'Road1')]))
+
+  def test_07_eq_digests(self):
+    ri1, ri2 = _fingerprint_round(), _fingerprint_round()
+    self.assertIsNone(ri1._cached_digest(eq=True))
+    ri1.fingerprint(), ri2.fingerprint()
+    self.assertIsNotNone(ri1._cached_digest(eq=True))
+    self.assertTrue(ri1 == ri2)
+    ri2.add_house(HouseInfo(3, 'Road1', None))
+    self.assertIsNone(ri2._cached_digest(eq=True))
+    self.assertFalse(ri1 == ri2)
+    ri2.fingerprint()
+    self.assertFalse(ri1 == ri2)
+
+  def test_08_list_fingerprint(self):
+    pl1, pl2 = PaperList([PaperInfo('Sun', '6')]), PaperList([PaperInfo('Sun', '6')])
+    self.assertEqual(pl1.fingerprint(), pl2.fingerprint())
+    pl2.append(PaperInfo('Mail'))
+    self.assertNotEqual(pl1.fingerprint(), pl2.fingerprint())
+    with self.assertRaises(TypeError):
+      _LimitList(int, 'int', [1]).fingerprint()
@@ -0,0 +1,102 @@
+'''
+This is the test suite for the expansion of title frequencies into delivery dates.
+'''
+
+import subprocess
+import sys
+import unittest
+from datetime import date
+from pydelivery.parser.parseround import RoundInfo, HouseInfo, PaperInfo, MagazineInfo
+
+try:
+  import numpy as np
+  from pydelivery.parser.schedule import delivery_dates, dated_demand, _expand_cached
+except ImportError:
+  np = None
+
+def _dates(array):
+  return [str(day) for day in array]
+
+@unittest.skipIf(np is None, 'numpy is not available')
+class Test_DeliveryDates(unittest.TestCase):
+  def test_01_paper(self):
+    dates = delivery_dates(PaperInfo('Paper', '67'), '2024-01-01', '2024-01-15')
+    self.assertEqual(_dates(dates), ['2024-01-06', '2024-01-07', '2024-01-13', '2024-01-14'])
+
+  def test_02_weekly(self):
+    dates = delivery_dates(MagazineInfo('Mag', '4'), date(2024, 1, 1), date(2024, 1, 22))
+    self.assertEqual(_dates(dates), ['2024-01-04', '2024-01-11', '2024-01-18'])
+
+  def test_03_fortnightly(self):
+    mi = MagazineInfo('Mag', '4', '2W')
+    self.assertEqual(_dates(delivery_dates(mi, '2024-01-01', '2024-02-01')),
+                     ['2024-01-04', '2024-01-18'])
+    self.assertEqual(_dates(delivery_dates(mi, '2024-01-01', '2024-02-01', anchor='2024-01-11')),
+                     ['2024-01-11', '2024-01-25'])
+    # An anchor a whole cycle away selects the same dates
+    self.assertEqual(_dates(delivery_dates(mi, '2024-01-01', '2024-02-01', anchor='2023-12-28')),
+                     ['2024-01-11', '2024-01-25'])
+
+  def test_04_n_weekly(self):
+    mi = MagazineInfo('Mag', '1', '4W')
+    self.assertEqual(_dates(delivery_dates(mi, '2024-01-01', '2024-03-01')),
+                     ['2024-01-01', '2024-01-29', '2024-02-26'])
+
+  def test_05_monthly_anchor(self):
+    mi = MagazineInfo('Mag', '4', 'M')
+    dates = delivery_dates(mi, '2024-01-01', '2024-04-01', anchor='2024-01-11')
+    self.assertEqual(_dates(dates), ['2024-01-11', '2024-02-08', '2024-03-14'])
+
+  def test_06_monthly_nth(self):
+    mi = MagazineInfo('Mag', '4', 'M5')
+    self.assertEqual(_dates(delivery_dates(mi, '2024-01-01', '2024-04-01')), ['2024-02-29'])
+    mi = MagazineInfo('Mag', '1', 'M1')
+    self.assertEqual(_dates(delivery_dates(mi, '2024-01-01', '2024-04-01')),
+                     ['2024-01-01', '2024-02-05', '2024-03-04'])
+
+  def test_07_monthly_last(self):
+    mi = MagazineInfo('Mag', '14', 'ML')
+    self.assertEqual(_dates(delivery_dates(mi, '2024-01-01', '2024-03-01')),
+                     ['2024-01-25', '2024-01-29', '2024-02-26', '2024-02-29'])
+
+  def test_08_empty_range(self):
+    self.assertEqual(len(delivery_dates(PaperInfo('Paper'), '2024-01-01', '2024-01-01')), 0)
+    with self.assertRaises(ValueError) as e:
+      delivery_dates(PaperInfo('Paper'), '2024-01-02', '2024-01-01')
+    self.assertEqual(e.exception.args[0], 'The end date must not be before the start date')
+
+  def test_09_unknown(self):
+    for frequency in ('X', '0W', 'M6', 'W2'):
+      with self.subTest(frequency=frequency):
+        with self.assertRaises(ValueError) as e:
+          delivery_dates(MagazineInfo('Mag', '4', frequency), '2024-01-01', '2024-02-01')
+        self.assertEqual(e.exception.args[0], "Unknown delivery frequency '{}'".format(frequency))
+
+  def test_10_cached(self):
+    _expand_cached.cache_clear()
+    dates1 = delivery_dates(MagazineInfo('Mag1', '4', '2W'), '2024-01-01', '2024-04-01', '2024-01-04')
+    dates2 = delivery_dates(MagazineInfo('Mag2', '4', '2W'), '2024-01-01', '2024-04-01', '2024-03-14')
+    self.assertIs(dates1, dates2)
+    self.assertFalse(dates1.flags.writeable)
+    self.assertEqual(_expand_cached.cache_info().misses, 1)
+
+
+@unittest.skipIf(np is None, 'numpy is not available')
+class Test_DatedDemand(unittest.TestCase):
+  def test_01_demand(self):
+    ri = RoundInfo(1, 'Round1', [
+      HouseInfo(1, 'Road1', [PaperInfo('Sun', '67', num_copies=2), MagazineInfo('Mag', '4', '2W')]),
+      HouseInfo(2, 'Road1', [PaperInfo('Sun', '6'), MagazineInfo('Mag', '4', '2W')])])
+    demand = dated_demand(ri, '2024-01-01', '2024-01-15', anchors={'Mag': '2024-01-11'})
+    self.assertEqual(demand.titles, ('Sun', 'Mag'))
+    self.assertEqual(demand.counts.shape, (2, 14))
+    self.assertEqual(str(demand.dates[0]), '2024-01-01')
+    self.assertEqual(demand['Sun'].tolist(), [0, 0, 0, 0, 0, 3, 2] * 2)
+    self.assertEqual(demand['Mag'].tolist(), [0] * 10 + [2] + [0] * 3)
+    self.assertEqual(demand.daily_totals().sum(), 12)
+
+class Test_LazyNumpy(unittest.TestCase):
+  def test_01_import(self):
+    code = 'import sys, pydelivery.parser; print("numpy" in sys.modules)'
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    self.assertEqual(result.stdout.strip(), 'False')
@@ -159,3 +159,90 @@ class Test_TitleMap_Bad(unittest.TestCase):
     with self.assertRaises(TypeError) as e:
       Mock_TitleMap(mag_order='anywhere')
     self.assertEqual(e.exception.args[0], "Invalid magazine order given")
+
+
+class Test_TitleMap_Namespace(unittest.TestCase):
+  def tearDown(self):
+    for name in ('depot1', 'depot2', 'threads', 'batch'):
+      TitleMap.drop_namespace(name)
+
+  def test_01_isolated(self):
+    tm1 = TitleMap(namespace='depot1')
+    tm2 = TitleMap(namespace='depot2')
+    tm1.add('Sun', 1)
+    tm2.add('Mail', 2)
+    self.assertIn('Sun', tm1)
+    self.assertNotIn('Sun', tm2)
+    self.assertEqual(tm2.index('Mail'), 0)
+    self.assertIn('depot1', TitleMap.namespaces())
+
+  def test_02_shared(self):
+    tm1 = TitleMap(namespace='depot1')
+    tm2 = TitleMap(namespace='depot1')
+    tm1.add('Sun', 1)
+    self.assertEqual(tm2['Sun'], 1)
+
+  def test_03_snapshot(self):
+    tm = TitleMap(namespace='depot1')
+    tm.add('Sun', 1)
+    tm.add('Mail', 2)
+    snapshot = tm._map
+    tm.remove('Sun')
+    tm.add('Star', 3)
+    self.assertEqual(list(snapshot), ['Sun', 'Mail'])
+    self.assertEqual(list(tm._map), ['Mail', 'Star'])
+    self.assertEqual(tm.index('Star'), 1)
+
+  def test_04_failed_write(self):
+    tm = TitleMap(namespace='depot1')
+    tm.add('Sun', 1)
+    snapshot = tm._map
+    with self.assertRaises(ValueError):
+      tm.add('Sun', 2)
+    self.assertIs(tm._map, snapshot)
+
+  def test_05_threads(self):
+    from concurrent.futures import ThreadPoolExecutor
+    def worker(num):
+      tm = TitleMap(namespace='threads')
+      for sub in range(50):
+        name = 'Title{}-{}'.format(num, sub)
+        tm.add(name, sub)
+        tm.index(name)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+      list(pool.map(worker, range(16)))
+    tm = TitleMap(namespace='threads')
+    self.assertEqual(len(list(tm)), 16 * 50)
+    self.assertEqual(sorted(num for num, name in tm.numeric_iter()), list(range(16 * 50)))
+
+  def test_06_batch(self):
+    from concurrent.futures import ThreadPoolExecutor
+    tm = TitleMap(namespace='batch')
+    tm.add('Sun', 1)
+    snapshot = tm._map
+    with ThreadPoolExecutor(max_workers=1) as pool:
+      with tm.batch() as batch:
+        self.assertIs(batch, tm)
+        tm.add('Mail', 2)
+        with TitleMap(namespace='batch').batch():
+          tm.add('Star', 3)
+        tm.remove('Sun')
+        self.assertEqual(tm.index('Star'), 1)
+        self.assertIs(pool.submit(lambda: TitleMap(namespace='batch')._map).result(), snapshot)
+      self.assertEqual(pool.submit(lambda: list(TitleMap(namespace='batch')._map)).result(),
+                       ['Mail', 'Star'])
+    self.assertEqual(list(snapshot), ['Sun'])
+    self.assertEqual(tm.index('Star'), 1)
+
+  def test_07_failed_batch(self):
+    tm = TitleMap(namespace='batch')
+    tm.add('Sun', 1)
+    snapshot = tm._map
+    with self.assertRaises(ValueError):
+      with tm.batch():
+        tm.add('Mail', 2)
+        tm.add('Sun', 2)
+    self.assertIs(tm._map, snapshot)
+    self.assertNotIn('Mail', tm)
+    tm.add('Mail', 2)
+    self.assertEqual(tm.index('Mail'), 1)